@@ -1,10 +1,13 @@
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+import httpx
 import os
 import json
 import re
 import random
 import asyncio
-from datetime import datetime
+import bisect
+import time
+from datetime import datetime, timezone
 from functools import lru_cache
 from typing import Optional, Dict, List, Any
 from utils.constant import (
@@ -20,6 +23,8 @@ from utils.constant import (
 )
 import logging
 from schemas.budget_schemas import RevenueStreamInitial
+from utils.bounded_cache import BoundedCache, fingerprint
+from utils.circuit_breaker import CircuitBreaker
 from services.feedback_tone_resolver import (
     assess_answer_substance,
     compute_effective_tone_intensities,
@@ -29,11 +34,17 @@ logger = logging.getLogger(__name__)
 
 # Support, Draft, Scrapping (and Draft Answer): keep assistant blocks scannable; enforced via prompt + truncate_to_word_limit.
 COMMAND_ASSIST_MAX_WORDS = 150
+# Output cap for the prose command replies: ~2 tokens per word leaves room for markdown
+# and bullets, so the model finishes its sentence before truncate_to_word_limit trims it.
+COMMAND_ASSIST_MAX_TOKENS = COMMAND_ASSIST_MAX_WORDS * 2
 
 # Support is the only command that surfaces external knowledge to the user. We
 # require the model to enumerate sources alongside the narrative so the
 # founder can audit every claim — never just "trust me" guidance.
 SUPPORT_MAX_SOURCES = 6
+# Support replies are JSON: the escaped body plus up to SUPPORT_MAX_SOURCES source
+# objects. A reply cut at the token limit fails to parse, so keep the full budget.
+SUPPORT_MAX_TOKENS = 1100
 
 
 def format_support_sources_section(sources: list[dict]) -> str:
@@ -193,12 +204,34 @@ def normalize_support_sources(raw: object) -> list[dict]:
 
     return cleaned
 
-client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# One pooled HTTP/2 client for every handler in this module: concurrent Draft, Support
+# and Scrapping calls multiplex over a few warm connections instead of opening new
+# sockets. Per-request timeouts still come from the SDK defaults.
+client = AsyncOpenAI(
+    api_key=os.getenv("OPENAI_API_KEY"),
+    http_client=DefaultAsyncHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    ),
+)
 # pkpalstan
 # Web search throttling
 web_search_count = 0
 web_search_reset_time = datetime.now()
 
+# Year used in research queries; refreshed at most once per UTC day.
+_CACHED_YEAR = None
+_CACHED_YEAR_DAY = None
+
+
+def _current_year() -> int:
+    global _CACHED_YEAR, _CACHED_YEAR_DAY
+    today = int(time.time() // 86400)
+    if today != _CACHED_YEAR_DAY:
+        _CACHED_YEAR = datetime.now(timezone.utc).year
+        _CACHED_YEAR_DAY = today
+    return _CACHED_YEAR
+
 # ... existing code ...
 
 async def generate_initial_revenue_streams(business_type: str) -> List[RevenueStreamInitial]:
@@ -362,6 +395,43 @@ MOTIVATIONAL_QUOTES = [
 ]
 
 
+# Question-tag patterns used on every reply; compiled once here instead of per call.
+_Q_TAG_RE = re.compile(r"\[\[Q:([A-Za-z_]+\.\d+)\]\]", re.IGNORECASE)
+_Q_ANY_RE = re.compile(r"\[\[Q:[A-Z_]+\.\d+\]\]")
+_BP_TAG_RE = re.compile(r"\[\[Q:BUSINESS_PLAN\.(\d+)\]\]", re.IGNORECASE)
+_BP_TAG_ANY_RE = re.compile(r"\[\[Q:BUSINESS_PLAN\.\d+\]\]", re.IGNORECASE)
+_BP_TAG_NAME_RE = re.compile(r"\[\[Q:(BUSINESS_PLAN\.\d+)\]\]", re.IGNORECASE)
+_MISSING_QUESTIONS_RE = re.compile(r"missing questions:\s*([\d,\s]+)")
+_BLANK_LINE_RUN_RE = re.compile(r"\n{3,}")
+
+# Per-question cleanup of sections the model adds despite the prompt (fake competitors,
+# fake trends, market data on the insurance question, ...). Applied in order.
+_TAG_CLEANUP_PATTERNS = {
+    "BUSINESS_PLAN.11": (
+        (re.compile(r"\n+List top 5 and describe their strengths and weaknesses\.?\s*\n+"), "\n"),
+        (re.compile(r"\n+Look for both small and large businesses[^\n]*\.\s*\n+"), "\n"),
+        (re.compile(r"\n*Competitor [A-E]:[^\n]*\n*"), "\n"),
+    ),
+    "BUSINESS_PLAN.12": (
+        (re.compile(r"\n*Trend \d+:[^\n]*\n*"), "\n"),
+    ),
+    "BUSINESS_PLAN.26": (
+        (re.compile(r"\*\*Competitive [Ll]andscape\*\*"), "**Potential Service Providers**"),
+        (re.compile(r"Competitive [Ll]andscape"), "Potential Service Providers"),
+        (re.compile(r"\*\*Competitors\*\*"), "**Potential Service Providers**"),
+        (re.compile(r"\*\*Competitive [Aa]nalysis\*\*"), "**Potential Service Providers**"),
+    ),
+    "BUSINESS_PLAN.27": (
+        (re.compile(r"\n+\*\*[Mm]arket [Dd]ata\*\*[^\n]*\n.*?(?=\n\n\*\*|\n##\s|\n\d+\.\s|\Z)", re.DOTALL), "\n"),
+        (re.compile(r"\n+##\s*[Mm]arket [Dd]ata[^\n]*\n.*?(?=\n\n##|\n\*\*|\n\d+\.\s|\Z)", re.DOTALL), "\n"),
+    ),
+    "BUSINESS_PLAN.35": (
+        (re.compile(r"\n*\*\*Sub-questions covered\*\*:?.*?(?=\n\n|\n\*\*|\Z)", re.DOTALL | re.IGNORECASE), "\n"),
+        (re.compile(r"\n*Sub-questions covered:?.*?(?=\n\n|\n\*\*|\Z)", re.DOTALL | re.IGNORECASE), "\n"),
+    ),
+}
+
+
 def _get_feedback_intensity_guidance(intensity: int) -> str:
     """
     Get guidance text for Angel's critiquing behavior based on intensity (0-10).
@@ -813,7 +883,7 @@ THOUGHT_STARTERS_BY_TAG = {
     ],
 }
 
-from services.business_plan_registry import get_question_objective
+from services.business_plan_registry import SECTION_BOUNDARY_END_NUMBERS, get_question_objective
 
 def get_thought_starter_for_tag(question_tag: str) -> Optional[str]:
     if not question_tag:
@@ -913,6 +983,9 @@ def is_moving_to_next_question(response_text: str) -> bool:
 
 async def should_show_accept_modify_buttons(ai_response: str, user_last_input: str = "", session_data: dict = None) -> dict:
     """Determine if Accept/Modify buttons should be shown"""
+    if "[[ACCEPT_MODIFY_BUTTONS]]" in ai_response:
+        return {"show_buttons": True, "content_length": len(ai_response)}
+
     user_input_lower = user_last_input.lower().strip()
     
     # Check if user explicitly requested Draft, Support, or Scrapping
@@ -952,7 +1025,7 @@ async def should_show_accept_modify_buttons(ai_response: str, user_last_input: s
     has_acknowledgment = any(pattern in ai_response.lower()[:200] for pattern in acknowledgment_patterns)
     
     # Check if AI is asking a new question (has [[Q: tag)
-    has_question_tag = re.search(r'\[\[Q:[A-Z_]+\.\d+\]\]', ai_response) is not None
+    has_question_tag = _Q_ANY_RE.search(ai_response) is not None
     
     # Check if AI explicitly requested Accept/Modify buttons
     has_accept_modify_tag = "[[ACCEPT_MODIFY_BUTTONS]]" in ai_response
@@ -1093,7 +1166,7 @@ AUTO_RESEARCH_BUSINESS_PLAN_TAGS = {
 
 
 def _detect_business_plan_tag_from_reply(reply_content: str) -> str | None:
-    tag_match = re.search(r"\[\[Q:([A-Za-z_]+\.\d+)\]\]", reply_content, re.IGNORECASE)
+    tag_match = _Q_TAG_RE.search(reply_content)
     if not tag_match:
         return None
     raw_tag = tag_match.group(1)
@@ -1209,12 +1282,89 @@ async def _dynamic_bp_reply_with_auto_research(
     }
 
 
+# Research synthesis template per query topic, checked in order (more-specific topics
+# first); the first match wins and unmatched queries fall back to industry trends.
+_RESEARCH_KIND_KEYWORDS = (
+    ("competitors", (
+        "competitor", "competing with", "competitive position",
+        "competitive landscape", "main competitors", "rival companies",
+    )),
+    ("industry_trends", (
+        "industry trend", "trends affecting", "market trends", "trend research",
+        "industry trends",
+    )),
+    ("operational_needs", ("operational needs", "operational launch", "short-term operational")),
+    ("marketing_needs", ("marketing needs", "marketing channel", "short-term marketing")),
+    ("permits_licenses", ("permit", "license", "zoning", "regulatory")),
+    ("insurance", ("insurance", "liability", "property insurance")),
+    ("costs", ("startup cost", "main cost", "expense", "operating cost")),
+    ("scaling", ("scaling", "growth plan", "expansion strategy", "long-term goals")),
+    ("contingency", ("contingency", "risk management", "challenges", "obstacles")),
+)
+_RESEARCH_KIND_RES = tuple(
+    (kind, re.compile("|".join(re.escape(kw) for kw in keywords)))
+    for kind, keywords in _RESEARCH_KIND_KEYWORDS
+)
+
+
+def _infer_research_kind(query_lower: str) -> str:
+    for kind, pattern in _RESEARCH_KIND_RES:
+        if pattern.search(query_lower):
+            return kind
+    return "industry_trends"
+
+
+def _search_query_key(query: str) -> str:
+    """Case- and whitespace-insensitive key for a research query; word order still counts."""
+    return " ".join(query.lower().split())
+
+
+# Research cache layers, innermost first:
+# - _WEB_SEARCH_CACHE (here): per-worker, 1h, every conduct_web_search caller. Keyed on
+#   the normalized query plus research kind and venture context block; retries carrying
+#   validation feedback always go out.
+# - _DRAFT_RESEARCH_CACHE / draft_research_v1: Draft command research, 24h, shared via
+#   Supabase (see _get_draft_research).
+# - _ARTIFACT_RESEARCH_CACHE / artifact_research_v1: the business plan artifact's
+#   market and competitor searches, 7 days, shared via Supabase (see
+#   _get_artifact_research).
+# The outer two only wrap generic (industry / idea / location) queries, which is what
+# makes their longer, cross-session TTLs safe; on an outer miss the call still goes
+# through this layer.
+_WEB_SEARCH_CACHE = BoundedCache(maxsize=256, ttl_seconds=60 * 60)
+
+
 async def conduct_web_search(
     query,
     fast_mode: bool = False,
     research_kind: str | None = None,
     validation_feedback: str = "",
     venture_context_block: str = "",
+):
+    """Cached wrapper around ``_conduct_web_search``; only successful results are kept."""
+    if validation_feedback:
+        return await _conduct_web_search(
+            query, fast_mode, research_kind, validation_feedback, venture_context_block
+        )
+    cache_key = fingerprint(_search_query_key(query), fast_mode, research_kind, venture_context_block)
+    cached = _WEB_SEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        logger.debug("Web search cache hit for: %.50s", query)
+        return cached
+    search_results = await _conduct_web_search(
+        query, fast_mode, research_kind, validation_feedback, venture_context_block
+    )
+    if search_results:
+        _WEB_SEARCH_CACHE.set(cache_key, search_results)
+    return search_results
+
+
+async def _conduct_web_search(
+    query,
+    fast_mode: bool = False,
+    research_kind: str | None = None,
+    validation_feedback: str = "",
+    venture_context_block: str = "",
 ):
     """Generate research-quality content using AI knowledge base
     
@@ -1249,44 +1399,9 @@ Include key points and current information. Keep response brief and actionable."
             if research_kind:
                 numbered_sections = get_research_synthesis_sections(research_kind)
             else:
-                query_lower = query.lower()
-                # Order matters: more-specific topics first.
-                is_competitor = any(kw in query_lower for kw in [
-                    "competitor", "competing with", "competitive position",
-                    "competitive landscape", "main competitors", "rival companies",
-                ])
-                is_industry_trends = any(kw in query_lower for kw in [
-                    "industry trend", "trends affecting", "market trends", "trend research",
-                    "industry trends",
-                ])
-                is_permits_licenses = any(kw in query_lower for kw in ["permit", "license", "zoning", "regulatory"])
-                is_insurance = any(kw in query_lower for kw in ["insurance", "liability", "property insurance"])
-                is_costs = any(kw in query_lower for kw in ["startup cost", "main cost", "expense", "operating cost"])
-                is_scaling = any(kw in query_lower for kw in ["scaling", "growth plan", "expansion strategy", "long-term goals"])
-                is_contingency = any(kw in query_lower for kw in ["contingency", "risk management", "challenges", "obstacles"])
-                is_marketing = any(kw in query_lower for kw in ["marketing needs", "marketing channel", "short-term marketing"])
-                is_operational = any(kw in query_lower for kw in ["operational needs", "operational launch", "short-term operational"])
-
-                if is_competitor:
-                    numbered_sections = get_research_synthesis_sections("competitors")
-                elif is_industry_trends:
-                    numbered_sections = get_research_synthesis_sections("industry_trends")
-                elif is_operational:
-                    numbered_sections = get_research_synthesis_sections("operational_needs")
-                elif is_marketing:
-                    numbered_sections = get_research_synthesis_sections("marketing_needs")
-                elif is_permits_licenses:
-                    numbered_sections = get_research_synthesis_sections("permits_licenses")
-                elif is_insurance:
-                    numbered_sections = get_research_synthesis_sections("insurance")
-                elif is_costs:
-                    numbered_sections = get_research_synthesis_sections("costs")
-                elif is_scaling:
-                    numbered_sections = get_research_synthesis_sections("scaling")
-                elif is_contingency:
-                    numbered_sections = get_research_synthesis_sections("contingency")
-                else:
-                    numbered_sections = get_research_synthesis_sections("industry_trends")
+                numbered_sections = get_research_synthesis_sections(
+                    _infer_research_kind(query.lower())
+                )
 
             correction_block = ""
             if validation_feedback:
@@ -1421,101 +1536,121 @@ def cap_full_command_assist_reply(text: str) -> str:
     return truncate_to_word_limit(str(text).strip(), COMMAND_ASSIST_MAX_WORDS)
 
 def trim_conversation_history(history, max_messages=10):
-    """Trim conversation history to prevent context from growing too large"""
-    if len(history) <= max_messages:
-        return history
-    
-    # Keep the most recent messages
-    return history[-max_messages:]
+    """Trim conversation history to prevent context from growing too large.
+
+    Each message is projected to ``{"role", "content"}`` so extra row fields
+    (phase, created_at, ...) are never serialized into the OpenAI payload.
+    """
+    recent = history if len(history) <= max_messages else history[-max_messages:]
+    return [{"role": m.get("role"), "content": m.get("content") or ""} for m in recent]
+
+
+def _iter_recent_reversed(history, limit):
+    """Yield up to ``limit`` trailing messages, newest first, without copying ``history``."""
+    for i in range(len(history) - 1, max(-1, len(history) - limit - 1), -1):
+        yield history[i]
+
+_WORK_SITUATION_OPTIONS = "• Full-time employed\n• Part-time\n• Student\n• Unemployed\n• Self-employed/freelancer\n• Other"
+_QUESTION_THEN_BULLETS_RES = (
+    re.compile(r'([^?]+\?)\s*\n\n(• [^\n]+(?:\n• [^\n]+)*)'),
+    re.compile(r'([^?]+\?)\s*\n(• [^\n]+(?:\n• [^\n]+)*)'),
+)
+_QUESTION_THEN_CIRCLES_RES = (
+    re.compile(r'([^?]+\?)\s*\n\n(○ [^\n]+(?:\n○ [^\n]+)*)'),
+    re.compile(r'([^?]+\?)\s*\n(○ [^\n]+(?:\n○ [^\n]+)*)'),
+)
+_INLINE_WORK_OPTIONS_RE = re.compile(r'([^?]+\?)\s+(Full-time employed\s+Part-time\s+Student\s+Unemployed\s+Self-employed/freelancer\s+Other)')
+_INLINE_YES_NO_RE = re.compile(r'([^?]+\?)\s+(Yes\s*/\s*No)')
+_INLINE_CHOICES_RE = re.compile(r'([^?]+\?)\s+([A-Za-z\s]+(?:employed|time|Student|Unemployed|freelancer|Other)[^?]*)')
+_CIRCLE_BULLET_RE = re.compile(r'○\s*')
+_DOUBLE_BULLET_RE = re.compile(r'•\s*•\s*')
+
 
 def format_response_structure(reply):
     """Format AI responses to use proper structured format instead of paragraph form"""
     
     formatted_reply = reply
+    # Lowercased once; the option removals below never touch the phrases checked on it.
+    lowered = formatted_reply.lower()
     
     # Check if this should be a dropdown question (Yes/No or multiple choice)
-    is_yes_no_question = ("yes" in formatted_reply.lower() and "no" in formatted_reply.lower() and 
-                         any(phrase in formatted_reply.lower() for phrase in ["have you", "do you", "are you", "would you"]))
+    is_yes_no_question = ("yes" in lowered and "no" in lowered and 
+                         any(phrase in lowered for phrase in ["have you", "do you", "are you", "would you"]))
     
-    is_work_situation_question = "work situation" in formatted_reply.lower()
+    is_work_situation_question = "work situation" in lowered
     
     is_multiple_choice_question = ("•" in formatted_reply or "○" in formatted_reply or 
-                                  any(option in formatted_reply.lower() for option in ["full-time employed", "part-time", "student", "unemployed"]))
+                                  any(option in lowered for option in ["full-time employed", "part-time", "student", "unemployed"]))
     
     # For dropdown questions, remove the options from the message
     if is_yes_no_question:
         # Remove Yes/No options
-        formatted_reply = re.sub(r'\n\n• Yes\n• No', '', formatted_reply)
-        formatted_reply = re.sub(r'\n• Yes\n• No', '', formatted_reply)
-        formatted_reply = re.sub(r'\n\nYes / No', '', formatted_reply)
-        formatted_reply = re.sub(r'\nYes / No', '', formatted_reply)
+        formatted_reply = formatted_reply.replace('\n\n• Yes\n• No', '')
+        formatted_reply = formatted_reply.replace('\n• Yes\n• No', '')
+        formatted_reply = formatted_reply.replace('\n\nYes / No', '')
+        formatted_reply = formatted_reply.replace('\nYes / No', '')
     
     elif is_work_situation_question:
-        # Remove work situation options
-        work_options_pattern = r'\n\n• Full-time employed\n• Part-time\n• Student\n• Unemployed\n• Self-employed/freelancer\n• Other'
-        formatted_reply = re.sub(work_options_pattern, '', formatted_reply)
-        
-        # Also handle single-line format
-        work_options_single_pattern = r'\n• Full-time employed\n• Part-time\n• Student\n• Unemployed\n• Self-employed/freelancer\n• Other'
-        formatted_reply = re.sub(work_options_single_pattern, '', formatted_reply)
+        # Remove work situation options (blank-line and single-line formats)
+        formatted_reply = formatted_reply.replace('\n\n' + _WORK_SITUATION_OPTIONS, '')
+        formatted_reply = formatted_reply.replace('\n' + _WORK_SITUATION_OPTIONS, '')
     
-    elif is_multiple_choice_question and not is_yes_no_question:
+    elif is_multiple_choice_question and not is_yes_no_question and "?" in formatted_reply:
         # Remove bullet point options for other multiple choice questions
-        # Pattern: "Question?\n\n• Option1\n• Option2\n• Option3"
-        multi_choice_pattern = r'([^?]+\?)\s*\n\n(• [^\n]+(?:\n• [^\n]+)*)'
-        formatted_reply = re.sub(multi_choice_pattern, r'\1', formatted_reply)
-        
-        # Also handle single-line format
-        multi_choice_single_pattern = r'([^?]+\?)\s*\n(• [^\n]+(?:\n• [^\n]+)*)'
-        formatted_reply = re.sub(multi_choice_single_pattern, r'\1', formatted_reply)
+        # Pattern: "Question?\n\n• Option1\n• Option2\n• Option3", then the single-line format
+        if "•" in formatted_reply:
+            for pattern in _QUESTION_THEN_BULLETS_RES:
+                formatted_reply = pattern.sub(r'\1', formatted_reply)
         
         # Handle circle bullets (○) - remove these options too
-        circle_choice_pattern = r'([^?]+\?)\s*\n\n(○ [^\n]+(?:\n○ [^\n]+)*)'
-        formatted_reply = re.sub(circle_choice_pattern, r'\1', formatted_reply)
-        
-        # Also handle single-line format for circles
-        circle_choice_single_pattern = r'([^?]+\?)\s*\n(○ [^\n]+(?:\n○ [^\n]+)*)'
-        formatted_reply = re.sub(circle_choice_single_pattern, r'\1', formatted_reply)
+        if "○" in formatted_reply:
+            for pattern in _QUESTION_THEN_CIRCLES_RES:
+                formatted_reply = pattern.sub(r'\1', formatted_reply)
+    
+    has_question = "?" in formatted_reply
     
     # Specific formatting for work situation question (if not already handled)
-    if "work situation" in formatted_reply.lower() and "?" in formatted_reply and not is_work_situation_question:
+    if has_question and "work situation" in lowered and not is_work_situation_question:
         # Pattern: "What's your current work situation? Full-time employed Part-time Student Unemployed Self-employed/freelancer Other"
-        work_pattern = r'([^?]+\?)\s+(Full-time employed\s+Part-time\s+Student\s+Unemployed\s+Self-employed/freelancer\s+Other)'
-        formatted_reply = re.sub(work_pattern, 
-            r'\1\n\n• Full-time employed\n• Part-time\n• Student\n• Unemployed\n• Self-employed/freelancer\n• Other', 
-            formatted_reply)
-    
-    # Specific formatting for business before question
-    if "business before" in formatted_reply.lower() and "?" in formatted_reply:
-        # Pattern: "Have you started a business before? Yes / No"
-        business_pattern = r'([^?]+\?)\s+(Yes\s*/\s*No)'
-        formatted_reply = re.sub(business_pattern, r'\1\n\n• Yes\n• No', formatted_reply)
+        formatted_reply = _INLINE_WORK_OPTIONS_RE.sub(r'\1\n\n' + _WORK_SITUATION_OPTIONS, formatted_reply)
     
-    # General pattern for Yes/No questions (if not already handled)
-    if not is_yes_no_question:
-        # Pattern: "Question? Yes / No" or "Question? Yes/No"
-        yes_no_pattern = r'([^?]+\?)\s+(Yes\s*/\s*No)'
-        formatted_reply = re.sub(yes_no_pattern, r'\1\n\n• Yes\n• No', formatted_reply)
+    # Yes/No options written inline: "Have you started a business before? Yes / No".
+    # The "business before" question and every other non-dropdown question get the same fix.
+    if has_question and "Yes" in formatted_reply and ("business before" in lowered or not is_yes_no_question):
+        formatted_reply = _INLINE_YES_NO_RE.sub(r'\1\n\n• Yes\n• No', formatted_reply)
     
     # General pattern for multiple choice questions (if not already handled)
-    if not is_multiple_choice_question:
+    if has_question and not is_multiple_choice_question:
         # Pattern: "Question? Option1 Option2 Option3 Option4"
-        multi_choice_pattern = r'([^?]+\?)\s+([A-Za-z\s]+(?:employed|time|Student|Unemployed|freelancer|Other)[^?]*)'
-        formatted_reply = re.sub(multi_choice_pattern, 
+        formatted_reply = _INLINE_CHOICES_RE.sub(
             lambda m: f"{m.group(1)}\n\n• {m.group(2).replace(' ', ' • ')}", 
             formatted_reply)
     
     # Convert circle bullets to regular bullets for consistency
-    formatted_reply = re.sub(r'○\s*', '• ', formatted_reply)
+    if "○" in formatted_reply:
+        formatted_reply = _CIRCLE_BULLET_RE.sub('• ', formatted_reply)
     
     # Clean up any double bullet points
-    formatted_reply = re.sub(r'•\s*•\s*', '• ', formatted_reply)
+    if "•" in formatted_reply:
+        formatted_reply = _DOUBLE_BULLET_RE.sub('• ', formatted_reply)
     
     # Ensure proper spacing
-    formatted_reply = re.sub(r'\n{3,}', '\n\n', formatted_reply)
+    formatted_reply = _BLANK_LINE_RUN_RE.sub('\n\n', formatted_reply)
     
     return formatted_reply
 
+_COMBINED_QUESTION_PATTERNS = (
+    # Pattern: "Question1? Question2?"
+    (re.compile(r'([^?]+\?)\s+([A-Z][^?]+\?)'), r'\1\n\n\2'),
+    # Pattern: "Question1. Question2?"
+    (re.compile(r'([^?]+\.)\s+([A-Z][^?]+\?)'), r'\1\n\n\2'),
+)
+_BP_TAG_TWO_DIGIT_RE = re.compile(r'\[\[Q:BUSINESS_PLAN\.\d{2}\]\]')
+_EMBEDDED_QUESTION_RE = re.compile(
+    r'^(.{40,}[.!,;])\s+((?:What|How|Where|Who|When|Why|Which|Do|Does|Are|Is|Have|Has|Can|Could|Would|Will|Tell|Describe|Explain|Share)[^?]{10,}\?)(.*)$'
+)
+
+
 def ensure_question_separation(reply, session_data=None):
     """Ensure questions are properly separated and not combined.
     
@@ -1524,22 +1659,16 @@ def ensure_question_separation(reply, session_data=None):
     """
     
     # Check if this is a business plan question that might be combined
-    if session_data and session_data.get("current_phase") == "BUSINESS_PLAN":
+    # Every pattern below needs a question mark; skip the scans for replies without one.
+    if session_data and session_data.get("current_phase") == "BUSINESS_PLAN" and "?" in reply:
         # Look for patterns where multiple questions are combined
-        combined_patterns = [
-            # Pattern: "Question1? Question2?"
-            (r'([^?]+\?)\s+([A-Z][^?]+\?)', r'\1\n\n\2'),
-            # Pattern: "Question1. Question2?"
-            (r'([^?]+\.)\s+([A-Z][^?]+\?)', r'\1\n\n\2'),
-        ]
-        
-        for pattern, replacement in combined_patterns:
-            reply = re.sub(pattern, replacement, reply)
+        for pattern, replacement in _COMBINED_QUESTION_PATTERNS:
+            reply = pattern.sub(replacement, reply)
         
         # Separate the main question from coaching text when embedded at end of paragraph
         # Pattern: "...coaching text ending with period. What is your question?"
         # Should become: "...coaching text.\n\nWhat is your question?"
-        tag_match = re.search(r'\[\[Q:BUSINESS_PLAN\.\d{2}\]\]', reply)
+        tag_match = _BP_TAG_TWO_DIGIT_RE.search(reply)
         if tag_match:
             # Find lines that end with a question mark and have significant text before it
             lines = reply.split('\n')
@@ -1554,10 +1683,7 @@ def ensure_question_separation(reply, session_data=None):
                 # Check if line has coaching text followed by a question
                 # Pattern: "...text ending with period/comma. Question text?"
                 # Match: sentence-ending punctuation, space, then a capital letter starting a question
-                embedded_q_match = re.match(
-                    r'^(.{40,}[.!,;])\s+((?:What|How|Where|Who|When|Why|Which|Do|Does|Are|Is|Have|Has|Can|Could|Would|Will|Tell|Describe|Explain|Share)[^?]{10,}\?)(.*)$',
-                    stripped
-                )
+                embedded_q_match = _EMBEDDED_QUESTION_RE.match(stripped) if '?' in stripped else None
                 if embedded_q_match:
                     coaching_text = embedded_q_match.group(1).strip()
                     question_text = embedded_q_match.group(2).strip()
@@ -1929,38 +2055,63 @@ def fix_verification_flow(reply, session_data=None):
     
     return reply
 
+_VERIFICATION_REQUEST = (
+    "Here's what I've captured so far: [summary]. Does this look accurate to you? If not, please let me know where you'd like to modify and we'll work through this some more.\n\nPlease respond with \"Accept\" or \"Modify\" to continue."
+)
+# (literal lead-in that must be present, pattern, replacement)
+_MOLDING_PATTERNS = (
+    # Pattern: AI creates mission, vision, USP from user input without asking
+    ("Based on your input, here's what I've created for you:",
+     re.compile(r'(Based on your input, here\'s what I\'ve created for you:.*?Mission:.*?Vision:.*?Unique Selling Proposition:.*?)([A-Z][^?]+\?)', re.DOTALL),
+     r'Here\'s what I\'ve captured so far: [summary]. Does this look accurate to you? If not, please let me know where you\'d like to modify and we\'ll work through this some more.\n\nPlease respond with "Accept" or "Modify" to continue.'),
+    # Pattern: AI summarizes and immediately asks next question
+    ("Great! Based on your answers, here's what I understand:",
+     re.compile(r'(Great! Based on your answers, here\'s what I understand:.*?)([A-Z][^?]+\?)', re.DOTALL),
+     r'Here\'s what I\'ve captured so far: [summary]. Does this look accurate to you? If not, please let me know where you\'d like to modify and we\'ll work through this some more.\n\nPlease respond with "Accept" or "Modify" to continue.'),
+)
+_MOLDING_KEYWORDS = (
+    "based on your input, here's what i've created",
+    "here's what i understand about your business",
+    "let me create a mission statement for you",
+    "based on your answers, here's your mission",
+)
+
+
 def prevent_ai_molding(reply, session_data=None):
     """Prevent AI from molding user answers into mission, vision, USP without verification"""
     
     if session_data and session_data.get("current_phase") == "BUSINESS_PLAN":
         # Look for patterns where AI molds answers without verification
-        molding_patterns = [
-            # Pattern: AI creates mission, vision, USP from user input without asking
-            (r'(Based on your input, here\'s what I\'ve created for you:.*?Mission:.*?Vision:.*?Unique Selling Proposition:.*?)([A-Z][^?]+\?)', 
-             r'Here\'s what I\'ve captured so far: [summary]. Does this look accurate to you? If not, please let me know where you\'d like to modify and we\'ll work through this some more.\n\nPlease respond with "Accept" or "Modify" to continue.'),
-            
-            # Pattern: AI summarizes and immediately asks next question
-            (r'(Great! Based on your answers, here\'s what I understand:.*?)([A-Z][^?]+\?)', 
-             r'Here\'s what I\'ve captured so far: [summary]. Does this look accurate to you? If not, please let me know where you\'d like to modify and we\'ll work through this some more.\n\nPlease respond with "Accept" or "Modify" to continue.'),
-        ]
-        
-        for pattern, replacement in molding_patterns:
-            reply = re.sub(pattern, replacement, reply, flags=re.DOTALL)
+        for lead_in, pattern, replacement in _MOLDING_PATTERNS:
+            if lead_in in reply:
+                reply = pattern.sub(replacement, reply)
         
         # Check if AI is molding without verification
-        molding_keywords = [
-            "based on your input, here's what i've created",
-            "here's what i understand about your business",
-            "let me create a mission statement for you",
-            "based on your answers, here's your mission"
-        ]
-        
-        if any(keyword in reply.lower() for keyword in molding_keywords):
+        reply_lower = reply.lower()
+        if any(keyword in reply_lower for keyword in _MOLDING_KEYWORDS):
             # Replace with proper verification request
-            reply = "Here's what I've captured so far: [summary]. Does this look accurate to you? If not, please let me know where you'd like to modify and we'll work through this some more.\n\nPlease respond with \"Accept\" or \"Modify\" to continue."
+            reply = _VERIFICATION_REQUEST
     
     return reply
 
+# Keywords that indicate the user might have already provided relevant information,
+# in priority order. Each category is one compiled alternation so a text is scanned
+# once per category instead of once per keyword.
+_DRAFT_SUGGESTION_KEYWORDS = {
+    'target audience': ['audience', 'customers', 'demographic', 'market', 'millennials', 'gen z', 'generation'],
+    'business name': ['name', 'brand', 'company', 'business'],
+    'products/services': ['product', 'service', 'offer', 'sell', 'provide'],
+    'mission/vision': ['mission', 'vision', 'purpose', 'goal', 'objective'],
+    'location': ['location', 'city', 'country', 'area', 'region'],
+    'industry': ['industry', 'sector', 'field', 'business type'],
+    'resources': ['resources', 'tools', 'equipment', 'staff', 'team', 'budget']
+}
+_DRAFT_SUGGESTION_CATEGORY_RES = tuple(
+    (category, re.compile("|".join(re.escape(keyword) for keyword in keywords)))
+    for category, keywords in _DRAFT_SUGGESTION_KEYWORDS.items()
+)
+
+
 def suggest_draft_if_relevant(reply, session_data, user_input, history):
     """Suggest using Draft if user has already provided relevant information"""
     
@@ -1971,35 +2122,23 @@ def suggest_draft_if_relevant(reply, session_data, user_input, history):
     if session_data and session_data.get("current_phase") == "GKY":
         return reply
     
-    # Keywords that indicate the user might have already provided relevant information
-    relevant_keywords = {
-        'target audience': ['audience', 'customers', 'demographic', 'market', 'millennials', 'gen z', 'generation'],
-        'business name': ['name', 'brand', 'company', 'business'],
-        'products/services': ['product', 'service', 'offer', 'sell', 'provide'],
-        'mission/vision': ['mission', 'vision', 'purpose', 'goal', 'objective'],
-        'location': ['location', 'city', 'country', 'area', 'region'],
-        'industry': ['industry', 'sector', 'field', 'business type'],
-        'resources': ['resources', 'tools', 'equipment', 'staff', 'team', 'budget']
-    }
-    
     # Check if current question matches any of these categories
     current_question = reply.lower()
-    relevant_category = None
+    category_re = None
     
-    for category, keywords in relevant_keywords.items():
-        if any(keyword in current_question for keyword in keywords):
-            relevant_category = category
+    for _category, keywords_re in _DRAFT_SUGGESTION_CATEGORY_RES:
+        if keywords_re.search(current_question):
+            category_re = keywords_re
             break
     
-    if relevant_category:
+    if category_re is not None:
         # Check if user has provided information in this category before
         user_has_relevant_info = False
         
         # Check conversation history for relevant information
         for msg in history:
             if msg.get('role') == 'user' and len(msg.get('content', '')) > 10:
-                user_content = msg['content'].lower()
-                if any(keyword in user_content for keyword in relevant_keywords[relevant_category]):
+                if category_re.search(msg['content'].lower()):
                     user_has_relevant_info = True
                     break
         
@@ -2030,23 +2169,30 @@ def suggest_draft_if_relevant(reply, session_data, user_input, history):
 
 def check_for_section_summary(current_tag, session_data, history=None):
     """Check if we need to provide a section summary based on the current question tag."""
-    from services.business_plan_registry import get_section_boundary_info
+    from services.business_plan_registry import (
+        SECTION_BOUNDARY_END_NUMBERS,
+        get_section_boundary_info,
+    )
     from utils.section_summary import section_summary_already_pending
 
     if not current_tag or not current_tag.startswith("BUSINESS_PLAN."):
         return None
 
+    try:
+        question_num = int(current_tag.split(".")[1])
+    except (ValueError, IndexError):
+        return None
+
+    # Most questions don't end a section; skip the history check for them.
+    if question_num not in SECTION_BOUNDARY_END_NUMBERS:
+        return None
+
     if section_summary_already_pending(history):
         print(
             f"⏭️ Section summary already pending at {current_tag} — skip re-trigger"
         )
         return None
 
-    try:
-        question_num = int(current_tag.split(".")[1])
-    except (ValueError, IndexError):
-        return None
-
     boundary = get_section_boundary_info(question_num)
     if not boundary:
         return None
@@ -2255,22 +2401,24 @@ def add_proactive_support_guidance(reply, session_data, history):
     
     return reply
 
+_QUESTION_FORMATTING_PATTERNS = (
+    # Pattern: Yes/No questions without proper formatting
+    (_INLINE_YES_NO_RE, r'\1\n\n• Yes\n• No'),
+    # Pattern: Question without proper line breaks
+    (re.compile(r'([^?]+\?)\s+([A-Z][^?]+)'), r'\1\n\n\2'),
+    # Pattern: Multiple choice options without proper formatting
+    (re.compile(r'([^?]+\?)\s+([A-Z][^?]+(?:employed|time|Student|Unemployed|freelancer|Other)[^?]*)'),
+     r'\1\n\n• \2'),
+)
+
+
 def ensure_proper_question_formatting(reply, session_data=None):
     """Ensure questions are properly formatted with line breaks and structure"""
     
-    # Look for patterns where questions are not properly formatted
-    formatting_patterns = [
-        # Pattern: Yes/No questions without proper formatting
-        (r'([^?]+\?)\s+(Yes\s*/\s*No)', r'\1\n\n• Yes\n• No'),
-        # Pattern: Question without proper line breaks
-        (r'([^?]+\?)\s+([A-Z][^?]+)', r'\1\n\n\2'),
-        # Pattern: Multiple choice options without proper formatting
-        (r'([^?]+\?)\s+([A-Z][^?]+(?:employed|time|Student|Unemployed|freelancer|Other)[^?]*)', 
-         r'\1\n\n• \2'),
-    ]
-    
-    for pattern, replacement in formatting_patterns:
-        reply = re.sub(pattern, replacement, reply)
+    # Look for patterns where questions are not properly formatted (all need a "?")
+    if "?" in reply:
+        for pattern, replacement in _QUESTION_FORMATTING_PATTERNS:
+            reply = pattern.sub(replacement, reply)
     
     # Compact educational content (remove "Areas Where You May Need Additional Support", reduce spacing)
     reply = compact_educational_content(reply)
@@ -2479,19 +2627,22 @@ async def get_dynamic_business_question(question_tag: str, context: dict, recent
     )
     return fallback_question
 
+_RECENT_ANSWER_SKIP_WORDS = frozenset(
+    {"draft", "support", "scrapping", "scraping", "accept", "modify", "draft more", "skip", "next"}
+)
+
+
 def extract_recent_user_answer(history: list[dict]) -> str:
     if not history:
         return ""
     
-    command_words = {"draft", "support", "scrapping", "scraping", "accept", "modify", "draft more", "skip", "next"}
-    
     for msg in reversed(history):
         if msg.get("role") != "user":
             continue
         content = (msg.get("content") or "").strip()
         if not content:
             continue
-        if content.lower() in command_words:
+        if content.lower() in _RECENT_ANSWER_SKIP_WORDS:
             continue
         return content
     return ""
@@ -2770,7 +2921,7 @@ async def generate_gky_summary(session_data, history):
             for user_msg in history:
                 if user_msg.get('role') == 'user':
                     answer = user_msg.get('content', '').strip()
-                    if len(answer) > 10 and answer.lower() not in ['support', 'draft', 'scrapping', 'accept', 'modify']:
+                    if len(answer) > 10:
                         gky_insights.append(answer[:150])  # Take first 150 chars of each answer
     
     # Generate summary using the last few meaningful insights
@@ -3869,14 +4020,125 @@ def score_response_confidence(reply: str, business_type: str) -> float:
     return round(max(0.0, 1.0 - penalty), 2)
 
 
+_PATCHABLE_SESSION_FIELDS = ("asked_q", "current_phase")
+
+_WEBSEARCH_MARKER = "WEBSEARCH_QUERY:"
+
+
+def _websearch_query_after(text: str, marker_idx: int) -> str:
+    """Query text following the marker at marker_idx, up to any further marker."""
+    start = marker_idx + len(_WEBSEARCH_MARKER)
+    end = text.find(_WEBSEARCH_MARKER, start)
+    return text[start:end if end != -1 else len(text)].strip()
+
+
+def _net_session_patch(patch_session, fields_before):
+    """Drop patch entries that ended the turn at their pre-turn value; None if nothing is left."""
+    if not patch_session:
+        return None
+    net = {
+        key: value
+        for key, value in patch_session.items()
+        if key not in fields_before or fields_before[key] != value
+    }
+    return net or None
+
+# Button/command inputs that must not count as an answer to a missing question.
+_COMMAND_WORDS = frozenset({"support", "draft", "scrapping", "scraping", "accept", "modify", "kickstart", "draft more"})
+_COMMAND_PREFIXES = tuple(_COMMAND_WORDS - {"draft more"})
+# Button replies that are not a real answer (BP.01 treats any substring match as one).
+_ANSWER_COMMAND_WORDS = frozenset({"support", "draft", "scrapping", "accept", "modify"})
+
+
+def _structure_and_validate_reply(reply_content, session_data, answered_question_num):
+    """Synchronous formatting stage of get_angel_reply, run in a worker thread."""
+    # Format response structure to use proper list format instead of paragraph
+    reply_content = format_response_structure(reply_content)
+    
+    # Ensure questions are properly separated
+    reply_content = ensure_question_separation(reply_content, session_data)
+    
+    # Validate the BP question sequence FIRST — while session["asked_q"] still holds the
+    # question the user just answered. The model sometimes jumps ahead (e.g. 39 → 41) or
+    # repeats a question; validate corrects the [[Q:..]] tag against that baseline.
+    # This MUST run before get_angel_reply derives the new asked_q: if asked_q is updated from
+    # the raw tag first, validate then sees asked_q == reply tag, treats it as "aligned", and
+    # never corrects the jump — leaving session["asked_q"] off-by-one. The Draft command
+    # drafts for session["asked_q"], so that desync made it answer the wrong question.
+    return validate_business_plan_sequence(
+        reply_content, session_data, answered_question_num=answered_question_num
+    )
+
+
+async def _collect_streamed_reply(stream, check_every: int = 8) -> str:
+    """Join a streamed chat completion into the full reply text.
+
+    The single-question rule keeps only the first [[Q:BUSINESS_PLAN.NN]] tag, so
+    once a second tag starts streaming the rest would be discarded anyway: cut the
+    reply there and close the stream instead of waiting for generation to finish.
+    """
+    chunks: list[str] = []
+    first_tag_end = -1
+    async for event in stream:
+        if not event.choices:
+            continue
+        delta = event.choices[0].delta.content
+        if not delta:
+            continue
+        chunks.append(delta)
+        if len(chunks) % check_every:
+            continue
+        text = "".join(chunks)
+        # Same (case-insensitive) tag pattern the single-question guard uses afterwards.
+        if first_tag_end < 0:
+            first_tag = _BP_TAG_ANY_RE.search(text)
+            if not first_tag:
+                continue
+            first_tag_end = first_tag.end()
+        second_tag = _BP_TAG_ANY_RE.search(text, first_tag_end)
+        if second_tag:
+            logger.warning("MULTI-QUESTION VIOLATION while streaming - keeping only the first question tag")
+            await stream.close()
+            return text[:second_tag.start()].rstrip()
+    return "".join(chunks)
+
+
+async def _collect_streamed_words(stream, max_words: int, check_every: int = 8) -> str:
+    """Join a streamed chat completion, closing the stream once it is past ``max_words``.
+
+    Stops only after ``max_words + 1`` complete words have arrived, so
+    ``truncate_to_word_limit(text, max_words)`` returns exactly what it would
+    have for the full completion.
+    """
+    chunks: list[str] = []
+    async for event in stream:
+        if not event.choices:
+            continue
+        delta = event.choices[0].delta.content
+        if not delta:
+            continue
+        chunks.append(delta)
+        if len(chunks) % check_every:
+            continue
+        text = "".join(chunks)
+        if len(text.split()) > max_words + 1:
+            await stream.close()
+            return text
+    return "".join(chunks)
+
+
 async def get_angel_reply(
     user_msg,
     history,
     session_data=None,
     modify_intent: Optional[Dict[str, Any]] = None,
 ):
-    import time
     start_time = time.time()
+    # Pre-turn values of the scalar session fields this handler may patch; branches can
+    # reassign them several times, and only a net change is worth a Supabase write.
+    session_fields_before = {
+        key: (session_data or {}).get(key) for key in _PATCHABLE_SESSION_FIELDS
+    }
     
     # Get user name from session data, fallback to generic greeting
     user_name = session_data.get("user_name", "there") if session_data else "there"
@@ -3927,9 +4189,11 @@ async def get_angel_reply(
     if not user_msg.get("content") or user_msg["content"].strip() == "":
         # Check if session has missing questions metadata (from uploaded plan)
         # Get from business_context JSON
-        business_context = session_data.get("business_context", {}) or {} if session_data else {}
-        uploaded_plan_mode = business_context.get("uploaded_plan_mode", False) if isinstance(business_context, dict) else False
-        missing_questions = business_context.get("missing_questions", []) if isinstance(business_context, dict) else []
+        business_context = (session_data or {}).get("business_context") or {}
+        if not isinstance(business_context, dict):
+            business_context = {}
+        uploaded_plan_mode = business_context.get("uploaded_plan_mode", False)
+        missing_questions = business_context.get("missing_questions") or []
         
         if session_data and uploaded_plan_mode and session_data.get("current_phase") == "BUSINESS_PLAN":
             try:
@@ -4014,18 +4278,22 @@ async def get_angel_reply(
             user_prefs=user_prefs,
         )
 
-    from services.questionnaire_commands import is_questionnaire_command
+    from services import questionnaire_commands as qc
     from utils.section_summary import (
         get_last_assistant_content,
         section_summary_already_pending,
     )
 
-    _is_accept_early = user_content.lower().strip() == "accept"
+    # Classify the turn once; every command/answer branch below keys off this.
+    _uls = user_content.lower()
+    command_kind = qc.classify_questionnaire_input(user_content)
+    is_accept_command = command_kind == qc.COMMAND_ACCEPT
+    is_command_response = command_kind != qc.COMMAND_ANSWER
+
     if (
         session_data
         and session_data.get("current_phase") == "BUSINESS_PLAN"
-        and not _is_accept_early
-        and not is_questionnaire_command(user_content)
+        and not is_command_response
         and section_summary_already_pending(history)
     ):
         cached_summary = get_last_assistant_content(history)
@@ -4083,7 +4351,7 @@ async def get_angel_reply(
         if current_phase == "BUSINESS_PLAN" and 1 <= target_question_num <= 45:
             # Extract missing questions list from message
             missing_questions = []
-            missing_match = re.search(r'missing questions:\s*([\d,\s]+)', user_content.lower())
+            missing_match = _MISSING_QUESTIONS_RE.search(user_content.lower())
             if missing_match:
                 missing_str = missing_match.group(1)
                 missing_questions = [int(q.strip()) for q in missing_str.split(',') if q.strip().isdigit()]
@@ -4099,6 +4367,8 @@ async def get_angel_reply(
             business_context = session_data.get("business_context", {}) or {}
             if not isinstance(business_context, dict):
                 business_context = {}
+            # Kept sorted so the next missing question is always missing_questions[0]
+            missing_questions = sorted(set(missing_questions))
             business_context["missing_questions"] = missing_questions
             business_context["uploaded_plan_mode"] = True
             session_data["business_context"] = business_context
@@ -4173,19 +4443,27 @@ async def get_angel_reply(
             except (ValueError, IndexError):
                 pass
     
+    # Fast path: every block below (BP completion, keyword web search, command
+    # dispatch, relevance gate, BP progression) only applies to Business Plan turns.
+    # Resolve the phase once so GKY answers fall straight through to building msgs.
+    in_business_plan = bool(session_data) and session_data.get("current_phase") == "BUSINESS_PLAN"
+    # The last 10 messages feed the model payload and every short look-back scan
+    # below (last assistant tag, Accept-after-command detection, Draft/Support hint).
+    trimmed_history = trim_conversation_history(history, max_messages=10)
+
     # CRITICAL: Check if Business Plan phase is complete (question 45) BEFORE AI generation
     # This must happen early to prevent AI from generating its own completion message
-    if session_data and session_data.get("current_phase") == "BUSINESS_PLAN":
+    if in_business_plan:
         current_tag = session_data.get("asked_q", "")
         
         # Also check the last assistant message to see if it asked question 45
         last_assistant_tag = None
-        for msg in reversed(history[-5:]):
+        for msg in _iter_recent_reversed(trimmed_history, 5):
             if msg.get('role') == 'assistant':
                 content = msg.get('content', '')
-                tag_match = re.search(r'\[\[Q:(BUSINESS_PLAN\.\d+)\]\]', content)
+                tag_match = _BP_TAG_NAME_RE.search(content)
                 if tag_match:
-                    last_assistant_tag = tag_match.group(1)
+                    last_assistant_tag = tag_match.group(1).upper()
                     break
         
         # Also check if we've answered 45 questions based on progress
@@ -4219,7 +4497,7 @@ async def get_angel_reply(
                 if msg.get('role') == 'assistant':
                     content = msg.get('content', '')
                     # Count all BUSINESS_PLAN question tags
-                    bp_tags = re.findall(r'\[\[Q:(BUSINESS_PLAN\.\d+)\]\]', content)
+                    bp_tags = _BP_TAG_NAME_RE.findall(content)
                     if bp_tags:
                         for bp_tag in bp_tags:
                             try:
@@ -4237,7 +4515,7 @@ async def get_angel_reply(
         # Trigger completion if business plan is complete
         if (business_plan_complete and 
             len(user_content.strip()) > 0 and
-            user_content.lower().strip() not in ["draft", "support", "scrapping", "scraping", "accept"]):
+            command_kind not in (qc.COMMAND_DRAFT, qc.COMMAND_SUPPORT, qc.COMMAND_SCRAPPING, qc.COMMAND_ACCEPT)):
             
             print(f"🎯 Business Plan completion detected - triggering completion handler IMMEDIATELY (before AI generation)")
             print(f"   Current asked_q: {current_tag}, Last assistant tag: {last_assistant_tag}, Answered count: {answered_count}")
@@ -4268,12 +4546,12 @@ async def get_angel_reply(
             }
     
     # Check for WEBSEARCH_QUERY trigger from scrapping command
-    if "WEBSEARCH_QUERY:" in user_content:
+    if _WEBSEARCH_MARKER in user_content:
         needs_web_search = True
-        web_search_query = user_content.split("WEBSEARCH_QUERY:")[1].strip()
+        web_search_query = _websearch_query_after(user_content, user_content.find(_WEBSEARCH_MARKER))
         print(f"🔍 Web search triggered by scrapping command: {web_search_query}")
     
-    elif session_data and session_data.get("current_phase") == "BUSINESS_PLAN":
+    elif in_business_plan:
         # Look for competitive analysis, market research, or vendor recommendation needs
         # BUT only trigger if user explicitly asks for research, not for every answer
         business_keywords = ["competitors", "market", "industry", "trends", "pricing", "vendors", "domain", "legal requirements"]
@@ -4288,7 +4566,7 @@ async def get_angel_reply(
                 print(f"⏱️ Skipping web search due to throttling (reducing latency)")
             
             # Extract or generate search query with previous calendar year
-            current_year = datetime.now().year
+            current_year = _current_year()
             previous_year = current_year - 1
             
             from utils.business_context import coerce_business_context, prompt_labels
@@ -4320,15 +4598,14 @@ async def get_angel_reply(
         
         # ENHANCED COMPETITOR RESEARCH HANDLING
         if competitor_research_requested:
-            # Extract business context for comprehensive competitor research
-            business_context = extract_business_context_from_history(history)
-            if session_data:
-                business_context.update({
-                    "industry": session_data.get("industry", ""),
-                    "location": session_data.get("location", ""),
-                    "business_name": session_data.get("business_name", ""),
-                    "business_type": session_data.get("business_type", "")
-                })
+            # handle_competitor_research_request only reads these four fields and the
+            # session values always win, so skip the history scan and go straight to search.
+            business_context = {
+                "industry": session_data.get("industry", ""),
+                "location": session_data.get("location", ""),
+                "business_name": session_data.get("business_name", ""),
+                "business_type": session_data.get("business_type", "")
+            }
             
             # Conduct comprehensive competitor research
             competitor_research_result = await handle_competitor_research_request(user_content, business_context, history)
@@ -4361,16 +4638,8 @@ async def get_angel_reply(
     # Do NOT manually increment question numbers or use generate_next_question()
     # Let the AI follow the system prompt from constant.py
     # Check if this is a command that should not generate new questions
-    from services.questionnaire_commands import is_questionnaire_command, parse_scrapping_notes
-
-    normalized_user_content = user_content.lower().strip()
-    is_command_response = is_questionnaire_command(user_content)
-    
-    # Check if this is an "Accept" command from Support/Draft/Scrapping
-    is_accept_command = user_content.lower().strip() == "accept"
-    
     # Handle Accept command - treat as a regular answer to move to next question
-    if is_accept_command and session_data and session_data.get("current_phase") == "BUSINESS_PLAN":
+    if is_accept_command and in_business_plan:
         current_tag = session_data.get("asked_q", "")
         print(f"✅ Accept command detected at {current_tag} - treating as answer to move to next question")
         # Accept on auto-research questions (Q11, Q35, Q42, etc.) advances ONE step only.
@@ -4385,7 +4654,7 @@ async def get_angel_reply(
             # Check if the LAST assistant message was already a section summary
             # (to avoid infinite loop: summary → Accept → summary → Accept → ...)
             last_assistant_content = ""
-            for msg in reversed(history[-8:]):
+            for msg in _iter_recent_reversed(trimmed_history, 8):
                 if msg.get('role') == 'assistant':
                     last_assistant_content = msg.get('content', '')
                     break
@@ -4396,7 +4665,7 @@ async def get_angel_reply(
             
             # Detect which command type preceded this Accept (for logging)
             preceding_command = "unknown"
-            for msg in reversed(history[-8:]):
+            for msg in _iter_recent_reversed(trimmed_history, 8):
                 if msg.get('role') == 'user':
                     cmd = (msg.get('content', '') or '').lower().strip()
                     if cmd in ['draft', 'draft more', 'draft answer']:
@@ -4437,27 +4706,24 @@ async def get_angel_reply(
         pass
     
     # For commands, bypass AI generation and provide direct responses
-    elif is_command_response and session_data and session_data.get("current_phase") == "BUSINESS_PLAN":
-        print(f"🔧 Command detected: {normalized_user_content} - bypassing AI generation to prevent question skipping")
+    elif is_command_response and in_business_plan:
+        print(f"🔧 Command detected: {_uls} - bypassing AI generation to prevent question skipping")
         
         # Generate direct command response without AI
-        command = normalized_user_content
-        show_buttons_for_command = True
-
-        if command == "draft":
+        if command_kind == qc.COMMAND_DRAFT:
             reply_content = await handle_draft_command("", history, session_data)
-        elif command.startswith("scrapping:") or command.startswith("scraping:"):
-            notes = parse_scrapping_notes(user_content)
+        elif command_kind == qc.COMMAND_SCRAPPING_WITH_NOTES:
+            notes = qc.parse_scrapping_notes(user_content)
             scrapping_result = await handle_scrapping_command("", notes, history, session_data)
             scrapping_result["show_accept_modify"] = True
             return scrapping_result
-        elif command in ["scrapping", "scraping"]:
+        elif command_kind == qc.COMMAND_SCRAPPING:
             scrapping_result = await handle_scrapping_command("", "", history, session_data)
             scrapping_result["show_accept_modify"] = True
             return scrapping_result
-        elif command == "support":
+        elif command_kind == qc.COMMAND_SUPPORT:
             reply_content = await handle_support_command("", history, session_data)
-        elif command in ["draft more", "draft answer"]:
+        elif command_kind == qc.COMMAND_DRAFT_MORE:
             reply_content = await handle_draft_more_command("", history, session_data)
         else:
             reply_content = "I understand you'd like to use a command. Please try again."
@@ -4474,22 +4740,12 @@ async def get_angel_reply(
     # question, critique politely, and offer Support — do NOT advance. Anything with
     # even slight relevance (3+), including a brief or honest "I don't know", advances
     # normally with no extra pushback.
-    if (
-        session_data
-        and session_data.get("current_phase") == "BUSINESS_PLAN"
-        and not is_accept_command
-        and not is_command_response
-    ):
-        from services.questionnaire_commands import is_questionnaire_command
-        from utils.section_summary import section_summary_already_pending
-
+    if in_business_plan and not is_accept_command and not is_command_response:
         _asked_q_now = session_data.get("asked_q", "")
-        _ans_norm = user_content.strip().lower()
         _is_plain_answer = (
-            len(user_content.strip()) > 0
+            len(user_content) > 0
             and _asked_q_now.startswith("BUSINESS_PLAN.")
-            and _ans_norm not in ("accept", "modify", "yes", "no", "ok", "okay", "proceed", "skip", "next")
-            and not is_questionnaire_command(user_content)
+            and _uls not in ("yes", "no", "ok", "okay", "proceed", "skip", "next")
             and not section_summary_already_pending(history)
         )
         if _is_plain_answer:
@@ -4571,7 +4827,7 @@ async def get_angel_reply(
         # CRITICAL: After Draft/Support commands, ensure AI remembers the current question
         # Check if the last assistant message was a Draft/Support response
         last_assistant_msg = None
-        for msg in reversed(history[-5:]):
+        for msg in _iter_recent_reversed(trimmed_history, 5):
             if msg.get('role') == 'assistant':
                 last_assistant_msg = msg.get('content', '')
                 break
@@ -4620,9 +4876,11 @@ DO NOT repeat "{asked_q}" - the user has already answered it.
         # Check if we're in missing questions mode
         missing_questions_instruction = ""
         next_question_to_ask = next_question_num
-        business_context = session_data.get("business_context", {}) or {} if session_data else {}
-        uploaded_plan_mode = business_context.get("uploaded_plan_mode", False) if isinstance(business_context, dict) else False
-        missing_questions = business_context.get("missing_questions", []) if isinstance(business_context, dict) else []
+        business_context = (session_data or {}).get("business_context") or {}
+        if not isinstance(business_context, dict):
+            business_context = {}
+        uploaded_plan_mode = business_context.get("uploaded_plan_mode", False)
+        missing_questions = business_context.get("missing_questions") or []
         
         if session_data and uploaded_plan_mode and current_phase == "BUSINESS_PLAN":
             if isinstance(missing_questions, list) and len(missing_questions) > 0:
@@ -4696,13 +4954,12 @@ CRITICAL INSTRUCTIONS:
                 msgs.append({"role": "system", "content": depth_hint})
 
     # Add conversation history (trimmed for performance) and current message
-    trimmed_history = trim_conversation_history(history, max_messages=10)
     msgs.extend(trimmed_history)
     
     # If the user clicked Accept, steer the model without giving a phrase it will copy verbatim every turn
     if is_accept_command:
         accept_next_hint = ""
-        if session_data and session_data.get("current_phase") == "BUSINESS_PLAN":
+        if in_business_plan:
             answered_n = _parse_business_plan_tag_number(session_data.get("asked_q"))
             if answered_n is not None and answered_n < 45:
                 next_n = answered_n + 1
@@ -4730,9 +4987,9 @@ CRITICAL INSTRUCTIONS:
     # 1) last assistant [[Q:BUSINESS_PLAN.NN]] in history (most reliable for what user actually saw)
     # 2) session asked_q fallback
     bp_answered_question_num: int | None = None
-    if session_data and session_data.get("current_phase") == "BUSINESS_PLAN":
+    if in_business_plan:
         if history:
-            for msg in reversed(history[-16:]):
+            for msg in _iter_recent_reversed(history, 16):
                 if msg.get("role") != "assistant":
                     continue
                 content = msg.get("content")
@@ -4745,135 +5002,6 @@ CRITICAL INSTRUCTIONS:
         if bp_answered_question_num is None:
             bp_answered_question_num = _parse_business_plan_tag_number(session_data.get("asked_q"))
 
-    response = await client.chat.completions.create(
-        model="gpt-4o",
-        messages=msgs,
-        temperature=0.7,
-        max_tokens=1000,  # Limit response length for faster processing
-        stream=False  # Ensure non-streaming for consistent response times
-    )
-
-    reply_content = response.choices[0].message.content
-
-    # ── Confidence scoring (hallucination mitigation) ──
-    bc = (session_data or {}).get("business_context", {}) or {}
-    declared_business_type = bc.get("business_type", "")
-    if not declared_business_type:
-        ctx = extract_business_context_from_history(history)
-        declared_business_type = ctx.get("business_type", "")
-
-    if declared_business_type:
-        conf = score_response_confidence(reply_content, declared_business_type)
-        if is_generic_business_type_label(declared_business_type):
-            logger.debug(
-                "Skipping confidence retry for GKY category label: '%s'",
-                declared_business_type,
-            )
-        else:
-            logger.info(
-                "Confidence score: %.2f for business_type='%s'",
-                conf,
-                declared_business_type,
-            )
-
-        if (
-            not is_generic_business_type_label(declared_business_type)
-            and conf < CONFIDENCE_THRESHOLD
-        ):
-            logger.warning(
-                "Industry contradiction detected (%.2f < %.2f) — regenerating once",
-                conf,
-                CONFIDENCE_THRESHOLD,
-            )
-            stronger_grounding = (
-                f"\n\n🚨 CRITICAL CORRECTION: Your previous draft was scored as potentially "
-                f"irrelevant to the user's declared business type: \"{declared_business_type}\". "
-                f"Regenerate your response ensuring EVERY example, insight, and piece of "
-                f"advice is directly applicable to a '{declared_business_type}' business. "
-                f"Do NOT reference any other industry."
-            )
-            msgs.append({"role": "system", "content": stronger_grounding})
-            msgs.append({"role": "assistant", "content": reply_content})
-            msgs.append({"role": "user", "content": "Please revise your response to be specifically relevant to my business type."})
-
-            for _retry in range(CONFIDENCE_MAX_RETRIES):
-                retry_resp = await client.chat.completions.create(
-                    model="gpt-4o",
-                    messages=msgs,
-                    temperature=0.5,
-                    max_tokens=1000,
-                    stream=False,
-                )
-                reply_content = retry_resp.choices[0].message.content
-                new_conf = score_response_confidence(reply_content, declared_business_type)
-                logger.info("Retry confidence score: %.2f", new_conf)
-                if new_conf >= CONFIDENCE_THRESHOLD:
-                    break
-
-    # Clean up extra newlines (keep "Question X of 45" format for Business Plan)
-    reply_content = re.sub(r'\n{3,}', '\n\n', reply_content)
-    
-    # Handle remaining commands (kickstart, contact) that weren't processed earlier
-    current_phase = session_data.get("current_phase", "") if session_data else ""
-    
-    if current_phase != "GKY":
-        # Only process remaining commands outside of GKY phase
-        if user_content.lower() == "kickstart":
-            reply_content = handle_kickstart_command(reply_content, history, session_data)
-        elif user_content.lower() == "who do i contact?":
-            reply_content = handle_contact_command(reply_content, history, session_data)
-    
-    # Inject missing tag if AI forgot to include one
-    reply_content = inject_missing_tag(reply_content, session_data)
-
-    # Section-end flows show a summary without a new [[Q:...]] — do not force the next question there.
-    bp_skip_progression_guard = bool(
-        session_data
-        and session_data.get("current_phase") == "BUSINESS_PLAN"
-        and not is_accept_command
-        and not is_command_response
-        and check_for_section_summary(session_data.get("asked_q"), session_data, history)
-    )
-
-    if (
-        session_data
-        and session_data.get("current_phase") == "BUSINESS_PLAN"
-        and not bp_skip_progression_guard
-    ):
-        reply_content = await _ensure_business_plan_next_question_reply(
-            reply_content,
-            session_data,
-            history,
-            user_content,
-            answered_question_num=bp_answered_question_num,
-        )
-
-    # CRITICAL: Enforce single-question rule - strip extra [[Q:...]] tags if AI generated multiple
-    all_tags_raw = re.findall(r"\[\[Q:(BUSINESS_PLAN\.\d+)\]\]", reply_content, flags=re.IGNORECASE)
-    all_tags = [f"BUSINESS_PLAN.{int(t.split('.')[1]):02d}" for t in all_tags_raw]
-    if len(all_tags) > 1:
-        first_tag = all_tags[0]
-        print(f"⚠️ MULTI-QUESTION VIOLATION: AI generated {len(all_tags)} question tags: {all_tags}. Keeping only the first: {first_tag}")
-        matches = list(re.finditer(r"\[\[Q:BUSINESS_PLAN\.\d+\]\]", reply_content, flags=re.IGNORECASE))
-        if len(matches) > 1:
-            second_start = matches[1].start()
-            reply_content = reply_content[:second_start].rstrip()
-            print(f"✅ Trimmed reply to contain only [[Q:{first_tag}]]")
-    
-    # Check if AI response contains WEBSEARCH_QUERY (from scrapping command)
-    if "WEBSEARCH_QUERY:" in reply_content:
-        needs_web_search = True
-        web_search_query = reply_content.split("WEBSEARCH_QUERY:")[1].strip()
-        print(f"🔍 Web search triggered by AI response: {web_search_query}")
-        # Remove the WEBSEARCH_QUERY from the response
-        reply_content = reply_content.split("WEBSEARCH_QUERY:")[0].strip()
-    
-    # Format response structure to use proper list format instead of paragraph
-    reply_content = format_response_structure(reply_content)
-    
-    # Ensure questions are properly separated
-    reply_content = ensure_question_separation(reply_content, session_data)
-    
     # Check if we need to provide a section summary BEFORE updating asked_q
     # (Check based on the PREVIOUS question that was just answered, not the next question)
     current_tag_before_update = session_data.get("asked_q") if session_data else None
@@ -4881,116 +5009,25 @@ CRITICAL INSTRUCTIONS:
     
     # RE-ENABLED: Section summaries with proper timing to prevent question skipping
     # Only show section summary if user just answered a section-ending question
-    # Don't show if user clicked Accept (they want to proceed from summary)
-    if not is_accept_command and not is_command_response:
+    # Don't show if user clicked Accept or any other command (Accept is a command too).
+    # One flag gates both the check and the summary generation below.
+    summary_possible = (
+        not is_command_response
+        and _parse_business_plan_tag_number(current_tag_before_update) in SECTION_BOUNDARY_END_NUMBERS
+    )
+    if summary_possible:
         # Check if we just completed a section-ending question
         section_summary_info = check_for_section_summary(
             current_tag_before_update, session_data, history
         )
     
-    # Validate the BP question sequence FIRST — while session["asked_q"] still holds the
-    # question the user just answered. The model sometimes jumps ahead (e.g. 39 → 41) or
-    # repeats a question; validate corrects the [[Q:..]] tag against that baseline.
-    # This MUST run before we derive the new asked_q below: if asked_q is updated from the
-    # raw tag first, validate then sees asked_q == reply tag, treats it as "aligned", and
-    # never corrects the jump — leaving session["asked_q"] off-by-one. The Draft command
-    # drafts for session["asked_q"], so that desync made it answer the wrong question.
-    reply_content = validate_business_plan_sequence(
-        reply_content, session_data, answered_question_num=bp_answered_question_num
-    )
-
-    # Extract the (now validated) question tag from reply and update session data.
-    # IMPORTANT: Don't update asked_q if we're showing a section summary
     patch_session = {}
-    tag_match = re.search(r"\[\[Q:([A-Za-z_]+\.\d+)\]\]", reply_content, re.IGNORECASE)
-    new_question_tag = None
-    if tag_match and session_data and not section_summary_info:
-        raw_tag = tag_match.group(1)
-        phase_part, num_part = raw_tag.split(".", 1)
-        phase_up = phase_part.upper()
-        try:
-            qn = int(num_part)
-        except ValueError:
-            qn = 0
-        if phase_up == "BUSINESS_PLAN":
-            new_question_tag = f"BUSINESS_PLAN.{qn:02d}"
-        else:
-            new_question_tag = f"{phase_up}.{num_part}"
-        current_asked_q = session_data.get("asked_q", "")
-
-        if new_question_tag != current_asked_q:
-            session_data["asked_q"] = new_question_tag
-            patch_session["asked_q"] = new_question_tag
-            print(f"🔧 Updating session asked_q: {current_asked_q} → {new_question_tag}")
-    elif section_summary_info:
-        print(f"🔒 Section summary active - NOT updating asked_q (staying at {current_tag_before_update})")
-    
-    reply_content, auto_research_triggered, detected_tag = await apply_business_plan_auto_research(
-        reply_content,
-        session_data,
-        history,
-        # Accept advances the questionnaire — still inject research for the next auto-research tag.
-        is_command_response=is_command_response and not is_accept_command,
-    )
-
-    # Also strip floating sub-instruction lines for Q11 that AI generates as separate paragraphs
-    if detected_tag == "BUSINESS_PLAN.11":
-        # Remove standalone "List top 5..." and "Look for both small and large..." lines
-        # These are sub-instructions that should not appear as separate paragraphs
-        reply_content = re.sub(r'\n+List top 5 and describe their strengths and weaknesses\.?\s*\n+', '\n', reply_content)
-        reply_content = re.sub(r'\n+Look for both small and large businesses[^\n]*\.\s*\n+', '\n', reply_content)
-        
-        # Strip AI-generated fake placeholder competitors (Competitor A, B, C, D, E)
-        # These appear when AI ignores the instruction not to generate competitor data
-        reply_content = re.sub(r'\n*Competitor [A-E]:[^\n]*\n*', '\n', reply_content)
-    
-    # For Q12, strip AI-generated fake trends (Trend 1, Trend 2, etc.)
-    if detected_tag == "BUSINESS_PLAN.12":
-        reply_content = re.sub(r'\n*Trend \d+:[^\n]*\n*', '\n', reply_content)
-    
-    # For Q26 (permits/licenses): Replace "Competitive Landscape" etc. with "Potential Service Providers"
-    # Per spec, permits research should list service providers (LegalZoom, MyCorporation), not competitors
-    if detected_tag == "BUSINESS_PLAN.26":
-        reply_content = re.sub(r'\*\*Competitive [Ll]andscape\*\*', '**Potential Service Providers**', reply_content)
-        reply_content = re.sub(r'Competitive [Ll]andscape', 'Potential Service Providers', reply_content)
-        reply_content = re.sub(r'\*\*Competitors\*\*', '**Potential Service Providers**', reply_content)
-        reply_content = re.sub(r'\*\*Competitive [Aa]nalysis\*\*', '**Potential Service Providers**', reply_content)
-    
-    # For Q27 (insurance): Strip "Market Data" section - market size, CAGR, premiums not relevant for policy recommendations
-    if detected_tag == "BUSINESS_PLAN.27":
-        # Match **Market Data** or ## Market Data headers and their content until next section
-        reply_content = re.sub(r'\n+\*\*[Mm]arket [Dd]ata\*\*[^\n]*\n.*?(?=\n\n\*\*|\n##\s|\n\d+\.\s|\Z)', '\n', reply_content, flags=re.DOTALL)
-        reply_content = re.sub(r'\n+##\s*[Mm]arket [Dd]ata[^\n]*\n.*?(?=\n\n##|\n\*\*|\n\d+\.\s|\Z)', '\n', reply_content, flags=re.DOTALL)
-    
-    # For Q35 (scaling): Remove "Sub-questions covered" section
-    if detected_tag == "BUSINESS_PLAN.35":
-        reply_content = re.sub(r'\n*\*\*Sub-questions covered\*\*:?.*?(?=\n\n|\n\*\*|\Z)', '\n', reply_content, flags=re.DOTALL | re.IGNORECASE)
-        reply_content = re.sub(r'\n*Sub-questions covered:?.*?(?=\n\n|\n\*\*|\Z)', '\n', reply_content, flags=re.DOTALL | re.IGNORECASE)
-    
-    # Clean up excessive blank lines (3+ newlines → 2)
-    reply_content = re.sub(r'\n{3,}', '\n\n', reply_content)
-
-    # (BP sequence validation now runs earlier — before asked_q is derived — so the
-    # corrected tag drives asked_q. See the note above the tag-extraction block.)
-
-    # Fix verification flow to separate verification from next question
-    # reply_content = fix_verification_flow(reply_content, session_data)
-    
-    # Prevent AI from molding user answers without verification
-    reply_content = prevent_ai_molding(reply_content, session_data)
-    
-    # Add critiquing insights based on user's business field
-    reply_content = await add_critiquing_insights(reply_content, session_data, user_content)
-    
-    # Suggest using Draft if user has already provided relevant information
-    reply_content = suggest_draft_if_relevant(reply_content, session_data, user_content, history)
-    
-    # Add proactive support guidance based on identified areas needing help
-    reply_content = add_proactive_support_guidance(reply_content, session_data, history)
-    
+    auto_research_triggered = False
     if section_summary_info:
-        print(f"🎯 SECTION SUMMARY TRIGGERED for {section_summary_info['section_name']} at question {current_tag_before_update}")
-
+        # The summary replaces the main reply on section-end turns, so the main
+        # completion (and its post-processing) is skipped rather than generated and
+        # thrown away. asked_q stays on the section-ending question until the user accepts.
+        logger.debug("Section summary triggered for %s at question %s", section_summary_info["section_name"], current_tag_before_update)
         from services.section_summary_service import generate_section_summary_text
 
         reply_content = await generate_section_summary_text(
@@ -5002,25 +5039,228 @@ CRITICAL INSTRUCTIONS:
             angel_system_prompt=ANGEL_SYSTEM_PROMPT,
             session_data=session_data,
         )
-        print(f"🔒 Section summary generated - keeping asked_q at {current_tag_before_update} until user accepts")
-    
-    # Ensure proper question formatting with line breaks and structure
-    reply_content = ensure_proper_question_formatting(reply_content, session_data)
-    reply_content = await personalize_business_question(reply_content, history, session_data)
+        logger.debug("Section summary generated - keeping asked_q at %s until user accepts", current_tag_before_update)
+    else:
+        response = await client.chat.completions.create(
+            model="gpt-4o",
+            messages=msgs,
+            temperature=0.7,
+            max_tokens=1000,  # Limit response length for faster processing
+            stream=True,
+        )
 
-    # Check if we're in "missing questions mode" and handle question progression correctly
-    # CRITICAL: After answering a missing question, jump to NEXT missing question (not sequential)
-    # After all missing questions are answered, continue sequentially with remaining questions
-    business_context = session_data.get("business_context", {}) or {} if session_data else {}
-    uploaded_plan_mode = business_context.get("uploaded_plan_mode", False) if isinstance(business_context, dict) else False
-    missing_questions = business_context.get("missing_questions", []) if isinstance(business_context, dict) else []
+        reply_content = await _collect_streamed_reply(response)
+
+        # ── Confidence scoring (hallucination mitigation) ──
+        bc = (session_data or {}).get("business_context", {}) or {}
+        declared_business_type = bc.get("business_type", "")
+        if not declared_business_type:
+            ctx = extract_business_context_from_history(history)
+            declared_business_type = ctx.get("business_type", "")
+
+        if declared_business_type:
+            conf = score_response_confidence(reply_content, declared_business_type)
+            if is_generic_business_type_label(declared_business_type):
+                logger.debug(
+                    "Skipping confidence retry for GKY category label: '%s'",
+                    declared_business_type,
+                )
+            else:
+                logger.info(
+                    "Confidence score: %.2f for business_type='%s'",
+                    conf,
+                    declared_business_type,
+                )
+
+            if (
+                not is_generic_business_type_label(declared_business_type)
+                and conf < CONFIDENCE_THRESHOLD
+            ):
+                logger.warning(
+                    "Industry contradiction detected (%.2f < %.2f) — regenerating once",
+                    conf,
+                    CONFIDENCE_THRESHOLD,
+                )
+                stronger_grounding = (
+                    f"\n\n🚨 CRITICAL CORRECTION: Your previous draft was scored as potentially "
+                    f"irrelevant to the user's declared business type: \"{declared_business_type}\". "
+                    f"Regenerate your response ensuring EVERY example, insight, and piece of "
+                    f"advice is directly applicable to a '{declared_business_type}' business. "
+                    f"Do NOT reference any other industry."
+                )
+                msgs.append({"role": "system", "content": stronger_grounding})
+                msgs.append({"role": "assistant", "content": reply_content})
+                msgs.append({"role": "user", "content": "Please revise your response to be specifically relevant to my business type."})
+
+                for _retry in range(CONFIDENCE_MAX_RETRIES):
+                    retry_resp = await client.chat.completions.create(
+                        model="gpt-4o",
+                        messages=msgs,
+                        temperature=0.5,
+                        max_tokens=1000,
+                        stream=True,
+                    )
+                    reply_content = await _collect_streamed_reply(retry_resp)
+                    new_conf = score_response_confidence(reply_content, declared_business_type)
+                    logger.info("Retry confidence score: %.2f", new_conf)
+                    if new_conf >= CONFIDENCE_THRESHOLD:
+                        break
+
+        # Clean up extra newlines (keep "Question X of 45" format for Business Plan)
+        reply_content = _BLANK_LINE_RUN_RE.sub('\n\n', reply_content)
     
-    if session_data and uploaded_plan_mode and session_data.get("current_phase") == "BUSINESS_PLAN":
-        # Ensure missing_questions is a list
-        if not isinstance(missing_questions, list):
-            missing_questions = []
-        
-        current_tag = session_data.get("asked_q", "")
+        # Handle remaining commands (kickstart, contact) that weren't processed earlier
+        current_phase = session_data.get("current_phase", "") if session_data else ""
+    
+        if current_phase != "GKY":
+            # Only process remaining commands outside of GKY phase
+            if user_content.lower() == "kickstart":
+                reply_content = handle_kickstart_command(reply_content)
+            elif user_content.lower() == "who do i contact?":
+                reply_content = handle_contact_command(reply_content)
+    
+        # Inject missing tag if AI forgot to include one
+        reply_content = inject_missing_tag(reply_content, session_data)
+
+        if in_business_plan:
+            reply_content = await _ensure_business_plan_next_question_reply(
+                reply_content,
+                session_data,
+                history,
+                user_content,
+                answered_question_num=bp_answered_question_num,
+            )
+
+        # CRITICAL: Enforce single-question rule - strip extra [[Q:...]] tags if AI generated multiple
+        all_tags = [f"BUSINESS_PLAN.{int(num):02d}" for num in _BP_TAG_RE.findall(reply_content)]
+        if len(all_tags) > 1:
+            first_tag = all_tags[0]
+            print(f"⚠️ MULTI-QUESTION VIOLATION: AI generated {len(all_tags)} question tags: {all_tags}. Keeping only the first: {first_tag}")
+            matches = list(_BP_TAG_ANY_RE.finditer(reply_content))
+            if len(matches) > 1:
+                second_start = matches[1].start()
+                reply_content = reply_content[:second_start].rstrip()
+                print(f"✅ Trimmed reply to contain only [[Q:{first_tag}]]")
+    
+        # Check if AI response contains WEBSEARCH_QUERY (from scrapping command)
+        marker_idx = reply_content.find(_WEBSEARCH_MARKER)
+        if marker_idx != -1:
+            needs_web_search = True
+            web_search_query = _websearch_query_after(reply_content, marker_idx)
+            print(f"🔍 Web search triggered by AI response: {web_search_query}")
+            # Remove the WEBSEARCH_QUERY from the response
+            reply_content = reply_content[:marker_idx].strip()
+    
+        # Structure formatting, question separation and BP sequence validation are pure
+        # string work; run them off the event loop so other chats keep being served.
+        # Sequence validation runs here — while session["asked_q"] still holds the question
+        # the user just answered — see _structure_and_validate_reply.
+        reply_content = await asyncio.to_thread(
+            _structure_and_validate_reply, reply_content, session_data, bp_answered_question_num
+        )
+
+        # Extract the (now validated) question tag from reply and update session data.
+        tag_match = _Q_TAG_RE.search(reply_content)
+        new_question_tag = None
+        if tag_match and session_data:
+            raw_tag = tag_match.group(1)
+            phase_part, num_part = raw_tag.split(".", 1)
+            phase_up = phase_part.upper()
+            try:
+                qn = int(num_part)
+            except ValueError:
+                qn = 0
+            if phase_up == "BUSINESS_PLAN":
+                new_question_tag = f"BUSINESS_PLAN.{qn:02d}"
+            else:
+                new_question_tag = f"{phase_up}.{num_part}"
+            current_asked_q = session_data.get("asked_q", "")
+
+            if new_question_tag != current_asked_q:
+                session_data["asked_q"] = new_question_tag
+                patch_session["asked_q"] = new_question_tag
+                logger.debug("Updating session asked_q: %s -> %s", current_asked_q, new_question_tag)
+    
+        reply_content, auto_research_triggered, detected_tag = await apply_business_plan_auto_research(
+            reply_content,
+            session_data,
+            history,
+            # Accept advances the questionnaire — still inject research for the next auto-research tag.
+            is_command_response=is_command_response and not is_accept_command,
+        )
+
+        # Strip sections the model adds for specific questions despite the prompt:
+        # Q11 sub-instruction lines and placeholder competitors, Q12 fake trends, Q26
+        # "Competitive Landscape" (permits research lists service providers), Q27 market
+        # data and Q35 "Sub-questions covered".
+        for pattern, replacement in _TAG_CLEANUP_PATTERNS.get(detected_tag, ()):
+            reply_content = pattern.sub(replacement, reply_content)
+
+        # Clean up excessive blank lines (3+ newlines → 2)
+        reply_content = _BLANK_LINE_RUN_RE.sub('\n\n', reply_content)
+
+        # (BP sequence validation now runs earlier — before asked_q is derived — so the
+        # corrected tag drives asked_q. See the note above the tag-extraction block.)
+
+        # Fix verification flow to separate verification from next question
+        # reply_content = fix_verification_flow(reply_content, session_data)
+    
+        # Prevent AI from molding user answers without verification
+        reply_content = prevent_ai_molding(reply_content, session_data)
+    
+        # Add critiquing insights based on user's business field
+        reply_content = await add_critiquing_insights(reply_content, session_data, user_content)
+    
+        # Suggest using Draft if user has already provided relevant information
+        reply_content = suggest_draft_if_relevant(reply_content, session_data, user_content, history)
+    
+        # Add proactive support guidance based on identified areas needing help
+        reply_content = add_proactive_support_guidance(reply_content, session_data, history)
+    
+    # Ensure proper question formatting with line breaks and structure
+    reply_content = ensure_proper_question_formatting(reply_content, session_data)
+    reply_content = await personalize_business_question(reply_content, history, session_data)
+
+    # Check if we're in "missing questions mode" and handle question progression correctly
+    # CRITICAL: After answering a missing question, jump to NEXT missing question (not sequential)
+    # After all missing questions are answered, continue sequentially with remaining questions
+    business_context = (session_data or {}).get("business_context") or {}
+    if not isinstance(business_context, dict):
+        business_context = {}
+    uploaded_plan_mode = business_context.get("uploaded_plan_mode", False)
+    missing_questions = business_context.get("missing_questions") or []
+    
+    if in_business_plan and uploaded_plan_mode:
+        # Ensure missing_questions is a sorted list (the upload flow stores it sorted;
+        # older sessions may not have)
+        if not isinstance(missing_questions, list):
+            missing_questions = []
+        elif any(a >= b for a, b in zip(missing_questions, missing_questions[1:])):
+            missing_questions = sorted(set(missing_questions))
+        
+        current_tag = session_data.get("asked_q", "")
+
+        # Highest BUSINESS_PLAN question shown so far, kept on business_context so the
+        # sequential resume below is O(1). Sessions that predate the counter backfill it
+        # once from the history the router already loaded for this turn.
+        max_answered_q = business_context.get("max_answered_q")
+        if max_answered_q is None:
+            history_for_max = history
+            if not history_for_max and session_data.get("session_id"):
+                from services.chat_service import fetch_chat_history
+                history_for_max = await fetch_chat_history(session_data["session_id"])
+            max_answered_q = 0
+            for msg in history_for_max or []:
+                if msg.get("role") == "assistant":
+                    q_match = _BP_TAG_RE.search(msg.get("content", ""))
+                    if q_match:
+                        max_answered_q = max(max_answered_q, int(q_match.group(1)))
+        # The question shown on the previous turn is the one the user is answering now.
+        max_answered_q = max(max_answered_q, _parse_business_plan_tag_number(current_tag_before_update) or 0)
+        if business_context.get("max_answered_q") != max_answered_q:
+            business_context["max_answered_q"] = max_answered_q
+            session_data["business_context"] = business_context
+            patch_session["business_context"] = business_context
         
         # Check if user just answered a missing question
         if current_tag and current_tag.startswith("BUSINESS_PLAN."):
@@ -5028,15 +5268,15 @@ CRITICAL INSTRUCTIONS:
                 current_q_num = int(current_tag.split(".")[1])
                 
                 # Detect if this is a user answer (not a command)
-                is_answer = (len(user_content.strip()) > 0 and 
-                            not user_content.lower().strip() in ("support", "draft", "scrapping", "scraping", "accept", "modify", "kickstart", "draft more") and
-                            not user_content.lower().startswith(("support", "draft", "scrapping", "scraping", "accept", "modify", "kickstart")))
+                uc_low = user_content.strip().lower()
+                is_answer = bool(uc_low) and uc_low not in _COMMAND_WORDS and not uc_low.startswith(_COMMAND_PREFIXES)
                 
                 # If user just answered a missing question, remove it from list and jump to next missing
-                if is_answer and current_q_num in missing_questions:
-                    missing_questions = [q for q in missing_questions if q != current_q_num]
-                    print(f"✅ User answered missing question Q{current_q_num} - removed from missing list")
-                    print(f"📋 Remaining missing questions: {missing_questions}")
+                answered_idx = bisect.bisect_left(missing_questions, current_q_num)
+                if is_answer and answered_idx < len(missing_questions) and missing_questions[answered_idx] == current_q_num:
+                    del missing_questions[answered_idx]
+                    logger.debug("User answered missing question Q%s - removed from missing list", current_q_num)
+                    logger.debug("Remaining missing questions: %s", missing_questions)
                     
                     # Update business_context with updated missing_questions list
                     business_context["missing_questions"] = missing_questions
@@ -5045,56 +5285,38 @@ CRITICAL INSTRUCTIONS:
                     
                     # If there are more missing questions, jump to the next one
                     if missing_questions:
-                        next_missing_q = min(missing_questions)
+                        next_missing_q = missing_questions[0]
                         next_tag = f"BUSINESS_PLAN.{next_missing_q:02d}"
                         
-                        print(f"🎯 Jumping to next missing question: Q{next_missing_q}")
-                        print(f"📋 Remaining missing questions: {sorted(missing_questions)}")
+                        logger.debug("Jumping to next missing question: Q%s", next_missing_q)
+                        logger.debug("Remaining missing questions: %s", missing_questions)
                         
                         # Check if AI generated a tag in the reply - if so, replace it
-                        tag_match = re.search(r'\[\[Q:BUSINESS_PLAN\.(\d+)\]\]', reply_content)
+                        tag_match = _BP_TAG_RE.search(reply_content)
                         if tag_match:
                             # Replace AI's tag with next missing question tag
-                            reply_content = re.sub(
-                                r'\[\[Q:BUSINESS_PLAN\.\d+\]\]',
-                                f'[[Q:{next_tag}]]',
-                                reply_content,
-                                count=1
-                            )
-                            print(f"✅ Replaced AI tag with next missing question tag: {next_tag}")
+                            reply_content = _BP_TAG_ANY_RE.sub(f'[[Q:{next_tag}]]', reply_content, count=1)
+                            logger.debug("Replaced AI tag with next missing question tag: %s", next_tag)
                         
                         # Update session to jump to next missing question
-                        if "patch_session" not in locals():
-                            patch_session = {}
                         patch_session["asked_q"] = next_tag
                         patch_session["business_context"] = business_context
                         session_data["asked_q"] = next_tag
                         
                     else:
                         # All missing questions answered - continue sequentially
-                        print(f"🎉 All missing questions answered! Continuing with remaining questions sequentially.")
+                        logger.debug("All missing questions answered - continuing with remaining questions sequentially")
                         
-                        # Find the highest answered question number from history
-                        from services.chat_service import fetch_chat_history
-                        history_for_max = await fetch_chat_history(session_data.get("session_id", "")) if session_data.get("session_id") else []
-                        max_answered = 0
-                        for msg in history_for_max:
-                            if msg.get("role") == "assistant":
-                                content = msg.get("content", "")
-                                q_match = re.search(r'\[\[Q:BUSINESS_PLAN\.(\d+)\]\]', content)
-                                if q_match:
-                                    q_num = int(q_match.group(1))
-                                    max_answered = max(max_answered, q_num)
+                        # Highest question shown so far (tracked above)
+                        max_answered = max_answered_q
                         
                         # Next question should be max_answered + 1, but not exceed 45
                         next_sequential = min(max_answered + 1, 46)
                         next_tag = f"BUSINESS_PLAN.{next_sequential:02d}"
                         
-                        print(f"🎯 All missing questions done - continuing sequentially from Q{next_sequential}")
+                        logger.debug("All missing questions done - continuing sequentially from Q%s", next_sequential)
                         
                         # Update session to continue sequentially
-                        if "patch_session" not in locals():
-                            patch_session = {}
                         patch_session["asked_q"] = next_tag
                         # Clear uploaded_plan_mode since we're done with missing questions
                         business_context["uploaded_plan_mode"] = False
@@ -5105,41 +5327,34 @@ CRITICAL INSTRUCTIONS:
                 
                 # If AI is trying to ask a question that's NOT in missing list (and we still have missing questions)
                 elif missing_questions:
-                    tag_match = re.search(r'\[\[Q:BUSINESS_PLAN\.(\d+)\]\]', reply_content)
+                    tag_match = _BP_TAG_RE.search(reply_content)
                     if tag_match:
                         ai_question_num = int(tag_match.group(1))
                         
                         # If AI is asking a question not in missing list, redirect to next missing
                         if ai_question_num not in missing_questions:
-                            next_missing_q = min(missing_questions)
+                            next_missing_q = missing_questions[0]
                             next_tag = f"BUSINESS_PLAN.{next_missing_q:02d}"
                             
-                            print(f"🎯 AI tried to ask Q{ai_question_num} (not in missing list) - redirecting to next missing Q{next_missing_q}")
-                            print(f"📋 Remaining missing questions: {sorted(missing_questions)}")
+                            logger.debug("AI tried to ask Q%s (not in missing list) - redirecting to next missing Q%s", ai_question_num, next_missing_q)
+                            logger.debug("Remaining missing questions: %s", missing_questions)
                             
                             # Replace tag in reply
-                            reply_content = re.sub(
-                                r'\[\[Q:BUSINESS_PLAN\.\d+\]\]',
-                                f'[[Q:{next_tag}]]',
-                                reply_content,
-                                count=1
-                            )
+                            reply_content = _BP_TAG_ANY_RE.sub(f'[[Q:{next_tag}]]', reply_content, count=1)
                             
                             # Update session
-                            if "patch_session" not in locals():
-                                patch_session = {}
                             patch_session["asked_q"] = next_tag
                             patch_session["business_context"] = business_context
                             session_data["asked_q"] = next_tag
                             session_data["business_context"] = business_context
                             
-                            print(f"✅ Redirected to Q{next_missing_q}")
+                            logger.debug("Redirected to Q%s", next_missing_q)
             except (ValueError, IndexError) as e:
-                print(f"⚠️ Error parsing question number: {e}")
+                logger.warning("Error parsing question number: %s", e)
 
     end_time = time.time()
     response_time = end_time - start_time
-    print(f"⏱️ Angel reply generated in {response_time:.2f} seconds")
+    logger.info("Angel reply generated in %.2f seconds", response_time)
     
     # Keep Supabase business_context in sync with answers captured in history
     should_update_context = (
@@ -5153,30 +5368,56 @@ CRITICAL INSTRUCTIONS:
             "ROADMAP_GENERATED",
         ]
     )
+    # Fast path: the explicit tag, a section summary or an auto-research turn all end up
+    # with buttons shown, so skip the detector's heuristics for those replies.
+    buttons_forced = bool(
+        auto_research_triggered
+        or section_summary_info
+        or "[[ACCEPT_MODIFY_BUTTONS]]" in reply_content
+    )
+    # Button detection only reads the final reply, and the history scan is pure CPU, so
+    # run the scan in a worker thread while the detector runs instead of back to back.
+    if buttons_forced:
+        button_detection = {"show_buttons": True, "content_length": len(reply_content)}
+        extracted_context = (
+            await asyncio.to_thread(extract_business_context_from_history, history)
+            if should_update_context
+            else None
+        )
+    elif should_update_context:
+        button_detection, extracted_context = await asyncio.gather(
+            should_show_accept_modify_buttons(reply_content, user_content, session_data),
+            asyncio.to_thread(extract_business_context_from_history, history),
+            return_exceptions=True,
+        )
+    else:
+        button_detection = await should_show_accept_modify_buttons(reply_content, user_content, session_data)
+        extracted_context = None
+    if isinstance(button_detection, BaseException):
+        raise button_detection
+
     if should_update_context:
         try:
-            extracted_context = extract_business_context_from_history(history) or {}
+            if isinstance(extracted_context, BaseException):
+                raise extracted_context
+            extracted_context = extracted_context or {}
             if extracted_context:
-                existing_context = session_data.get("business_context") or {}
+                existing_context = session_data.get("business_context")
                 if not isinstance(existing_context, dict):
                     existing_context = {}
-                updated_context = existing_context.copy()
-                changed = False
+                diff = {}
                 for key, value in extracted_context.items():
                     if isinstance(value, str):
                         value = value.strip()
-                    if value and updated_context.get(key) != value:
-                        updated_context[key] = value
-                        changed = True
-                if changed:
-                    session_data["business_context"] = updated_context
-                    patch_session["business_context"] = updated_context
+                    if value and existing_context.get(key) != value:
+                        diff[key] = value
+                if diff:
+                    existing_context.update(diff)
+                    session_data["business_context"] = existing_context
+                    patch_session["business_context"] = existing_context
         except Exception as exc:
             print(f"⚠️ Failed to update business context: {exc}")
     
-    # Use AI to determine if Accept/Modify buttons should be shown (pass session_data)
-    button_detection = await should_show_accept_modify_buttons(reply_content, user_content, session_data)
-    
     # FORCE show Accept/Modify buttons when auto-research was triggered
     # Auto-research responses always need user confirmation before proceeding
     if auto_research_triggered:
@@ -5216,7 +5457,7 @@ CRITICAL INSTRUCTIONS:
         "reply": reply_content,
         "web_search_status": web_search_status,
         "immediate_response": immediate_response,
-        "patch_session": patch_session if patch_session else None,
+        "patch_session": _net_session_patch(patch_session, session_fields_before),
         "show_accept_modify": button_detection.get("show_buttons", False),
         "is_auto_research": is_auto_research,
     }
@@ -5326,7 +5567,7 @@ def _extract_topline_question(full_message: str) -> str:
         return full_message or ""
     
     # Remove question tags
-    cleaned = re.sub(r'\[\[Q:[A-Z_]+\.\d+\]\]', '', full_message).strip()
+    cleaned = _Q_ANY_RE.sub('', full_message).strip()
     
     # Split into lines and find the main question
     lines = cleaned.split('\n')
@@ -5373,6 +5614,40 @@ def _extract_topline_question(full_message: str) -> str:
     return result
 
 
+# Draft research depends only on the query (industry, idea, question topic and
+# location), so repeat Draft clicks and other sessions in the same niche reuse it.
+DRAFT_RESEARCH_CACHE_TTL_SECONDS = 24 * 60 * 60
+_DRAFT_RESEARCH_CACHE_BUCKET = "draft_research_v1"
+_DRAFT_RESEARCH_CACHE = BoundedCache(maxsize=256, ttl_seconds=DRAFT_RESEARCH_CACHE_TTL_SECONDS)
+
+
+async def _get_draft_research(research_query: str):
+    from services.research_cache_service import build_cache_key, get_cached_entry, set_cached_entry
+
+    cache_key = build_cache_key(research_query)
+    research_results = _DRAFT_RESEARCH_CACHE.get(cache_key)
+    if research_results is not None:
+        return research_results
+
+    research_results = await asyncio.to_thread(get_cached_entry, _DRAFT_RESEARCH_CACHE_BUCKET, cache_key)
+    if isinstance(research_results, str) and research_results:
+        logger.debug("Using cached draft research for: %s", research_query[:50])
+        _DRAFT_RESEARCH_CACHE.set(cache_key, research_results)
+        return research_results
+
+    research_results = await conduct_web_search(research_query)
+    if is_valid_research_result(research_results):
+        _DRAFT_RESEARCH_CACHE.set(cache_key, research_results)
+        await asyncio.to_thread(
+            set_cached_entry,
+            _DRAFT_RESEARCH_CACHE_BUCKET,
+            cache_key,
+            research_results,
+            ttl_seconds=DRAFT_RESEARCH_CACHE_TTL_SECONDS,
+        )
+    return research_results
+
+
 async def handle_draft_command(reply, history, session_data=None):
     """Handle the Draft command with comprehensive response generation"""
     from utils.business_context import is_meaningful_context_value, prompt_labels
@@ -5430,10 +5705,10 @@ async def handle_draft_command(reply, history, session_data=None):
             if is_meaningful_context_value(p)
         ]
         research_query = " ".join(research_parts) + " data statistics 2024"
-        print(f"🔍 Draft command - Conducting research: {research_query}")
-        research_results = await conduct_web_search(research_query)
+        logger.debug("Draft command - conducting research: %s", research_query)
+        research_results = await _get_draft_research(research_query)
     elif should_use_web_research_for_draft(asked_q):
-        print("⏱️ Draft command - Skipping research due to throttling (reducing latency)")
+        logger.debug("Draft command - skipping research due to throttling")
 
     is_business_name_question = bool(
         question_meta and question_meta.is_business_name_question
@@ -5466,7 +5741,7 @@ def get_current_question_context(history, session_data=None):
     # First, try to get current question from session data if available
     if session_data and session_data.get('asked_q'):
         asked_q = session_data.get('asked_q')
-        print(f"🔍 DEBUG - Found current question from session: {asked_q}")
+        logger.debug("Found current question from session: %s", asked_q)
         
         # Look for the actual question content in recent history that matches this question tag
         for msg in reversed(history[-10:]):  # Look at last 10 messages
@@ -5474,11 +5749,11 @@ def get_current_question_context(history, session_data=None):
                 content = msg['content']
                 # Check if this message contains the current question tag
                 if f'[[Q:{asked_q}]]' in content:
-                    print(f"🔍 DEBUG - Found matching question content for {asked_q}")
+                    logger.debug("Found matching question content for %s", asked_q)
                     return content
         
         # If no matching content found, return the question tag for context
-        print(f"🔍 DEBUG - No matching content found, returning question tag: {asked_q}")
+        logger.debug("No matching content found, returning question tag: %s", asked_q)
         return f"Current question: {asked_q}"
     
     # Fallback: Look for the most recent assistant message that contains a question tag
@@ -5491,11 +5766,25 @@ def get_current_question_context(history, session_data=None):
             # Look for question tags or question indicators
             if '[[' in content and ']]' in content and any(indicator in content for indicator in ['what', 'how', 'when', 'where', 'why', 'do you', 'are you', 'can you']):
                 question_text = content
-                print(f"🔍 DEBUG - Found current question from history: {question_text[:200]}...")
+                logger.debug("Found current question from history: %.200s...", question_text)
                 return question_text
-    print("🔍 DEBUG - No question found in recent history")
+    logger.debug("No question found in recent history")
     return ""
 
+# Drafts are grounded entirely in the built messages, so a key over the full prompt
+# only hits when venture answers, question, research and mode are all unchanged.
+# L1 is per-worker; L2 is the shared Supabase research cache so other workers and
+# restarts reuse the same draft.
+_DRAFT_MODEL = os.getenv("DRAFT_MODEL", "gpt-4o-mini")
+# Fail fast on a slow or failing model: no SDK retries, a hard per-draft deadline,
+# and after 5 consecutive failures skip the call for 30s and return the fallback.
+DRAFT_TIMEOUT_SECONDS = 20.0
+_DRAFT_BREAKER = CircuitBreaker(fail_max=5, reset_timeout=30.0)
+DRAFT_CACHE_TTL_SECONDS = 4 * 60 * 60
+_DRAFT_CACHE_BUCKET = "draft_content_v1"
+_DRAFT_CACHE = BoundedCache(maxsize=1024, ttl_seconds=DRAFT_CACHE_TTL_SECONDS)
+
+
 async def generate_draft_content(
     *,
     venture,
@@ -5506,7 +5795,6 @@ async def generate_draft_content(
     expand_existing: bool = False,
 ):
     """Generate draft content using authoritative questionnaire context (same grounding path as Modify)."""
-    from utils.business_context import is_meaningful_context_value
     from services.business_plan_draft_service import (
         build_draft_messages,
         resolve_draft_mode,
@@ -5526,17 +5814,54 @@ async def generate_draft_content(
         word_limit=COMMAND_ASSIST_MAX_WORDS,
         expand_existing=expand_existing,
     )
-    max_tokens = 32 if draft_mode == "business_name" else 800
+    # Prose drafts are cut to COMMAND_ASSIST_MAX_WORDS, so cap generation at that budget.
+    max_tokens = 32 if draft_mode == "business_name" else COMMAND_ASSIST_MAX_TOKENS
 
-    try:
-        response = await client.chat.completions.create(
-            model="gpt-4o",
+    from services.research_cache_service import build_cache_key, get_cached_entry, set_cached_entry
+
+    cache_key = build_cache_key(_DRAFT_MODEL, max_tokens, messages)
+    cached_draft = _DRAFT_CACHE.get(cache_key)
+    if cached_draft is None:
+        cached_draft = await asyncio.to_thread(get_cached_entry, _DRAFT_CACHE_BUCKET, cache_key)
+        if isinstance(cached_draft, str) and cached_draft:
+            _DRAFT_CACHE.set(cache_key, cached_draft)
+        else:
+            cached_draft = None
+    if cached_draft is not None:
+        logger.debug("Using cached draft for %s", asked_q or "current question")
+        return cached_draft
+
+    if not _DRAFT_BREAKER.allow():
+        logger.warning("Draft model circuit open - returning fallback draft without a model call")
+        return _draft_fallback_text(business_idea)
+
+    async def _request_draft() -> str:
+        draft_client = client.with_options(max_retries=0, timeout=DRAFT_TIMEOUT_SECONDS)
+        if draft_mode == "business_name":
+            response = await draft_client.chat.completions.create(
+                model=_DRAFT_MODEL,
+                messages=messages,
+                temperature=0.3,
+                max_tokens=max_tokens,
+            )
+            return response.choices[0].message.content or ""
+        stream = await draft_client.chat.completions.create(
+            model=_DRAFT_MODEL,
             messages=messages,
             temperature=0.3,
             max_tokens=max_tokens,
+            stream=True,
         )
+        return await _collect_streamed_words(stream, COMMAND_ASSIST_MAX_WORDS)
 
-        ai_draft = response.choices[0].message.content or ""
+    try:
+        try:
+            # The SDK timeout covers each request; wait_for also bounds a stalled stream.
+            ai_draft = await asyncio.wait_for(_request_draft(), timeout=DRAFT_TIMEOUT_SECONDS)
+        except Exception:
+            _DRAFT_BREAKER.record_failure()
+            raise
+        _DRAFT_BREAKER.record_success()
         ai_draft = _strip_followup_prompts(ai_draft)
         ai_draft = _strip_draft_transition_bleed(ai_draft)
 
@@ -5550,23 +5875,38 @@ async def generate_draft_content(
 
         validation_error = validate_draft_output(ai_draft, asked_q=asked_q)
         if validation_error:
-            print(f"⚠️ Draft rejected: {validation_error}")
+            logger.warning("Draft rejected: %s", validation_error)
             return validation_error
 
-        word_count = len(ai_draft.split())
-        print(
-            f"✅ Draft content generated with {len(ai_draft)} characters ({word_count} words)"
-            f"{' (with research)' if research_results else ''}"
+        logger.debug(
+            "Draft content generated with %d characters (%d words)%s",
+            len(ai_draft),
+            len(ai_draft.split()),
+            " (with research)" if research_results else "",
+        )
+        _DRAFT_CACHE.set(cache_key, ai_draft)
+        await asyncio.to_thread(
+            set_cached_entry,
+            _DRAFT_CACHE_BUCKET,
+            cache_key,
+            ai_draft,
+            ttl_seconds=DRAFT_CACHE_TTL_SECONDS,
         )
         return ai_draft
     except Exception as e:
-        print(f"❌ AI draft generation failed: {e}")
-        if is_meaningful_context_value(business_idea):
-            return (
-                f"Based on your business idea — {business_idea[:300]} — "
-                "here is a starting point for this question. Please personalize it further."
-            )
-        return "I couldn't generate a draft right now. Please try again or answer in your own words."
+        logger.warning("AI draft generation failed: %s", e)
+        return _draft_fallback_text(business_idea)
+
+
+def _draft_fallback_text(business_idea: str) -> str:
+    from utils.business_context import is_meaningful_context_value
+
+    if is_meaningful_context_value(business_idea):
+        return (
+            f"Based on your business idea — {business_idea[:300]} — "
+            "here is a starting point for this question. Please personalize it further."
+        )
+    return "I couldn't generate a draft right now. Please try again or answer in your own words."
 
 async def handle_scrapping_command(reply, notes, history, session_data=None):
     """Refine founder notes for the active Business Plan question (registry-grounded)."""
@@ -5574,7 +5914,7 @@ async def handle_scrapping_command(reply, notes, history, session_data=None):
     from services.business_plan_scrapping_service import run_scrapping_refinement
 
     asked_q = (session_data or {}).get("asked_q", "")
-    print(f"🔍 Scrapping command for {asked_q} with notes_len={len((notes or '').strip())}")
+    logger.debug("Scrapping command for %s with notes_len=%d", asked_q, len((notes or '').strip()))
 
     scrapping_content = await run_scrapping_refinement(
         session_data=session_data,
@@ -5586,212 +5926,75 @@ async def handle_scrapping_command(reply, notes, history, session_data=None):
         should_conduct_web_search=should_conduct_web_search,
         openai_client=client,
         word_limit=COMMAND_ASSIST_MAX_WORDS,
+        collect_streamed_words=_collect_streamed_words,
     )
     scrapping_content = truncate_to_word_limit(scrapping_content, COMMAND_ASSIST_MAX_WORDS)
 
     scrapping_response = cap_full_command_assist_reply(
         f"Here's a refined version of your thoughts:\n\n{scrapping_content}\n\n"
     )
-    print(f"🔍 Scrapping response generated (capped), length: {len(scrapping_response)}")
+    logger.debug("Scrapping response generated (capped), length: %d", len(scrapping_response))
     return {
         "reply": scrapping_response,
         "web_search_status": {"is_searching": False, "query": None, "completed": False},
         "immediate_response": None,
     }
 
-async def refine_user_input(user_notes, business_context, current_question=""):
-    """Refine user's actual input instead of generating generic content"""
-    business_name = business_context.get("business_name", "your business")
-    industry = business_context.get("industry", "your industry")
-    business_type = business_context.get("business_type", "your business type")
-    location = business_context.get("location", "your location")
-    
-    print(f"🔍 DEBUG - Refining user input: '{user_notes}' for {business_name}")
-    
-    # Clean up the user's notes
-    cleaned_notes = user_notes.strip()
-    
-    # Use AI to refine and expand on user's input with proper context
-    refine_prompt = f"""
-    ⚠️ CRITICAL CONTEXT - READ FIRST:
-        This business is in the {industry.upper()} INDUSTRY operating as a {business_type.upper()}.
-    ALL refinements must be 100% specific to {industry.upper()} businesses - NOT education, NOT technology, NOT consulting.
-    Use ONLY {industry.upper()} industry examples, insights, and terminology.
-    
-    Take this user's rough notes/ideas and refine them into a comprehensive, well-structured answer for the question: "{current_question}"
-
-    ⚠️ ACTIVE QUESTION RELEVANCE (MANDATORY): Your entire refinement must address ONLY the question above. Do NOT pivot to other Business Plan questions, later phases, or off-agenda themes. Every paragraph must tie back to the active questionnaire step.
 
-    User's Notes/Ideas:
-    "{cleaned_notes}"
-    
-    Business Context (PRIMARY IDENTIFIERS):
-    - Business Name: {business_name}
-    - PRIMARY INDUSTRY: {industry.upper()} ⭐ (THIS IS THE CORE BUSINESS TYPE)
-    - Business Structure: {business_type}
-    - Location: {location}
-    
-    Your task:
-        1. Take the user's rough ideas and refine them into polished, professional content for a {industry.upper()} business
-    2. Expand on their ideas with industry-specific insights for {industry.upper()} only
-    3. Add relevant details and context appropriate for a {business_type} in {location}
-    4. Structure the content clearly with sections and bullet points
-    5. Keep the user's core ideas but make them more comprehensive and actionable
-    6. Add strategic recommendations that build on their initial thoughts
-    7. ⚠️ CRITICAL WORD LIMIT: Your entire refinement MUST be {COMMAND_ASSIST_MAX_WORDS} words or fewer.
-    8. NEVER mentions unrelated industries - stay focused on {industry.upper()}
-    
-    Use at most two short headings plus bullets if needed; stay within the word limit.
-    REMEMBER: This is a {industry.upper()} business - all refinements must be relevant to {industry.upper()}.
-    """
-    
-    try:
-        response = await client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "user", "content": refine_prompt}],
-            temperature=0.3,
-            max_tokens=800
-        )
-        
-        refined_content = response.choices[0].message.content
-        refined_content = truncate_to_word_limit(refined_content, COMMAND_ASSIST_MAX_WORDS)
-        word_count = len(refined_content.split())
-        print(f"🔍 DEBUG - AI-refined content length: {len(refined_content)} characters ({word_count} words)")
-        return refined_content
-    except Exception as e:
-        print(f"AI refinement failed: {e}, falling back to basic refinement")
-        # Fallback to basic refinement if AI fails
-        if len(cleaned_notes) < 50:
-            return f"""Based on your input "{cleaned_notes}", here's a refined version:
-
-**Core Concept:**
-{cleaned_notes}
-
-**Refined Analysis:**
-For {business_name} in the {industry} sector, this concept can be developed into a strategic approach that aligns with your {business_type} business model.
-
-**Key Considerations:**
-• Strategic alignment with your business goals
-• Customer value proposition
-• Implementation requirements
-• Resource needs
-
-**Next Steps:**
-• Define specific implementation details
-• Identify potential challenges
-• Develop action plan"""
-        
-        # For longer notes, provide a concise refinement
-        return f"""Based on your detailed input, here's a refined version:
-
-**Your Core Idea:**
-{cleaned_notes}
-
-**Refined Analysis:**
-This concept shows strong potential for {business_name} in the {industry} sector. The approach aligns well with {business_type} business models and can provide significant value to your target market in {location}.
-
-**Strategic Recommendations:**
-• Focus on core value proposition
-• Identify key implementation steps
-• Consider market positioning
-• Plan for scalability
-
-**Implementation Focus:**
-• Define specific deliverables
-• Establish success metrics
-• Create timeline for execution"""
-
-async def generate_scrapping_content(history, business_context, notes, current_question=""):
-    """Generate concise scrapping content based on conversation history and research notes"""
-    # Extract business context
-    business_name = business_context.get("business_name", "your business")
-    industry = business_context.get("industry", "your industry")
-    business_type = business_context.get("business_type", "your business type")
-    location = business_context.get("location", "your location")
-    
-    # Extract previous answers from history for better context
-    previous_answers = []
-    for msg in history[-10:]:
-        if msg.get('role') == 'user' and len(msg.get('content', '')) > 20:
-            content = msg.get('content', '')
-            # Skip command words
-            if content.lower() not in ['support', 'draft', 'scrapping', 'scraping', 'accept', 'modify']:
-                previous_answers.append(content[:200])
-    
-    # Use AI to generate comprehensive scrapping analysis
-    scrapping_prompt = f"""
-    ⚠️ CRITICAL CONTEXT - READ FIRST:
-        This business is in the {industry.upper()} INDUSTRY operating as a {business_type.upper()}.
-    ALL analysis must be 100% specific to {industry.upper()} businesses - NOT education, NOT technology, NOT consulting.
-    Use ONLY {industry.upper()} industry examples, trends, and insights.
-    
-    Generate a comprehensive, refined analysis that helps answer this business question: "{current_question}"
+# Support research is a long gpt-4o call; cap how many run at once per worker so a
+# burst of Support clicks queues instead of tripping the per-minute rate limit.
+_SUPPORT_RESEARCH_SEMAPHORE = asyncio.Semaphore(5)
+
+# Final Support replies keyed on question, research query and venture context, so
+# a repeat click with unchanged answers skips both the research and Support calls.
+_SUPPORT_REPLY_CACHE = BoundedCache(maxsize=1024, ttl_seconds=60 * 60)
+
+# With SUPPORT_PREFETCH_DRAFT=1, Support starts the Draft Answer draft for the same
+# question alongside its own research and model call. The draft lands in _DRAFT_CACHE;
+# this cache only holds the in-flight task so a Draft Answer click that arrives before
+# it finishes waits for it instead of sending a duplicate request. Off by default: every
+# Support click would pay for a draft the user may never ask for, and the in-flight
+# task is per worker, so it only helps when Draft Answer reaches the same worker.
+SUPPORT_PREFETCH_DRAFT = os.getenv("SUPPORT_PREFETCH_DRAFT", "0") == "1"
+_DRAFT_ANSWER_PREFETCHES = BoundedCache(maxsize=1024, ttl_seconds=10 * 60)
+
+
+def _draft_answer_prefetch_key(session_data, asked_q):
+    session_id = (session_data.get("id") or session_data.get("session_id")) if session_data else None
+    return (session_id, asked_q) if session_id and asked_q else None
+
+
+def _start_draft_answer_prefetch(venture, asked_q, session_data):
+    key = _draft_answer_prefetch_key(session_data, asked_q)
+    if not SUPPORT_PREFETCH_DRAFT or key is None or not venture.has_anchor_idea():
+        return
+    existing = _DRAFT_ANSWER_PREFETCHES.get(key)
+    if existing is not None and not existing.done():
+        return
+    _DRAFT_ANSWER_PREFETCHES.set(
+        key,
+        asyncio.create_task(
+            generate_draft_content(
+                venture=venture,
+                asked_q=asked_q,
+                research_results=None,
+                thought_starters=get_thought_starters_for_tag(asked_q),
+                expand_existing=True,
+            )
+        ),
+    )
 
-    ⚠️ ACTIVE QUESTION RELEVANCE (MANDATORY): The entire analysis must serve ONLY the question above. Do NOT introduce themes that belong to other Business Plan questions, later phases, or unrelated topics. Every section must directly help the user answer this active questionnaire step.
 
-    Business Context (PRIMARY IDENTIFIERS):
-    - Business Name: {business_name}
-    - PRIMARY INDUSTRY: {industry.upper()} ⭐ (THIS IS THE CORE BUSINESS TYPE)
-    - Business Structure: {business_type}
-    - Location: {location}
-    
-    Previous Context:
-    {' | '.join(previous_answers[-3:]) if previous_answers else 'No previous context available'}
-    
-    Research Notes (if provided):
-    {notes if notes else 'No specific research notes provided'}
-    
-    Create a detailed, refined analysis that:
-        1. Synthesizes relevant information from the {industry.upper()} business context
-    2. Provides industry-specific insights for the {industry.upper()} sector only
-    3. Considers market dynamics in {location}
-    4. Offers strategic recommendations appropriate for a {business_type}
-    5. Includes current {industry.upper()} industry trends and best practices (2024-2025)
-    6. Provides actionable next steps
-    7. ⚠️ CRITICAL WORD LIMIT: Your entire analysis MUST be {COMMAND_ASSIST_MAX_WORDS} words or fewer.
-    8. NEVER mentions unrelated industries - stay focused on {industry.upper()}
-    
-    Prefer one short overview plus 2–4 bullets; skip extra section headings if they push you over the limit.
-    REMEMBER: This is a {industry.upper()} business - all analysis must be relevant to {industry.upper()}.
-    """
-    
+async def _await_draft_answer_prefetch(session_data, asked_q):
+    key = _draft_answer_prefetch_key(session_data, asked_q)
+    prefetch = _DRAFT_ANSWER_PREFETCHES.pop(key) if key is not None else None
+    if prefetch is None:
+        return
     try:
-        response = await client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "user", "content": scrapping_prompt}],
-            temperature=0.3,
-            max_tokens=800
-        )
-        
-        scrapping_content = response.choices[0].message.content
-        scrapping_content = truncate_to_word_limit(scrapping_content, COMMAND_ASSIST_MAX_WORDS)
-        word_count = len(scrapping_content.split())
-        print(f"🔍 DEBUG - AI-generated scrapping content length: {len(scrapping_content)} characters ({word_count} words)")
-        return scrapping_content
+        await prefetch
     except Exception as e:
-        print(f"AI scrapping generation failed: {e}, falling back to basic analysis")
-        # Fallback to basic analysis
-        return f"""Based on your business context, here's a refined analysis for {business_name}:
-
-**Business Overview:**
-{business_name} operates in the {industry} sector as a {business_type} business located in {location}.
-
-**Key Focus Areas:**
-• Market positioning in the {industry} sector
-• Customer value proposition development
-• Operational efficiency and scalability
-• Competitive differentiation strategies
-
-**Strategic Recommendations:**
-• Focus on core strengths and unique value propositions
-• Develop targeted customer acquisition strategies
-• Implement efficient operational processes
-• Build sustainable competitive advantages
-
-**Next Steps:**
-• Define specific implementation priorities
-• Identify key success metrics
-• Create actionable development timeline"""
+        logger.warning("Prefetched Draft Answer failed: %s", e)
+
 
 async def handle_support_command(reply, history, session_data=None):
     """Handle the Support command with aggressive web search research"""
@@ -5814,6 +6017,7 @@ async def handle_support_command(reply, history, session_data=None):
         get_answer_for_tag=get_tagged_answer_for_question_tag,
     )
     business_context = venture.as_dict()
+    _start_draft_answer_prefetch(venture, asked_q, session_data)
 
     # Get current question context for more targeted responses
     current_question = get_current_question_context(history, session_data)
@@ -5828,7 +6032,7 @@ async def handle_support_command(reply, history, session_data=None):
     research_focus = (
         question_meta.objective if question_meta else "business planning"
     )
-    current_year = datetime.now().year
+    current_year = _current_year()
     previous_year = current_year - 1
     primary_location = location or ""
 
@@ -5836,10 +6040,20 @@ async def handle_support_command(reply, history, session_data=None):
         f"{industry} {research_focus} {primary_location} {previous_year} {current_year}"
     )
     
-    print(f"🔍 Support command - Conducting research: {research_query}")
+    from services.questionnaire_grounding import format_authoritative_context_block
+
+    authoritative_context_block = format_authoritative_context_block(venture, asked_q=asked_q)
+    cache_key = fingerprint(asked_q, research_query, current_question, authoritative_context_block)
+    cached_reply = _SUPPORT_REPLY_CACHE.get(cache_key)
+    if cached_reply is not None:
+        logger.debug("Using cached Support reply for %s", asked_q or "current question")
+        return cached_reply
+
+    logger.debug("Support command - conducting research: %s", research_query)
     
     # Conduct comprehensive web search
-    research_results = await conduct_web_search(research_query)
+    async with _SUPPORT_RESEARCH_SEMAPHORE:
+        research_results = await conduct_web_search(research_query)
     
     # Generate support content based on conversation history, question, AND research.
     # The model returns a (content, sources) tuple so we can render a citation list
@@ -5852,6 +6066,7 @@ async def handle_support_command(reply, history, session_data=None):
         question_objective=research_focus,
         venture=venture,
         asked_q=asked_q,
+        authoritative_context_block=authoritative_context_block,
     )
 
     sources_section = format_support_sources_section(support_sources)
@@ -5870,107 +6085,16 @@ async def handle_support_command(reply, history, session_data=None):
     # We deliberately do NOT re-cap here: the `content` body is already capped to
     # COMMAND_ASSIST_MAX_WORDS in generate_support_content. The sources list is a
     # reference block and must stay verbatim so the user can verify every claim.
-    return "\n".join(sections).strip()
-
-async def generate_support_content(
-    history,
-    business_context,
-    current_question="",
-    research_results=None,
-    question_objective="",
-    venture=None,
-    asked_q="",
-):
-    """Generate support content with research-backed insights and citations"""
-    from services.questionnaire_grounding import format_authoritative_context_block
-
-    # Extract recent messages (both user and assistant) to understand context
-    recent_messages = []
-    for msg in history[-8:]:  # Look at last 8 messages (4 exchanges)
-        if msg.get('content'):
-            recent_messages.append(msg['content'])
-    
-    # Debug logging
-    print(f"🔍 DEBUG - Recent messages for support context: {recent_messages}")
-    print(f"🔍 DEBUG - Research results available: {bool(research_results)}")
-    
-    # Generate contextual support based on what they've been discussing
-    if not recent_messages:
-        return "I'm here to provide comprehensive support for your business planning journey. Let me help you think through the current question with additional insights and guidance."
-    
-    # Look for key topics in recent messages (both questions and responses)
-    recent_text = " ".join(recent_messages).lower()
-    print(f"🔍 DEBUG - Recent text for analysis: {recent_text[:200]}...")
-    
-    # Use the current_question parameter if provided, otherwise extract from history
-    if not current_question:
-        current_question = get_current_question_context(history, None)
-    
-    print(f"🔍 DEBUG - Current question context: {current_question[:100]}...")
-    
-    # DYNAMIC APPROACH: Use AI model to generate industry-specific support
-    business_name = business_context.get("business_name", "your business")
-    industry = business_context.get("industry", "your industry")
-    business_type = business_context.get("business_type", "your business type")
-    location = business_context.get("location", "your location")
-
-    # Ground prior-answer context in the tagged questionnaire history (same
-    # source Draft uses) rather than guessing from the last N raw chat lines
-    # — that guesswork previously fed the model whatever text happened to
-    # fall in a window, unrelated to the founder's actual prior answers.
-    if venture is not None:
-        authoritative_context_block = format_authoritative_context_block(
-            venture, asked_q=asked_q
-        )
-    else:
-        authoritative_context_block = (
-            f'- Business idea: "{business_context.get("business_idea", "")}"'
-        )
-
-    # Generate dynamic support using AI model with research results and citations
-    research_section = ""
-    if research_results:
-        research_section = f"""
-    
-    📊 RESEARCH FINDINGS (USE THESE IN YOUR RESPONSE):
-        {research_results}
-    
-    CRITICAL: Incorporate the research findings above into your response. Cite specific data points, statistics, and sources mentioned.
-    """
-    
-    current_year = datetime.now().year
-    previous_year = current_year - 1
-    competitor_requirements = ""
-    if "competitor" in (question_objective or "").lower():
-        competitor_requirements = f"""
-    
-    ⚔️ COMPETITORS (entire reply still ≤{COMMAND_ASSIST_MAX_WORDS} words):
-        Name up to 3 direct competitors with one differentiator each; add at most one recent fact or source per competitor.
-        """
-
-    support_prompt = f"""
-    ⚠️ CRITICAL CONTEXT - READ FIRST:
-        This business is in the {industry.upper()} INDUSTRY operating as a {business_type.upper()}.
-    ALL guidance must be 100% specific to {industry.upper()} businesses - NOT education, NOT technology, NOT consulting.
-    Focus EXCLUSIVELY on {industry.upper()} industry challenges, examples, trends, and best practices.
-    {research_section}
-    Ensure all statistics, market metrics, and competitor moves reference sources from {previous_year} or {current_year} whenever available. Discard any data older than {previous_year - 1} unless no newer information exists.
-    {competitor_requirements}
-
-    🎯 CURRENT QUESTION BEING ADDRESSED:
-        "{current_question}"
-
-    ⚠️ CRITICAL REQUIREMENT: Your entire response must be DIRECTLY RELEVANT to answering this specific question. Do not provide general business advice or information that doesn't directly help answer this question. Stay focused and on-topic.
-    MANDATORY: Cover only this questionnaire step. Do not introduce themes that answer other Business Plan questions or later phases.
-
-    Business Context (PRIMARY IDENTIFIERS):
-    - Business Name: {business_name}
-    - PRIMARY INDUSTRY: {industry.upper()} ⭐ (THIS IS THE CORE BUSINESS TYPE)
-    - Business Structure: {business_type}
-    - Location: {location}
-
-    {authoritative_context_block}
-
+    support_reply = "\n".join(sections).strip()
+    # Only cited replies are cached; the uncited fallback should be retried next time.
+    if support_sources:
+        _SUPPORT_REPLY_CACHE.set(cache_key, support_reply)
+    return support_reply
+
+# Static Support instructions (output contract, citation rules, worked example).
+# Sent as the first message so OpenAI's automatic prefix caching can reuse it;
+# everything venture- or question-specific goes in the user message after it.
+SUPPORT_COMMAND_SYSTEM = f"""
     📦 OUTPUT CONTRACT — RETURN A SINGLE JSON OBJECT, NOTHING ELSE:
         {{
           "content": "<markdown body>",
@@ -5993,8 +6117,8 @@ async def generate_support_content(
       each block, every bullet on its own line starting with `- ` (dash + space, ASCII only — NEVER
       use the `•` character or numbered bullets):
 
-          <one short paragraph: 1–2 sentences explaining why this matters for {business_name} in
-          {industry.upper()} ({location})>
+          <one short paragraph: 1–2 sentences explaining why this matters for this business in
+          its PRIMARY INDUSTRY and location>
 
           - <bullet 1: strongest research-backed fact, citation marker [1] at end>
           - <bullet 2: ..., [2]>
@@ -6013,7 +6137,7 @@ async def generate_support_content(
           second uses `[2]`, and so on. Do NOT skip numbers (e.g., never go [1] → [3] without
           having a [2]).
     - `sources` MUST list every distinct organization, study, dataset, or publication that backs a
-      claim in `content`. If you say "according to {industry} reports" or quote a statistic, the
+      claim in `content`. If you say "according to industry reports" or quote a statistic, the
       underlying publisher belongs in `sources`. Never leave a citation unmatched.
     - 🛑 SOURCES ARE MANDATORY. `sources` MUST contain AT LEAST 2 entries and AT MOST
       {SUPPORT_MAX_SOURCES}. There is no business-plan topic without authoritative sources —
@@ -6058,7 +6182,7 @@ async def generate_support_content(
         every bullet begins with `- ` and ends with its marker, blank line between every block.
 
     Stay on the current question only; prioritise research findings when provided.
-    REMEMBER: This is a {industry.upper()} business—keep examples and advice specific to that industry.
+    REMEMBER: keep examples and advice specific to the PRIMARY INDUSTRY in the business context.
 
     ⚠️ DO NOT include inside `content`:
     - "Follow-up prompts:" or follow-up questions
@@ -6070,6 +6194,140 @@ async def generate_support_content(
     Just provide the informational content itself.
     """
 
+
+_SUPPORT_RESEARCH_SECTION_TEMPLATE = """
+    
+    📊 RESEARCH FINDINGS (USE THESE IN YOUR RESPONSE):
+        {research_results}
+    
+    CRITICAL: Incorporate the research findings above into your response. Cite specific data points, statistics, and sources mentioned.
+    """
+
+_SUPPORT_COMPETITOR_REQUIREMENTS = f"""
+    
+    ⚔️ COMPETITORS (entire reply still ≤{COMMAND_ASSIST_MAX_WORDS} words):
+        Name up to 3 direct competitors with one differentiator each; add at most one recent fact or source per competitor.
+        """
+
+# Uncited Support replies used when the model call fails.
+_SUPPORT_RESEARCH_FALLBACK = (
+    "Based on research findings for your {industry} business:\n\n"
+    "{research_results}\n\n"
+    "Let me help you apply this to your specific situation in {location}. "
+    "Consider how this data relates to your {business_type} structure and the "
+    "unique aspects of your {industry} business."
+)
+_SUPPORT_GENERIC_FALLBACK = (
+    "Let me help you think through this question for your {industry} business. "
+    "Consider the specific challenges and opportunities in the {industry} sector, "
+    "especially in {location}. Focus on how this relates to your {business_type} "
+    "structure and the unique aspects of your industry."
+)
+
+# Per-request half of the Support prompt; only the named fields change per call.
+_SUPPORT_USER_PROMPT_TEMPLATE = """
+    ⚠️ CRITICAL CONTEXT - READ FIRST:
+        This business is in the {industry_upper} INDUSTRY operating as a {business_type_upper}.
+    ALL guidance must be 100% specific to this industry's challenges, examples, trends, and best practices - NOT education, NOT technology, NOT consulting.
+    {research_section}
+    Ensure all statistics, market metrics, and competitor moves reference sources from {previous_year} or {current_year} whenever available. Discard any data older than {oldest_year} unless no newer information exists.
+    {competitor_requirements}
+
+    🎯 CURRENT QUESTION BEING ADDRESSED:
+        "{current_question}"
+
+    ⚠️ CRITICAL REQUIREMENT: Your entire response must be DIRECTLY RELEVANT to answering this specific question. Do not provide general business advice or information that doesn't directly help answer this question. Stay focused and on-topic.
+    MANDATORY: Cover only this questionnaire step. Do not introduce themes that answer other Business Plan questions or later phases.
+
+    Business Context (PRIMARY IDENTIFIERS):
+    - Business Name: {business_name}
+    - PRIMARY INDUSTRY: {industry_upper} ⭐ (THIS IS THE CORE BUSINESS TYPE)
+    - Business Structure: {business_type}
+    - Location: {location}
+
+    {authoritative_context_block}
+
+    Follow the OUTPUT CONTRACT from the system message.
+    """
+
+
+async def generate_support_content(
+    history,
+    business_context,
+    current_question="",
+    research_results=None,
+    question_objective="",
+    venture=None,
+    asked_q="",
+    authoritative_context_block=None,
+):
+    """Generate support content with research-backed insights and citations"""
+    from services.questionnaire_grounding import format_authoritative_context_block
+
+    logger.debug("Support research results available: %s", bool(research_results))
+    
+    # Generate contextual support based on what they've been discussing
+    # (last 8 messages, i.e. 4 exchanges)
+    if not any(msg.get('content') for msg in history[-8:]):
+        return (
+            "I'm here to provide comprehensive support for your business planning journey. "
+            "Let me help you think through the current question with additional insights and guidance.",
+            [],
+        )
+    
+    # Use the current_question parameter if provided, otherwise extract from history
+    if not current_question:
+        current_question = get_current_question_context(history, None)
+    
+    logger.debug("Support current question context: %.100s...", current_question)
+    
+    # DYNAMIC APPROACH: Use AI model to generate industry-specific support
+    business_name = business_context.get("business_name", "your business")
+    industry = business_context.get("industry", "your industry")
+    business_type = business_context.get("business_type", "your business type")
+    location = business_context.get("location", "your location")
+
+    # Ground prior-answer context in the tagged questionnaire history (same
+    # source Draft uses) rather than guessing from the last N raw chat lines
+    # — that guesswork previously fed the model whatever text happened to
+    # fall in a window, unrelated to the founder's actual prior answers.
+    # handle_support_command passes the block it already built for its cache key.
+    if authoritative_context_block is None:
+        if venture is not None:
+            authoritative_context_block = format_authoritative_context_block(
+                venture, asked_q=asked_q
+            )
+        else:
+            authoritative_context_block = (
+                f'- Business idea: "{business_context.get("business_idea", "")}"'
+            )
+
+    # Generate dynamic support using AI model with research results and citations
+    current_year = _current_year()
+    previous_year = current_year - 1
+    support_prompt = _SUPPORT_USER_PROMPT_TEMPLATE.format(
+        industry_upper=industry.upper(),
+        business_type_upper=business_type.upper(),
+        research_section=(
+            _SUPPORT_RESEARCH_SECTION_TEMPLATE.format(research_results=research_results)
+            if research_results
+            else ""
+        ),
+        previous_year=previous_year,
+        current_year=current_year,
+        oldest_year=previous_year - 1,
+        competitor_requirements=(
+            _SUPPORT_COMPETITOR_REQUIREMENTS
+            if "competitor" in (question_objective or "").lower()
+            else ""
+        ),
+        current_question=current_question,
+        business_name=business_name,
+        business_type=business_type,
+        location=location,
+        authoritative_context_block=authoritative_context_block,
+    )
+
     # The "sources are mandatory" rule lives in the system prompt, but gpt-4o
     # occasionally still ships an empty array on the first attempt. We don't
     # accept that silently — one targeted retry that calls out the empty
@@ -6077,20 +6335,30 @@ async def generate_support_content(
     async def _call_support_model(user_prompt: str) -> tuple[str, list[dict]]:
         response = await client.chat.completions.create(
             model="gpt-4o",
-            messages=[{"role": "user", "content": user_prompt}],
+            messages=[
+                {"role": "system", "content": SUPPORT_COMMAND_SYSTEM},
+                {"role": "user", "content": user_prompt},
+            ],
             response_format={"type": "json_object"},
             temperature=0.3,
-            max_tokens=1100,
+            max_tokens=SUPPORT_MAX_TOKENS,
+        )
+        usage = getattr(response, "usage", None)
+        prompt_details = getattr(usage, "prompt_tokens_details", None)
+        logger.debug(
+            "Support prompt tokens: %s (cached: %s)",
+            getattr(usage, "prompt_tokens", None),
+            getattr(prompt_details, "cached_tokens", None),
         )
         raw_payload = response.choices[0].message.content or ""
         try:
             parsed = json.loads(raw_payload)
         except json.JSONDecodeError as parse_err:
-            print(f"❌ Support JSON parse failed ({parse_err}); raw head: {raw_payload[:200]!r}")
+            logger.warning("Support JSON parse failed (%s); raw head: %r", parse_err, raw_payload[:200])
             fallback = truncate_to_word_limit(raw_payload.strip(), COMMAND_ASSIST_MAX_WORDS)
             return fallback, []
         if not isinstance(parsed, dict):
-            print(f"⚠️ Support JSON returned non-object root: {type(parsed).__name__}")
+            logger.warning("Support JSON returned non-object root: %s", type(parsed).__name__)
             return "", []
         body = str(parsed.get("content") or "").strip()
         srcs = normalize_support_sources(parsed.get("sources"))
@@ -6105,7 +6373,7 @@ async def generate_support_content(
         # the contract in stronger terms so the model commits to publishers
         # it can actually back up.
         if not sources:
-            print("⚠️ Support model returned 0 sources on first pass — retrying with hard requirement")
+            logger.warning("Support model returned 0 sources on first pass - retrying with hard requirement")
             retry_addendum = (
                 "\n\n🚨 REJECTED — your previous response returned an empty `sources` array, which is "
                 "not allowed for Support. Regenerate the response and you MUST include at least 2 "
@@ -6120,32 +6388,25 @@ async def generate_support_content(
         # word count, and we want the cap applied to the final user-visible text.
         content = reconcile_support_citations(content, sources)
         content = truncate_to_word_limit(content, COMMAND_ASSIST_MAX_WORDS)
-        word_count = len(content.split())
-        print(
-            f"✅ Support content generated: {len(content)} chars / {word_count} words, "
-            f"{len(sources)} source(s) cited"
+        logger.debug(
+            "Support content generated: %d chars / %d words, %d source(s) cited",
+            len(content),
+            len(content.split()),
+            len(sources),
         )
         return content, sources
     except Exception as e:
-        print(f"❌ Dynamic support generation failed: {e}")
+        logger.warning("Dynamic support generation failed: %s", e)
         # Fallback to basic guidance with research if available. Sources are
         # empty because we genuinely don't have a structured list to back the
         # fallback narrative — we will not invent citations.
-        if research_results:
-            fallback = (
-                f"Based on research findings for your {industry} business:\n\n"
-                f"{research_results}\n\n"
-                f"Let me help you apply this to your specific situation in {location}. "
-                f"Consider how this data relates to your {business_type} structure and the "
-                f"unique aspects of your {industry} business."
-            )
-        else:
-            fallback = (
-                f"Let me help you think through this question for your {industry} business. "
-                f"Consider the specific challenges and opportunities in the {industry} sector, "
-                f"especially in {location}. Focus on how this relates to your {business_type} "
-                f"structure and the unique aspects of your industry."
-            )
+        template = _SUPPORT_RESEARCH_FALLBACK if research_results else _SUPPORT_GENERIC_FALLBACK
+        fallback = template.format(
+            industry=industry,
+            location=location,
+            business_type=business_type,
+            research_results=research_results,
+        )
         return truncate_to_word_limit(fallback, COMMAND_ASSIST_MAX_WORDS), []
     
     
@@ -6168,6 +6429,9 @@ async def handle_draft_more_command(reply, history, session_data=None):
             "Please answer or accept Question 1, then try again."
         )
 
+    # A preceding Support click may already be drafting this; once it finishes, the
+    # call below is answered from the draft cache.
+    await _await_draft_answer_prefetch(session_data, asked_q)
     additional_content = await generate_draft_content(
         venture=venture,
         asked_q=asked_q,
@@ -6181,168 +6445,129 @@ async def handle_draft_more_command(reply, history, session_data=None):
     draft_more_response = f"Here's a draft for you:\n\n{additional_content}\n\n"
     return cap_full_command_assist_reply(draft_more_response)
 
-async def generate_additional_draft_content(history, business_context, current_question=""):
-    """Generate additional draft content based on current question using AI"""
-    business_name = business_context.get("business_name", "your business")
-    industry = business_context.get("industry", "your industry")
-    business_type = business_context.get("business_type", "your business type")
-    location = business_context.get("location", "your location")
-    
-    # Extract previous answers from history for better context
-    previous_answers = []
-    for msg in history[-10:]:
-        if msg.get('role') == 'user' and len(msg.get('content', '')) > 20:
-            content = msg.get('content', '')
-            # Skip command words
-            if content.lower() not in ['support', 'draft', 'scrapping', 'scraping', 'accept', 'modify', 'draft more']:
-                previous_answers.append(content[:200])
-    
-    # Use AI to generate enhanced additional content
-    draft_more_prompt = f"""
-    ⚠️ CRITICAL CONTEXT - READ FIRST:
-        This business is in the {industry.upper()} INDUSTRY operating as a {business_type.upper()}.
-    ALL enhanced content must be 100% specific to {industry.upper()} businesses - NOT education, NOT technology, NOT consulting.
-    Use ONLY {industry.upper()} industry examples, innovations, and insights.
-    
-    The user requested "Draft Answer" - they want additional, enhanced content on top of what was already provided.
 
-    Current Question: "{current_question}"
-
-    ⚠️ ACTIVE QUESTION RELEVANCE (MANDATORY): Stay strictly on the current question above. Do NOT introduce content that answers other Business Plan questions, later phases, or unrelated topics — the user wants MORE depth on THIS step, not coverage of additional steps.
-    
-    Business Context (PRIMARY IDENTIFIERS):
-    - Business Name: {business_name}
-    - PRIMARY INDUSTRY: {industry.upper()} ⭐ (THIS IS THE CORE BUSINESS TYPE)
-    - Business Structure: {business_type}
-    - Location: {location}
-    
-    Previous Context:
-    {' | '.join(previous_answers[-3:]) if previous_answers else 'No previous context available'}
-    
-    Generate ENHANCED, ADDITIONAL content that:
-        1. Takes the original answer to the next level with MORE detail for {industry.upper()} businesses
-    2. Adds 3-5 UNIQUE angles or perspectives specific to {industry.upper()} industry
-    3. Provides ADVANCED strategic insights specific to {industry.upper()} in {location}
-    4. Includes innovative ideas and creative approaches for {industry} businesses
-    5. Offers cutting-edge {industry.upper()} industry trends and best practices (2024-2025)
-    6. Makes it stand out with unique value propositions
-    7. ⚠️ CRITICAL WORD LIMIT: Your entire reply MUST be {COMMAND_ASSIST_MAX_WORDS} words or fewer.
-    8. NEVER mentions unrelated industries - stay focused on {industry.upper()}
-    
-    Keep to one or two short blocks (optional small bullet list); the word limit is strict.
-    REMEMBER: This is a {industry.upper()} business - all enhanced content must be relevant to {industry.upper()}.
-    
-    ⚠️ DO NOT include:
-    - "Follow-up prompts:" or follow-up questions
-    - Additional questions for the user
-    - "Would you like to explore..." or similar prompts
-    - Thought starters or tips
-    - "Ready to proceed?" or "Shall we continue?" or similar
-    Just provide the draft content itself.
-    """
-    
-    try:
-        response = await client.chat.completions.create(
-            model="gpt-4o",
-            messages=[{"role": "user", "content": draft_more_prompt}],
-            temperature=0.4,  # Slightly higher for more creativity
-            max_tokens=800
-        )
-        
-        enhanced_content = response.choices[0].message.content
-        enhanced_content = truncate_to_word_limit(enhanced_content, COMMAND_ASSIST_MAX_WORDS)
-        word_count = len(enhanced_content.split())
-        print(f"🔍 DEBUG - AI-generated enhanced draft length: {len(enhanced_content)} characters ({word_count} words)")
-        return enhanced_content
-    except Exception as e:
-        print(f"AI enhanced draft generation failed: {e}, falling back to template")
-        # Fallback to template if AI fails
-        pass
-    
-    # Fallback templates if AI generation fails
-    if any(keyword in current_question.lower() for keyword in ['target market', 'demographics', 'psychographics', 'behaviors', 'ideal customer']):
-        return f"""Here's additional detailed content for your target market strategy:
-
-**Customer Journey Mapping:**
-Map out the complete customer journey for {business_name} from awareness to purchase to retention. Identify touchpoints where your {business_type} business can engage with customers and create positive experiences that drive loyalty and referrals.
-
-**Market Segmentation Deep Dive:**
-Break down your target market into micro-segments within the {industry} sector. Consider factors like company size, decision-making processes, budget ranges, and pain point severity. This helps you create more targeted messaging and offerings.
+_KICKSTART_REPLY_TEMPLATE = (
+    "Here are some kickstart resources to get you moving:\n\n{reply}\n\n"
+    "These templates and frameworks are customized for your business context. "
+    "Would you like me to:\n• **Customize** these further for your specific needs\n• **Provide** additional templates or checklists\n• **Move forward** with the current resources"
+)
 
-**Competitive Differentiation:**
-Identify specific ways {business_name} can differentiate from competitors in the {industry} space. Focus on unique value propositions, service delivery methods, or customer experience elements that competitors cannot easily replicate.
+_CONTACT_REPLY_TEMPLATE = (
+    "Based on your business needs, here are some trusted professionals:\n\n{reply}\n\n"
+    "These recommendations are tailored to your industry, location, and business stage. "
+    "Would you like me to:\n• **Research** more specific providers in your area\n• **Provide** contact templates for reaching out\n• **Suggest** questions to ask when interviewing them"
+)
 
-**Customer Acquisition Channels:**
-Detail the specific channels and tactics that work best for reaching your target market in the {industry} sector. Consider both digital and traditional channels, and how they align with your customers' preferences and behaviors.
 
-**Pricing Strategy Alignment:**
-Ensure your pricing strategy aligns with your target market's willingness to pay and budget constraints. Consider value-based pricing that reflects the specific benefits your {business_type} solution provides to customers in the {industry} sector."""
+def handle_kickstart_command(reply: str) -> str:
+    """Handle the Kickstart command"""
+    return _KICKSTART_REPLY_TEMPLATE.format(reply=reply)
 
-    elif any(keyword in current_question.lower() for keyword in ['competitor', 'competition', 'main competitors', 'strengths and weaknesses', 'competitive advantage']):
-        return f"""Here's additional detailed content for your competitive analysis:
 
-**Competitive Intelligence Framework:**
-Develop a systematic approach to monitor competitors in the {industry} sector. Track their pricing changes, product launches, marketing campaigns, and customer feedback to identify opportunities and threats.
+def handle_contact_command(reply: str) -> str:
+    """Handle the Who do I contact? command"""
+    return _CONTACT_REPLY_TEMPLATE.format(reply=reply)
 
-**Market Positioning Analysis:**
-Analyze how competitors position themselves in the {industry} market and identify positioning gaps that {business_name} can exploit. Consider emotional positioning, functional positioning, and price positioning strategies.
+def extract_conversation_context(history):
+    """Extract relevant context from conversation history"""
+    context = []
+    for msg in history[-6:]:
+        content = msg["content"]
+        if msg["role"] == "user" and len(content) > 10:
+            context.append(content[:100] + "..." if len(content) > 100 else content)
+    return " | ".join(context)
 
-**Competitive Response Strategy:**
-Develop specific strategies for how {business_name} will respond to competitive actions. This includes defensive strategies to protect market share and offensive strategies to gain competitive advantage.
+# Staff roles mentioned in user answers: (number)? (office )? (a/an )? keyword (s)?
+_STAFF_KEYWORDS = ('secretary', 'assistant', 'receptionist', 'office manager', 'bookkeeper', 'accountant', 'staff', 'employee', 'worker')
+_STAFF_MENTION_RE = re.compile(
+    r'\b(\d+)?\s*(?:office\s+)?(?:a\s+|an\s+)?('
+    + '|'.join(re.escape(keyword) for keyword in _STAFF_KEYWORDS)
+    + r')s?\b'
+)
 
-**Partnership Opportunities:**
-Identify potential partnership opportunities with complementary businesses in the {industry} sector. Strategic partnerships can help {business_name} compete more effectively against larger competitors.
 
-**Innovation Differentiation:**
-Focus on innovation areas where {business_name} can lead the {industry} market. Consider technology adoption, service delivery innovation, or business model innovation that creates sustainable competitive advantages."""
+def _staff_mentions_by_keyword(content_lower: str) -> Dict[str, List[str]]:
+    """Normalized staff mentions grouped by keyword, from a single scan of the text."""
+    mentions: Dict[str, List[str]] = {}
+    for match in _STAFF_MENTION_RE.finditer(content_lower):
+        full_match = match.group(0)
+        number = match.group(1)
+        if number:
+            staff_mention = f"{number} {full_match.replace(number, '').strip()}"
+        else:
+            staff_mention = full_match.strip()
+        mentions.setdefault(match.group(2), []).append(" ".join(staff_mention.split()))
+    return mentions
+
+
+# Question tags whose answers anchor the extracted context:
+# GKY.03 "What kind of business are you trying to build?", BP.01 business idea
+# (not the business name question) and BP.05 business name.
+_CONTEXT_QUESTION_FIELDS = {
+    "GKY.03": "business_type",
+    "BUSINESS_PLAN.01": "business_idea",
+    "BP.01": "business_idea",
+    "BUSINESS_PLAN.05": "business_name",
+    "BP.05": "business_name",
+}
+_CONTEXT_QUESTION_PRIORITY = ("business_type", "business_idea", "business_name")
+_CONTEXT_QUESTION_TAG_RE = re.compile(
+    r"\[\[Q:(" + "|".join(re.escape(tag) for tag in _CONTEXT_QUESTION_FIELDS) + r")\]\]"
+)
 
-    else:
-        return f"""Here's additional detailed content for your business planning:
 
-**Implementation Timeline:**
-Create a detailed timeline for implementing your strategies, including key milestones, dependencies, and resource requirements. This helps ensure realistic planning and successful execution.
+# Phrase gates for the per-message context heuristics, one alternation per gate
+# (plain substring semantics, same as the old ``any(phrase in ...)`` checks).
+def _phrase_pattern(phrases):
+    return re.compile("|".join(re.escape(phrase) for phrase in phrases))
 
-**Risk Assessment and Mitigation:**
-Identify potential risks and challenges for {business_name} in the {industry} sector, and develop specific mitigation strategies for each risk. This includes market risks, operational risks, and competitive risks.
 
-**Success Metrics and KPIs:**
-Define specific, measurable success metrics that align with your business objectives. Include both leading indicators (early warning signs) and lagging indicators (outcome measures) to track progress effectively.
+_INDUSTRY_HINT_RE = _phrase_pattern(("business", "company", "startup", "industry", "service"))
+_LOCATION_HINT_RE = _phrase_pattern(
+    ("located in", "based in", "karachi", "lahore", "islamabad", "city", "location")
+)
+_BUSINESS_TYPE_HINT_RE = _phrase_pattern(
+    ("business type", "type of business", "startup", "company", "corporation", "llc", "partnership")
+)
+_BUSINESS_IDEA_HINT_RE = _phrase_pattern(
+    ("tea good", "on tap", "business idea", "my idea", "startup idea", "venture", "business concept")
+)
+_TEA_IDEA_HINT_RE = _phrase_pattern(("tea good", "on tap"))
+# Preference and command replies that are never the business idea.
+_NON_IDEA_REPLY_RE = _phrase_pattern(
+    ("yes", "no", "maybe", "support", "draft", "scrapping", "hands-on", "decide",
+     "personal savings", "subscriptions", "online only")
+)
 
-**Resource Planning:**
-Detail the specific resources {business_name} needs to execute your strategies, including human resources, technology, capital, and partnerships. Ensure resource allocation aligns with your strategic priorities.
 
-**Growth Strategy:**
-Develop a comprehensive growth strategy that includes market expansion, product development, and scaling considerations. Focus on sustainable growth that maintains quality and customer satisfaction."""
+# Extracted context per exact history contents. Every reply re-extracts from a
+# history that usually hasn't changed since the previous call in the same turn. The
+# key covers every message: different sessions can share a length and their opening
+# and latest canned messages, and go-back edits rewrite earlier turns.
+_HISTORY_CONTEXT_CACHE = BoundedCache(maxsize=512)
 
-def handle_kickstart_command(reply, history, session_data):
-    """Handle the Kickstart command"""
-    kickstart_response = f"Here are some kickstart resources to get you moving:\n\n{reply}\n\n"
-    kickstart_response += "These templates and frameworks are customized for your business context. "
-    kickstart_response += "Would you like me to:\n• **Customize** these further for your specific needs\n• **Provide** additional templates or checklists\n• **Move forward** with the current resources"
-    
-    return kickstart_response
 
-def handle_contact_command(reply, history, session_data):
-    """Handle the Who do I contact? command"""
-    contact_response = f"Based on your business needs, here are some trusted professionals:\n\n{reply}\n\n"
-    contact_response += "These recommendations are tailored to your industry, location, and business stage. "
-    contact_response += "Would you like me to:\n• **Research** more specific providers in your area\n• **Provide** contact templates for reaching out\n• **Suggest** questions to ask when interviewing them"
-    
-    return contact_response
+def _copy_business_context(business_context):
+    # staffing_needs is a list; copy it so callers can't mutate the cached entry.
+    return {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in business_context.items()
+    }
 
-def extract_conversation_context(history):
-    """Extract relevant context from conversation history"""
-    recent_messages = history[-6:] if len(history) > 6 else history
-    context = []
-    
-    for msg in recent_messages:
-        if msg["role"] == "user" and len(msg["content"]) > 10:
-            context.append(msg["content"][:100] + "..." if len(msg["content"]) > 100 else msg["content"])
-    
-    return " | ".join(context)
 
 def extract_business_context_from_history(history):
     """Extract business context information from conversation history with weighted priority"""
+    cache_key = fingerprint(*[(msg.get("role"), msg.get("content")) for msg in history])
+    cached = _HISTORY_CONTEXT_CACHE.get(cache_key)
+    if cached is not None:
+        return _copy_business_context(cached)
+
+    business_context = _scan_history_for_business_context(history)
+    _HISTORY_CONTEXT_CACHE.set(cache_key, _copy_business_context(business_context))
+    return business_context
+
+
+def _scan_history_for_business_context(history):
     business_context = {
         "business_name": "",
         "industry": "",
@@ -6362,28 +6587,32 @@ def extract_business_context_from_history(history):
         "business_idea": 0
     }
     
-    print(f"🔍 DEBUG - Extracting business context from {len(history)} messages with weighted priority")
+    logger.debug("Extracting business context from %d messages with weighted priority", len(history))
     
     # NO MORE HARDCODED OVERRIDES - Let AI naturally detect business type from conversation
     # Removed plumbing-specific override logic - system now works for ALL business types dynamically
     
     # First pass: Identify GKY and Business Plan questions to prioritize their answers
+    # The latest asking of each question wins, so walk backwards and stop once all
+    # three have been seen.
     gky_question_indices = {}
-    for i, msg in enumerate(history):
-        if msg["role"] == "assistant":
-            content = msg["content"]
-            # GKY questions (sequential set: GKY.01-GKY.05)
-            if "[[Q:GKY.03]]" in content:  # "What kind of business are you trying to build?"
-                gky_question_indices["business_type"] = i
-                print(f"🔍 DEBUG - Found GKY.03 (business type question) at index {i}")
-            # BP.01 — business idea (not the business name question)
-            elif "[[Q:BUSINESS_PLAN.01]]" in content or "[[Q:BP.01]]" in content:
-                gky_question_indices["business_idea"] = i
-                print(f"🔍 DEBUG - Found BP.01 (business idea question) at index {i}")
-            # BP.05 — business name
-            elif "[[Q:BUSINESS_PLAN.05]]" in content or "[[Q:BP.05]]" in content:
-                gky_question_indices["business_name"] = i
-                print(f"🔍 DEBUG - Found BP.05 (business name question) at index {i}")
+    for i in range(len(history) - 1, -1, -1):
+        msg = history[i]
+        if msg["role"] != "assistant":
+            continue
+        found_fields = {
+            _CONTEXT_QUESTION_FIELDS[tag]
+            for tag in _CONTEXT_QUESTION_TAG_RE.findall(msg["content"])
+        }
+        # One field per message, in the order GKY.03 > BP.01 > BP.05
+        for field in _CONTEXT_QUESTION_PRIORITY:
+            if field in found_fields:
+                if field not in gky_question_indices:
+                    gky_question_indices[field] = i
+                    logger.debug("Found %s question at index %d", field, i)
+                break
+        if len(gky_question_indices) == len(_CONTEXT_QUESTION_PRIORITY):
+            break
     
     # Extract from all messages (not just recent ones)
     for i, msg in enumerate(history):
@@ -6391,7 +6620,7 @@ def extract_business_context_from_history(history):
             content = msg["content"]
             content_lower = content.lower()
             
-            print(f"🔍 DEBUG - Message {i}: {content[:100]}...")
+            logger.debug("Message %d: %.100s...", i, content)
             
             # Check if this is a response to a GKY or BP question (HIGHEST PRIORITY - weight 100)
             is_bp_name_answer = "business_name" in gky_question_indices and i == gky_question_indices["business_name"] + 1
@@ -6402,12 +6631,12 @@ def extract_business_context_from_history(history):
             # Extract business idea from BP.01 answer (HIGHEST PRIORITY - weight 100)
             if is_bp_idea_answer and len(content.strip()) > 2:
                 business_idea_answer = content.strip()
-                command_words = ["support", "draft", "scrapping", "accept", "modify"]
-                is_command = any(cmd in business_idea_answer.lower() for cmd in command_words)
+                answer_lower = business_idea_answer.lower()
+                is_command = any(cmd in answer_lower for cmd in _ANSWER_COMMAND_WORDS)
                 if not is_command:
                     business_context["business_idea"] = business_idea_answer
                     context_weights["business_idea"] = 100
-                    print(f"🔍 DEBUG - ⭐ HIGHEST PRIORITY: BP.01 business idea answer (weight 100)")
+                    logger.debug("Highest priority: BP.01 business idea answer (weight 100)")
 
             # Extract business name from BP.05 answer (HIGHEST PRIORITY - weight 100)
             # BP.05 business_name: handled only by business_identity_extractor + ensure_session_business_context.
@@ -6420,44 +6649,26 @@ def extract_business_context_from_history(history):
                 business_type_answer = content.strip()
                 business_context["business_type"] = business_type_answer
                 context_weights["business_type"] = 100
-                print(f"🔍 DEBUG - ⭐ HIGHEST PRIORITY: GKY.03 business type answer: '{business_type_answer}' (weight 100)")
+                logger.debug("Highest priority: GKY.03 business type answer: %r (weight 100)", business_type_answer)
             
             # Extract sales location from BP.08 answer (HIGHEST PRIORITY)
             if is_bp_sales_location_answer and len(content.strip()) > 2:
                 sales_location_answer = content.strip()
                 business_context["sales_location"] = sales_location_answer
                 context_weights["sales_location"] = 100
-                print(f"🔍 DEBUG - ⭐ HIGHEST PRIORITY: BP.08 sales location answer: '{sales_location_answer}' (weight 100)")
+                logger.debug("Highest priority: BP.08 sales location answer: %r (weight 100)", sales_location_answer)
             
             # Extract previously mentioned staff (for context in future questions)
-            staff_keywords = ['secretary', 'assistant', 'receptionist', 'office manager', 'bookkeeper', 'accountant', 'staff', 'employee', 'worker']
-            for keyword in staff_keywords:
-                # Pattern to match: (number)? (office )? (a/an )? keyword (s)?
-                # Use word boundaries to avoid partial matches
-                pattern = r'\b(\d+)?\s*(?:office\s+)?(?:a\s+|an\s+)?' + re.escape(keyword) + r's?\b'
-                matches = re.finditer(pattern, content_lower)
+            staff_mentions = _staff_mentions_by_keyword(content_lower)
+            for keyword in _STAFF_KEYWORDS:
                 found_match = False
-                for match in matches:
-                    full_match = match.group(0)  # The full matched string
-                    number = match.group(1)  # The number group (if present)
-                    
-                    # Extract the full phrase including "office" if present
-                    if number:
-                        # Has a number, include it
-                        staff_mention = f"{number} {full_match.replace(number, '').strip()}"
-                    else:
-                        # No number, use the full match
-                        staff_mention = full_match.strip()
-                    
-                    # Clean up the mention (remove extra spaces, normalize)
-                    staff_mention = re.sub(r'\s+', ' ', staff_mention).strip()
-                    
+                for staff_mention in staff_mentions.get(keyword, ()):
                     # Add to list if not already present
                     if "staffing_needs" not in business_context:
                         business_context["staffing_needs"] = []
                     if staff_mention and staff_mention not in business_context["staffing_needs"]:
                         business_context["staffing_needs"].append(staff_mention)
-                        print(f"🔍 DEBUG - Found staff mention in extract_business_context: '{staff_mention}'")
+                        logger.debug("Found staff mention in extract_business_context: %r", staff_mention)
                         found_match = True
                 if found_match:
                     break  # Only process first keyword match per message
@@ -6468,18 +6679,18 @@ def extract_business_context_from_history(history):
             # Only as fallback if GKY answer not available (weight < 100)
             if context_weights["industry"] < 50:
                 # Look for business/industry mentions in user's own words
-                if any(phrase in content_lower for phrase in ["business", "company", "startup", "industry", "service"]):
+                if _INDUSTRY_HINT_RE.search(content_lower):
                     # Extract the full phrase - let AI understand it later
                     if len(content.strip()) > 5 and len(content.strip()) < 100:
                         # Use user's exact words as industry descriptor
                         business_context["industry"] = content.strip()
                         context_weights["industry"] = 20
-                        print(f"🔍 DEBUG - Using user's exact description as industry: '{content.strip()[:50]}' (weight 20)")
+                        logger.debug("Using user's exact description as industry: %.50r (weight 20)", content.strip())
             
             # Extract location information - Only if not from GKY (weight < 100)
             if context_weights["location"] < 100:
                 # Look for location mentions
-                if any(phrase in content_lower for phrase in ["located in", "based in", "karachi", "lahore", "islamabad", "city", "location"]):
+                if _LOCATION_HINT_RE.search(content_lower):
                     # Look for city names or location patterns
                     locations = ["karachi", "lahore", "islamabad", "rawalpindi", "faisalabad", "multan", "peshawar", "quetta", "sialkot", "gujranwala"]
                     for location in locations:
@@ -6487,7 +6698,7 @@ def extract_business_context_from_history(history):
                             if context_weights["location"] < 50:
                                 business_context["location"] = location.title()
                                 context_weights["location"] = 50
-                                print(f"🔍 DEBUG - Found location: {location} (weight 50)")
+                                logger.debug("Found location: %s (weight 50)", location)
                             break
                     # If no specific city found, look for "located in" pattern
                     if context_weights["location"] < 50 and "located in" in content_lower:
@@ -6497,29 +6708,29 @@ def extract_business_context_from_history(history):
                             if len(potential_location) > 2:
                                 business_context["location"] = potential_location.title()
                                 context_weights["location"] = 50
-                                print(f"🔍 DEBUG - Found location from pattern: {potential_location} (weight 50)")
+                                logger.debug("Found location from pattern: %s (weight 50)", potential_location)
             
             # Extract business type - Only if not from GKY (weight < 100)
             if context_weights["business_type"] < 100:
                 # Look for business type mentions
-                if any(phrase in content_lower for phrase in ["business type", "type of business", "startup", "company", "corporation", "llc", "partnership"]):
+                if _BUSINESS_TYPE_HINT_RE.search(content_lower):
                     business_types = ["startup", "company", "corporation", "llc", "partnership", "sole proprietorship", "nonprofit", "franchise"]
                     for biz_type in business_types:
                         if biz_type in content_lower:
                             if context_weights["business_type"] < 50:
                                 business_context["business_type"] = biz_type
                                 context_weights["business_type"] = 50
-                                print(f"🔍 DEBUG - Found business type: {biz_type} (weight 50)")
+                                logger.debug("Found business type: %s (weight 50)", biz_type)
                             break
             
             # Extract business idea - look for longer descriptive responses
             if not business_context["business_idea"] and len(content.strip()) > 20:
                 # Look for business idea descriptions with specific keywords
-                if any(phrase in content_lower for phrase in ["tea good", "on tap", "business idea", "my idea", "startup idea", "venture", "business concept"]):
+                if _BUSINESS_IDEA_HINT_RE.search(content_lower):
                     # For tea-related descriptions, capture the full content
-                    if any(phrase in content_lower for phrase in ["tea good", "on tap"]):
+                    if _TEA_IDEA_HINT_RE.search(content_lower):
                         business_context["business_idea"] = content.strip()
-                        print(f"🔍 DEBUG - Found tea business idea: {content}")
+                        logger.debug("Found tea business idea: %s", content)
                     else:
                         # Extract a reasonable portion of the business idea
                         for phrase in ["business idea", "my idea", "startup idea", "venture", "business concept"]:
@@ -6529,12 +6740,12 @@ def extract_business_context_from_history(history):
                                     idea_text = parts[1].strip()[:100]  # First 100 characters
                                     if len(idea_text) > 10:
                                         business_context["business_idea"] = idea_text
-                                        print(f"🔍 DEBUG - Found business idea: {idea_text}")
+                                        logger.debug("Found business idea: %s", idea_text)
                                         break
                 # Also capture longer responses that might be business ideas (but exclude preference responses)
-                elif len(content.strip()) > 30 and not any(word in content_lower for word in ["yes", "no", "maybe", "support", "draft", "scrapping", "hands-on", "decide", "personal savings", "subscriptions", "online only"]):
+                elif len(content.strip()) > 30 and not _NON_IDEA_REPLY_RE.search(content_lower):
                     business_context["business_idea"] = content.strip()
-                    print(f"🔍 DEBUG - Found business idea (long response): {content[:50]}...")
+                    logger.debug("Found business idea (long response): %.50s...", content)
     
     from services.business_identity_extractor import is_valid_business_name, is_valid_industry_label
 
@@ -6545,9 +6756,8 @@ def extract_business_context_from_history(history):
     if business_context.get("industry") and not is_valid_industry_label(business_context["industry"]):
         business_context["industry"] = ""
 
-    print(f"🔍 DEBUG - Final business context: {business_context}")
-    print(f"🔍 DEBUG - Context weights: {context_weights}")
-    print(f"⭐ PRIORITY SUMMARY - Industry: '{business_context.get('industry', 'N/A')}' (weight: {context_weights['industry']}), Business Type: '{business_context.get('business_type', 'N/A')}' (weight: {context_weights['business_type']})")
+    logger.debug("Final business context: %s", business_context)
+    logger.debug("Context weights: %s", context_weights)
     return business_context
 
 async def handle_competitor_research_request(user_input, business_context, history):
@@ -6578,16 +6788,30 @@ async def handle_competitor_research_request(user_input, business_context, histo
     # Conduct web search for competitor research
     competitor_research_results = []
     
-    for query in research_queries[:3]:  # Limit to 3 queries for efficiency
-        try:
-            search_result = await conduct_web_search(query)
-            if is_valid_research_result(search_result):
-                competitor_research_results.append({
-                    "query": query,
-                    "result": search_result
-                })
-        except Exception as e:
-            print(f"Error conducting competitor research for query '{query}': {e}")
+    # Limit to 3 distinct queries for efficiency; they are independent, so run them together
+    selected_queries = []
+    seen_query_keys = set()
+    for query in research_queries:
+        query_key = _search_query_key(query)
+        if query_key in seen_query_keys:
+            continue
+        seen_query_keys.add(query_key)
+        selected_queries.append(query)
+        if len(selected_queries) == 3:
+            break
+    search_results = await asyncio.gather(
+        *(conduct_web_search(query) for query in selected_queries),
+        return_exceptions=True,
+    )
+    for query, search_result in zip(selected_queries, search_results):
+        if isinstance(search_result, BaseException):
+            logger.warning("Error conducting competitor research for query '%s': %r", query, search_result)
+            continue
+        if is_valid_research_result(search_result):
+            competitor_research_results.append({
+                "query": query,
+                "result": search_result
+            })
     
     # Generate comprehensive competitor analysis
     if competitor_research_results:
@@ -6661,88 +6885,68 @@ async def generate_business_plan_artifact_async(session_data, conversation_histo
         print(f"❌ Background: Error generating artifact: {str(e)}")
         return None
 
-async def generate_business_plan_artifact(session_data, conversation_history):
-    """Generate comprehensive business plan artifact with deep research"""
-    from utils.business_context import prompt_labels
+# The artifact's market and competitor searches depend only on industry, location and
+# year, so founders in the same market share them for a week. L1 is per-worker, L2 the
+# shared Supabase research cache; the per-key lock makes concurrent generations for the
+# same market wait for one search instead of each sending their own. Locks live only
+# while someone holds or waits on them (key -> [lock, users]), so none is evicted mid-use.
+# See _WEB_SEARCH_CACHE for how this layer relates to the other research caches.
+ARTIFACT_RESEARCH_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+_ARTIFACT_RESEARCH_CACHE_BUCKET = "artifact_research_v1"
+_ARTIFACT_RESEARCH_CACHE = BoundedCache(maxsize=1024, ttl_seconds=ARTIFACT_RESEARCH_CACHE_TTL_SECONDS)
+_ARTIFACT_RESEARCH_LOCKS: Dict[str, list] = {}
+
+
+async def _get_artifact_research(query: str, research_kind: str | None = None):
+    from services.research_cache_service import build_cache_key
+
+    cache_key = build_cache_key(query, research_kind)
+    research_results = _ARTIFACT_RESEARCH_CACHE.get(cache_key)
+    if research_results is not None:
+        return research_results
+
+    lock_entry = _ARTIFACT_RESEARCH_LOCKS.get(cache_key)
+    if lock_entry is None:
+        lock_entry = _ARTIFACT_RESEARCH_LOCKS[cache_key] = [asyncio.Lock(), 0]
+    lock_entry[1] += 1
+    try:
+        async with lock_entry[0]:
+            return await _load_artifact_research(cache_key, query, research_kind)
+    finally:
+        lock_entry[1] -= 1
+        if lock_entry[1] == 0:
+            _ARTIFACT_RESEARCH_LOCKS.pop(cache_key, None)
+
+
+async def _load_artifact_research(cache_key: str, query: str, research_kind: str | None):
+    from services.research_cache_service import get_cached_entry, set_cached_entry
+
+    research_results = _ARTIFACT_RESEARCH_CACHE.get(cache_key)
+    if research_results is not None:
+        return research_results
+
+    research_results = await asyncio.to_thread(get_cached_entry, _ARTIFACT_RESEARCH_CACHE_BUCKET, cache_key)
+    if isinstance(research_results, str) and research_results:
+        logger.debug("Using cached artifact research for: %.50s", query)
+        _ARTIFACT_RESEARCH_CACHE.set(cache_key, research_results)
+        return research_results
+
+    research_results = await conduct_web_search(query, research_kind=research_kind)
+    if is_valid_research_result(research_results):
+        _ARTIFACT_RESEARCH_CACHE.set(cache_key, research_results)
+        await asyncio.to_thread(
+            set_cached_entry,
+            _ARTIFACT_RESEARCH_CACHE_BUCKET,
+            cache_key,
+            research_results,
+            ttl_seconds=ARTIFACT_RESEARCH_CACHE_TTL_SECONDS,
+        )
+    return research_results
 
-    labels = prompt_labels(session_data)
-    industry = labels['industry']
-    location = labels['location']
-    
-    # Conduct comprehensive research for business plan
-    
-    current_year = datetime.now().year
-    previous_year = current_year - 1
-    
-    print(f"🔍 Conducting research for {industry} business in {location}")
-    
-    # OPTIMIZED: Use asyncio with timeout to prevent blocking - only do 2 quick searches
-    # If searches timeout, continue without them (artifact will still be comprehensive)
-    async def quick_search(query, timeout=5, research_kind: str | None = None):
-        try:
-            return await asyncio.wait_for(
-                conduct_web_search(query, research_kind=research_kind), timeout=timeout
-            )
-        except asyncio.TimeoutError:
-            print(f"⏱️ Search timeout for: {query[:50]}... (continuing without it)")
-            return None
-        except Exception as e:
-            print(f"⚠️ Search error for {query[:50]}: {str(e)} (continuing without it)")
-            return None
 
-    # Only do 2 essential searches (market and competitor) with timeout
-    # This prevents long delays while still providing valuable research.
-    #
-    # conduct_web_search() doesn't do a literal query lookup — the query string
-    # only picks which fixed "numbered_sections" output contract to hand the
-    # model (see get_research_synthesis_sections), and that's what actually
-    # shapes the response. Without an explicit research_kind, it falls back to
-    # keyword-guessing the query text, and no keyword bucket recognizes market
-    # size/TAM/CAGR wording — so it silently fell through to the
-    # "industry_trends" contract (hence Market Trends always populated fine,
-    # while Market Size/Growth never did: the model was never asked for those
-    # figures no matter how the query itself was worded).
-    # Passing research_kind="market_size_growth" explicitly selects the
-    # contract that actually asks for a TAM figure and a CAGR/growth-rate
-    # figure, instead of leaving it to fragile keyword matching.
-    market_research_task = quick_search(
-        f"{industry} market size and growth rate {location} {previous_year}-{current_year}",
-        timeout=8,
-        research_kind="market_size_growth",
-    )
-    competitor_research_task = quick_search(
-        f"top competitors {industry} business model analysis {previous_year}",
-        timeout=8,
-        research_kind="competitors",
-    )
-    
-    # Run searches in parallel and wait for both (or timeout)
-    market_research, competitor_research = await asyncio.gather(
-        market_research_task, 
-        competitor_research_task,
-        return_exceptions=True
-    )
-    
-    # Handle exceptions
-    if isinstance(market_research, Exception):
-        print(f"⚠️ Market research failed: {market_research}")
-        market_research = None
-    if isinstance(competitor_research, Exception):
-        print(f"⚠️ Competitor research failed: {competitor_research}")
-        competitor_research = None
-    
-    # Skip optional searches (trends and financial) to speed up generation
-    # These can be added later if needed, but they're causing timeouts
-    industry_trends = None
-    financial_benchmarks = None
-    print(f"⚡ Using optimized research: Market={bool(market_research)}, Competitor={bool(competitor_research)}")
-    
-    # Get full conversation history for comprehensive business plan
-    # Use more history to ensure we capture all business plan answers
-    full_history = conversation_history if len(conversation_history) <= 100 else conversation_history[-100:]
-    print(f"📚 Using {len(full_history)} messages from conversation history for business plan generation")
-    
-    business_plan_prompt = f"""
+# Static body of the business plan artifact prompt; rendered per call with the
+# venture labels, research excerpts and serialized session/history.
+_BUSINESS_PLAN_ARTIFACT_PROMPT_TEMPLATE = """
     ⚠️⚠️⚠️ CRITICAL FORMAT REQUIREMENT - READ THIS FIRST ⚠️⚠️⚠️
     
     YOUR OUTPUT MUST START WITH EXACTLY THIS TEXT (NO EXCEPTIONS):
@@ -6786,24 +6990,24 @@ async def generate_business_plan_artifact(session_data, conversation_history):
     10. Total document should be 15-20 pages when formatted
     
     **Session Data**:
-    {json.dumps(session_data, indent=2)}
+    {session_data_json}
     
     **Deep Research Conducted**:
-    Market Analysis: {market_research[:2000] if market_research else "Research pending"}
-    Competitor Analysis: {competitor_research[:2000] if competitor_research else "Research pending"}
-    Industry Trends: {industry_trends[:2000] if industry_trends else "Research pending"}
-    Financial Benchmarks: {financial_benchmarks[:2000] if financial_benchmarks else "Research pending"}
+    Market Analysis: {market_research}
+    Competitor Analysis: {competitor_research}
+    Industry Trends: {industry_trends}
+    Financial Benchmarks: {financial_benchmarks}
     
     **Full Conversation History** (all business plan Q&A):
-    {json.dumps(full_history, indent=2)}
+    {history_json}
     
     **CRITICAL DATA EXTRACTION INSTRUCTIONS**:
     - Read through the conversation history above carefully
     - Extract ACTUAL business information from user's answers
     - Replace ALL placeholders like "[Extract from conversation]" with REAL data from the conversation
-    - Use the actual business name: {labels['business_name']}
-    - Use the actual industry: {labels['industry']}
-    - Use the actual location: {labels['location']}
+    - Use the actual business name: {business_name}
+    - Use the actual industry: {industry}
+    - Use the actual location: {location}
     - Extract mission statements, value propositions, target markets, revenue models, etc. from actual user answers
     - DO NOT make up information — every figure must come from the conversation above OR the "Deep Research
       Conducted" block above (never invent a number that appears in neither)
@@ -7029,9 +7233,9 @@ async def generate_business_plan_artifact(session_data, conversation_history):
        - "## Section 7 - Financial Projections & Funding"
        - "## Section 8 - Operations, Risk Management & Implementation Timeline"
     5. **MANDATORY**: Extract ALL information from the conversation history - replace ALL [Extract from conversation] placeholders with ACTUAL data
-    6. **MANDATORY**: Use actual business name: {labels['business_name']}
-    7. **MANDATORY**: Use actual industry: {labels['industry']}
-    8. **MANDATORY**: Use actual location: {labels['location']}
+    6. **MANDATORY**: Use actual business name: {business_name}
+    7. **MANDATORY**: Use actual industry: {industry}
+    8. **MANDATORY**: Use actual location: {location}
     9. **MANDATORY**: All tables must be properly formatted markdown tables with | separators
     10. **MANDATORY**: DO NOT create traditional sections like "Executive Summary", "Company Description", etc. - ONLY use Section 1-8 format
     11. **MANDATORY**: DO NOT create sections beyond Section 8 - the document MUST end after Section 8
@@ -7085,6 +7289,215 @@ async def generate_business_plan_artifact(session_data, conversation_history):
     
     Generate the complete business plan now in EXACTLY 8 sections with tables. Make it comprehensive and detailed:
     """
+
+
+_ARTIFACT_REQUIRED_PREFIX = "## Section 1 - Executive Summary & Business Overview"
+# History sent with the artifact prompt: newest messages first, up to 100 messages and
+# roughly 40k tokens (estimated at 4 characters per token of the serialized message).
+ARTIFACT_HISTORY_MAX_MESSAGES = 100
+ARTIFACT_HISTORY_TOKEN_BUDGET = 40_000
+
+
+def _trim_artifact_history(conversation_history):
+    char_budget = ARTIFACT_HISTORY_TOKEN_BUDGET * 4
+    kept = 0
+    for msg in reversed(conversation_history[-ARTIFACT_HISTORY_MAX_MESSAGES:]):
+        char_budget -= len(json.dumps(msg))
+        if char_budget < 0:
+            break
+        kept += 1
+    return conversation_history[len(conversation_history) - kept:]
+
+
+async def _stream_business_plan_artifact(messages, temperature: float) -> str:
+    """Stream one gpt-4o business plan completion, abandoning it on a wrong opening.
+
+    Every validation pass rejects an artifact that does not start with
+    ``_ARTIFACT_REQUIRED_PREFIX``, so once enough text has arrived to tell, a bad
+    start is returned as-is (and fails validation) instead of paying for the rest
+    of a 16k-token document.
+    """
+    stream = await client.chat.completions.create(
+        model="gpt-4o",
+        messages=messages,
+        temperature=temperature,
+        max_tokens=16000,  # Ensure we get a comprehensive, full-length document
+        stream=True,
+    )
+    chunks: list[str] = []
+    prefix_checked = False
+    async for event in stream:
+        if not event.choices:
+            continue
+        delta = event.choices[0].delta.content
+        if not delta:
+            continue
+        chunks.append(delta)
+        if prefix_checked:
+            continue
+        head = "".join(chunks).lstrip()
+        if len(head) < len(_ARTIFACT_REQUIRED_PREFIX):
+            continue
+        prefix_checked = True
+        if not head.startswith(_ARTIFACT_REQUIRED_PREFIX):
+            logger.warning("Artifact stream opened with %r - abandoning it", head[:80])
+            await stream.close()
+            return head
+    return "".join(chunks)
+
+
+_ARTIFACT_SECTION_HEADER_RE = re.compile(r"## Section (\d*)")
+
+
+def _artifact_section_headers(artifact_content: str):
+    """(header count, has "## Section 1", has "## Section 8") from one scan of the artifact."""
+    numbers = _ARTIFACT_SECTION_HEADER_RE.findall(artifact_content)
+    return (
+        len(numbers),
+        any(number.startswith("1") for number in numbers),
+        any(number.startswith("8") for number in numbers),
+    )
+
+
+def _artifact_retry_turns(rejected_output: str, correction: str):
+    """Conversation tail for a format retry: the start of the rejected output, then the correction."""
+    return [
+        {"role": "assistant", "content": (rejected_output or "")[:2000]},
+        {"role": "user", "content": correction},
+    ]
+
+
+# Finished artifacts keyed on everything the prompt is built from, so a re-render or a
+# caller's retry with unchanged session and history reuses the last document. A
+# generation already running for the same key is joined rather than started twice
+# (double clicks, a router retry racing the first attempt).
+_BUSINESS_PLAN_ARTIFACT_CACHE = BoundedCache(maxsize=512, ttl_seconds=60 * 60)
+_BUSINESS_PLAN_ARTIFACT_INFLIGHT: Dict[str, "asyncio.Task[str]"] = {}
+
+
+async def generate_business_plan_artifact(session_data, conversation_history):
+    """Generate comprehensive business plan artifact with deep research"""
+    from services.research_cache_service import build_cache_key
+
+    # Get full conversation history for comprehensive business plan
+    # Use more history to ensure we capture all business plan answers
+    full_history = _trim_artifact_history(conversation_history)
+    artifact_cache_key = build_cache_key("business_plan_artifact", session_data, full_history)
+    cached_artifact = _BUSINESS_PLAN_ARTIFACT_CACHE.get(artifact_cache_key)
+    if cached_artifact is not None:
+        logger.info("Reusing business plan artifact for unchanged session (%d characters)", len(cached_artifact))
+        return cached_artifact
+
+    task = _BUSINESS_PLAN_ARTIFACT_INFLIGHT.get(artifact_cache_key)
+    if task is None:
+        task = asyncio.create_task(_generate_business_plan_artifact(session_data, full_history))
+        _BUSINESS_PLAN_ARTIFACT_INFLIGHT[artifact_cache_key] = task
+
+        def _finish(done_task, key=artifact_cache_key):
+            _BUSINESS_PLAN_ARTIFACT_INFLIGHT.pop(key, None)
+            if not done_task.cancelled() and done_task.exception() is None:
+                _BUSINESS_PLAN_ARTIFACT_CACHE.set(key, done_task.result())
+
+        task.add_done_callback(_finish)
+    else:
+        logger.info("Business plan artifact already generating for this session - waiting for it")
+
+    # Shielded so one caller disconnecting does not cancel the generation the others await.
+    return await asyncio.shield(task)
+
+
+async def _generate_business_plan_artifact(session_data, full_history):
+    from utils.business_context import prompt_labels
+
+    labels = prompt_labels(session_data)
+    industry = labels['industry']
+    location = labels['location']
+    
+    # Conduct comprehensive research for business plan
+    
+    current_year = _current_year()
+    previous_year = current_year - 1
+    
+    print(f"🔍 Conducting research for {industry} business in {location}")
+    
+    # OPTIMIZED: Use asyncio with timeout to prevent blocking - only do 2 quick searches
+    # If searches timeout, continue without them (artifact will still be comprehensive)
+    async def quick_search(query, timeout=5, research_kind: str | None = None):
+        try:
+            return await asyncio.wait_for(
+                _get_artifact_research(query, research_kind), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            print(f"⏱️ Search timeout for: {query[:50]}... (continuing without it)")
+            return None
+        except Exception as e:
+            print(f"⚠️ Search error for {query[:50]}: {str(e)} (continuing without it)")
+            return None
+
+    # Only do 2 essential searches (market and competitor) with timeout
+    # This prevents long delays while still providing valuable research.
+    #
+    # conduct_web_search() doesn't do a literal query lookup — the query string
+    # only picks which fixed "numbered_sections" output contract to hand the
+    # model (see get_research_synthesis_sections), and that's what actually
+    # shapes the response. Without an explicit research_kind, it falls back to
+    # keyword-guessing the query text, and no keyword bucket recognizes market
+    # size/TAM/CAGR wording — so it silently fell through to the
+    # "industry_trends" contract (hence Market Trends always populated fine,
+    # while Market Size/Growth never did: the model was never asked for those
+    # figures no matter how the query itself was worded).
+    # Passing research_kind="market_size_growth" explicitly selects the
+    # contract that actually asks for a TAM figure and a CAGR/growth-rate
+    # figure, instead of leaving it to fragile keyword matching.
+    research_timeout = 8
+    market_research_task = asyncio.create_task(quick_search(
+        f"{industry} market size and growth rate {location} {previous_year}-{current_year}",
+        timeout=research_timeout,
+        research_kind="market_size_growth",
+    ))
+    competitor_research_task = asyncio.create_task(quick_search(
+        f"top competitors {industry} business model analysis {previous_year}",
+        timeout=research_timeout,
+        research_kind="competitors",
+    ))
+    research_tasks = (market_research_task, competitor_research_task)
+    
+    # Run searches in parallel; anything still running at the deadline (or if this
+    # coroutine is cancelled) is cancelled rather than left behind on the loop.
+    try:
+        await asyncio.wait(research_tasks, timeout=research_timeout)
+    finally:
+        for task in research_tasks:
+            if not task.done():
+                logger.warning("Research search still running at the deadline - cancelling it")
+                task.cancel()
+    market_research, competitor_research = (
+        task.result() if task.done() and not task.cancelled() and task.exception() is None else None
+        for task in research_tasks
+    )
+    
+    # Skip optional searches (trends and financial) to speed up generation
+    # These can be added later if needed, but they're causing timeouts
+    industry_trends = None
+    financial_benchmarks = None
+    print(f"⚡ Using optimized research: Market={bool(market_research)}, Competitor={bool(competitor_research)}")
+    
+    print(f"📚 Using {len(full_history)} messages from conversation history for business plan generation")
+    
+    def _research_excerpt(text):
+        return text[:2000] if text else "Research pending"
+
+    business_plan_prompt = _BUSINESS_PLAN_ARTIFACT_PROMPT_TEMPLATE.format(
+        session_data_json=json.dumps(session_data),
+        market_research=_research_excerpt(market_research),
+        competitor_research=_research_excerpt(competitor_research),
+        industry_trends=_research_excerpt(industry_trends),
+        financial_benchmarks=_research_excerpt(financial_benchmarks),
+        history_json=json.dumps(full_history),
+        business_name=labels['business_name'],
+        industry=labels['industry'],
+        location=labels['location'],
+    )
     
     print(f"📝 Generating comprehensive business plan artifact (this may take 30-60 seconds)...")
     print(f"📊 Using conversation history with {len(full_history)} messages")
@@ -7131,26 +7544,21 @@ Each section MUST:
 
 Generate the business plan NOW starting with "## Section 1 - Executive Summary & Business Overview"."""
         
-        response = await client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": business_plan_prompt}
-            ],
+        artifact_messages = [
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": business_plan_prompt}
+        ]
+        artifact_content = await _stream_business_plan_artifact(
+            artifact_messages,
             temperature=0.2,  # Very low temperature for strict format adherence
-            max_tokens=16000  # Ensure we get a comprehensive, full-length document
         )
         
-        artifact_content = response.choices[0].message.content
-        
         # Log first 500 characters to debug format
         print(f"🔍 First 500 chars of generated artifact: {artifact_content[:500]}")
         
         # STRICT VALIDATION - Reject old format completely
         starts_with_scene_1 = artifact_content.strip().startswith("## Section 1 - Executive Summary & Business Overview")
-        scene_count = artifact_content.count("## Section ")
-        has_scene_1 = "## Section 1" in artifact_content
-        has_scene_8 = "## Section 8" in artifact_content
+        scene_count, has_scene_1, has_scene_8 = _artifact_section_headers(artifact_content)
         has_tables = "|" in artifact_content and "---" in artifact_content
         has_old_format = ("## Executive Summary" in artifact_content or 
                          ("Executive Summary" in artifact_content and "## Section 1" not in artifact_content) or
@@ -7165,8 +7573,11 @@ Generate the business plan NOW starting with "## Section 1 - Executive Summary &
             print(f"   - Scene count: {scene_count} (expected 8)")
             print(f"   - Has tables: {has_tables}")
             print("🔄 Regenerating with STRICT format enforcement...")
-            # Retry with STRICT format enforcement
-            enhanced_prompt = business_plan_prompt + """
+            # Retry with STRICT format enforcement. The original prompt is resent unchanged
+            # (so the provider can reuse its cached prefix) followed by the start of the
+            # rejected output and a short correction, instead of a rebuilt prompt.
+            strict_correction = """
+            Your previous output did not match the required 8-section format. Regenerate the complete business plan from the start.
             
             ⚠️⚠️⚠️ CRITICAL FORMAT VALIDATION - YOUR OUTPUT WILL BE REJECTED IF IT DOESN'T MATCH ⚠️⚠️⚠️
             
@@ -7203,21 +7614,13 @@ Generate the business plan NOW starting with "## Section 1 - Executive Summary &
             If your output doesn't start with "## Section 1 - Executive Summary & Business Overview", it will be rejected.
             Generate the business plan NOW following this EXACT format. Start with Section 1.
             """
-            response = await client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": enhanced_prompt}
-                ],
+            artifact_content = await _stream_business_plan_artifact(
+                artifact_messages + _artifact_retry_turns(artifact_content, strict_correction),
                 temperature=0.1,  # Very low temperature for strict format adherence
-                max_tokens=16000
             )
-            artifact_content = response.choices[0].message.content
             
             # Final validation
-            final_scene_count = artifact_content.count("## Section ")
-            final_has_scene_1 = "## Section 1" in artifact_content
-            final_has_scene_8 = "## Section 8" in artifact_content
+            final_scene_count, final_has_scene_1, final_has_scene_8 = _artifact_section_headers(artifact_content)
             final_has_tables = "|" in artifact_content and "---" in artifact_content
             final_has_old_format = ("## Executive Summary" in artifact_content or 
                                    ("Executive Summary" in artifact_content and "## Section 1" not in artifact_content))
@@ -7233,7 +7636,8 @@ Generate the business plan NOW starting with "## Section 1 - Executive Summary &
                 print(f"   - Has old format: {final_has_old_format}")
                 # Force one more regeneration with even stricter prompt
                 print("🔄 Attempting final regeneration with maximum strictness...")
-                ultra_strict_prompt = """
+                ultra_strict_correction = """
+                Your previous output still did not match the required format. Regenerate the complete business plan from the start.
                 
                 ⚠️⚠️⚠️ CRITICAL - YOUR OUTPUT MUST START WITH EXACTLY THIS TEXT ⚠️⚠️⚠️
                 
@@ -7261,16 +7665,10 @@ Generate the business plan NOW starting with "## Section 1 - Executive Summary &
                 
                 Start generating NOW with "## Section 1 - Executive Summary & Business Overview"
                 """
-                final_response = await client.chat.completions.create(
-                    model="gpt-4o",
-                    messages=[
-                        {"role": "system", "content": system_message},
-                        {"role": "user", "content": business_plan_prompt + ultra_strict_prompt}
-                    ],
+                artifact_content = await _stream_business_plan_artifact(
+                    artifact_messages + _artifact_retry_turns(artifact_content, ultra_strict_correction),
                     temperature=0.0,  # Zero temperature for maximum determinism
-                    max_tokens=16000
                 )
-                artifact_content = final_response.choices[0].message.content
                 print(f"🔍 Ultra-strict regeneration: First 500 chars: {artifact_content[:500]}")
                 
                 # Final check - if still wrong, raise error
@@ -7323,7 +7721,7 @@ async def generate_roadmap_artifact(session_data, business_plan_data):
     industry = roadmap_labels["industry"]
     business_type = roadmap_labels["business_type"]
 
-    current_year = datetime.now().year
+    current_year = _current_year()
     previous_year = current_year - 1
 
     vendor_research = await conduct_web_search(
@@ -7734,6 +8132,12 @@ async def generate_detailed_roadmap(session_data, history):
     
     return roadmap_content
 
+# Rendered question blocks keyed on the full acknowledgment prompt, so a hit only
+# happens when tag, venture context and recent answers are all identical (e.g. the
+# empty-message refresh path re-asking the current question).
+_DYNAMIC_QUESTION_CACHE = BoundedCache(maxsize=1024)
+
+
 async def generate_dynamic_business_question(
     question_tag: str, 
     session_data: dict, 
@@ -8173,6 +8577,12 @@ Return the JSON now. Acknowledgment only. {ack_word_cap}-word cap. No transition
         # not a fallback layer.
         return _strip_followup_prompts(ack).strip()
 
+    cache_key = fingerprint(question_tag, ack_user_prompt)
+    cached_question = _DYNAMIC_QUESTION_CACHE.get(cache_key)
+    if cached_question is not None:
+        logger.debug("Using cached dynamic question for %s", question_tag)
+        return cached_question
+
     ack = await _request_ack()
 
     # Validate both invariants together. If EITHER leaks ('?' OR a banned
@@ -8211,13 +8621,16 @@ Return the JSON now. Acknowledgment only. {ack_word_cap}-word cap. No transition
 
     # Final fallback: if every defensive layer ate the ack, ship a neutral
     # one-liner so the canonical question still gets a graceful intro.
+    # Only model-written acknowledgments are cached.
     if not ack:
-        ack = "Got it."
+        return f"[[Q:{question_tag}]]\n\nGot it.\n\n**{canonical_question_text}**"
 
     # Deterministic composition. Canonical question text is supplied by the
     # backend; the LLM can no longer mangle it, replace it, or shadow it
     # with a different question.
-    return f"[[Q:{question_tag}]]\n\n{ack}\n\n**{canonical_question_text}**"
+    question_block = f"[[Q:{question_tag}]]\n\n{ack}\n\n**{canonical_question_text}**"
+    _DYNAMIC_QUESTION_CACHE.set(cache_key, question_block)
+    return question_block
 
 async def generate_next_question(question_tag: str, session_data: dict) -> str:
     """Canonical next-question block (static wording). session_data reserved for callers."""
@@ -8226,170 +8639,6 @@ async def generate_next_question(question_tag: str, session_data: dict) -> str:
     tag = f"BUSINESS_PLAN.{n:02d}" if n is not None else question_tag
     return format_static_business_plan_question(tag)
 
-def generate_problem_solution_draft(business_context, history):
-    """Generate a specific problem-solution draft based on business context"""
-    business_name = business_context.get("business_name", "your business")
-    industry = business_context.get("industry", "your industry")
-    business_type = business_context.get("business_type", "your business type")
-    location = business_context.get("location", "your location")
-    
-    # Generate contextual content based on actual business context
-    return f"""Based on your business vision, here's a draft for your problem-solution fit:
-
-**Problem Identification:**
-{business_name} addresses critical challenges in the {industry} sector that affect businesses and individuals in {location}. These challenges include inefficiencies in current processes, lack of specialized expertise, and outdated approaches that limit growth potential.
-
-**Target Audience:**
-Your target audience consists of {business_type} businesses and professionals in the {industry} sector who are experiencing these operational challenges and seeking more effective solutions.
-
-**Solution Approach:**
-{business_name} provides innovative, specialized solutions that directly address these pain points through:
-• Industry-specific expertise and knowledge
-• Streamlined processes and methodologies
-• Customized approaches for different client needs
-• Ongoing support and guidance
-
-**Key Benefits:**
-• Improved efficiency and productivity
-• Cost-effective solutions compared to alternatives
-• Expert guidance and support
-• Customized approaches for different segments
-
-**Competitive Advantage:**
-Your solution is uniquely positioned because it combines deep industry knowledge with innovative approaches, providing superior value that competitors cannot easily replicate."""
-
-def generate_competitive_analysis_draft(business_context, history):
-    """Generate a specific competitive analysis draft based on business context"""
-    business_name = business_context.get("business_name", "your business")
-    industry = business_context.get("industry", "your industry")
-    business_type = business_context.get("business_type", "your business type")
-    
-    return f"Based on your business context, here's a draft analysis of your competitive landscape: In the {industry} sector, your main competitors likely include established players who offer similar {business_type} solutions. These competitors typically have strengths in brand recognition, resources, and market share, but often have weaknesses in pricing flexibility, customer service personalization, and innovation gaps. {business_name}'s competitive advantage should focus on what makes your solution unique - whether it's better pricing, superior customer experience, innovative features, or specialized expertise in the {industry} sector. Focus on identifying 3-5 key competitors in the {industry} space and analyzing their market positioning, pricing models, and customer base to understand how you can differentiate effectively."
-
-def generate_intellectual_property_draft(business_context, history):
-    """Generate a specific intellectual property draft based on business context"""
-    business_name = business_context.get("business_name", "your business")
-    industry = business_context.get("industry", "your industry")
-    business_type = business_context.get("business_type", "your business type")
-    
-    return f"Based on your business needs, here's a draft for your intellectual property strategy: {business_name} may have intellectual property assets including patents for innovative {business_type} processes, trademarks for your brand identity, and copyrights for original content in the {industry} sector. Consider what legal protections are important for your business, including patent applications for innovative processes or technologies, trademark registration for your brand name and logo, and copyright protection for original content, software, or creative materials. Focus on identifying your proprietary assets, understanding the legal requirements for protection in the {industry} sector, and developing a strategy to safeguard your competitive advantages through appropriate IP protection."
-
-def generate_target_market_draft(business_context, history):
-    """Generate a specific target market draft based on business context"""
-    business_name = business_context.get("business_name", "your business")
-    industry = business_context.get("industry", "your industry")
-    business_type = business_context.get("business_type", "your business type")
-    location = business_context.get("location", "your location")
-    
-    return f"""Based on your business goals, here's a draft for your target market:
-
-**Primary Target Audience:**
-{business_name}'s ideal customers are {business_type} businesses and professionals in the {industry} sector who are seeking specialized solutions and expertise. These customers value quality service, innovation, and results-driven approaches.
-
-**Demographic Profile:**
-• Business Type: {business_type} companies
-• Industry Focus: {industry} sector
-• Geographic Location: {location} and surrounding areas
-• Company Size: Small to medium businesses seeking growth
-
-**Psychographic Characteristics:**
-• Value quality service and expertise
-• Seek innovative solutions to industry challenges
-• Prefer working with specialized service providers
-• Focus on efficiency and measurable results
-
-**Customer Behaviors:**
-• Research extensively before making decisions
-• Prefer direct communication and personalized service
-• Value long-term partnerships over transactional relationships
-• Respond well to industry-specific expertise and knowledge
-
-**Pain Points:**
-• Lack of specialized expertise in the {industry} sector
-• Inefficient processes and outdated approaches
-• Limited access to innovative solutions
-• Need for ongoing support and guidance
-
-**How to Reach Them:**
-Focus on industry-specific channels, professional networks, and direct outreach that demonstrates your expertise in the {industry} sector."""
-
-def generate_operational_requirements_draft(business_context, history):
-    """Generate a specific operational requirements draft based on business context"""
-    business_name = business_context.get("business_name", "your business")
-    industry = business_context.get("industry", "your industry")
-    business_type = business_context.get("business_type", "your business type")
-    location = business_context.get("location", "your location")
-    
-    return f"Based on your business needs, here's a draft for your operational requirements: {business_name}'s location in {location} should be strategically chosen to maximize accessibility for your target customers while considering operational efficiency for your {business_type} operations. Key factors include proximity to suppliers, transportation access, zoning requirements for {industry} businesses, and cost considerations. Your space and equipment needs should align with your {business_type} operations, ensuring you have adequate facilities to serve your customers effectively while maintaining operational efficiency. Focus on factors like zoning compliance for {industry} businesses, transportation access for customers and suppliers, costs, and scalability as your business grows."
-
-def generate_staffing_needs_draft(business_context, history):
-    """Generate a specific staffing needs draft based on business context"""
-    business_name = business_context.get("business_name", "your business")
-    industry = business_context.get("industry", "your industry")
-    business_type = business_context.get("business_type", "your business type")
-    
-    # Check if user previously mentioned specific staff
-    mentioned_staff = business_context.get("staffing_needs", [])
-    
-    # Also extract from history if not in business_context
-    if not mentioned_staff:
-        staff_keywords = ['secretary', 'assistant', 'receptionist', 'office manager', 'bookkeeper', 'accountant', 'staff', 'employee', 'worker']
-        for msg in history:
-            if msg.get('role') == 'user':
-                content_lower = msg.get('content', '').lower()
-                for keyword in staff_keywords:
-                    pattern = r'\b(\d+)?\s*(?:office\s+)?(?:a\s+|an\s+)?' + re.escape(keyword) + r's?\b'
-                    matches = re.finditer(pattern, content_lower)
-                    for match in matches:
-                        full_match = match.group(0)
-                        number = match.group(1)
-                        if number:
-                            staff_mention = f"{number} {full_match.replace(number, '').strip()}"
-                        else:
-                            staff_mention = full_match.strip()
-                        staff_mention = re.sub(r'\s+', ' ', staff_mention).strip()
-                        if staff_mention and staff_mention not in mentioned_staff:
-                            mentioned_staff.append(staff_mention)
-                        break
-    
-    # If user previously mentioned specific staff, reference it
-    if mentioned_staff:
-        staff_list = list(set(mentioned_staff))  # Remove duplicates
-        staff_summary = ", ".join(staff_list[:3])  # Limit to first 3 mentions
-        return f"""Based on your previous answers where you mentioned {staff_summary}, here's a draft for your staffing needs:
-
-**Initial Staffing Structure:**
-You've previously indicated your staffing needs include {staff_summary}. This is a great starting point for {business_name}'s operations in the {industry} sector.
-
-**Key Considerations:**
-• {staff_summary} will help support your core {business_type} business functions
-• Consider the specific roles and responsibilities for each position
-• Think about the qualifications and skills needed for these roles in the {industry} industry
-• Plan for how these staff members will integrate into your operations
-
-**Operational Integration:**
-• How will {staff_summary} support your daily operations at {business_name}?
-• What systems and processes will you need to manage this team effectively?
-• Consider training needs and onboarding processes specific to {industry}
-• Plan for supervision and performance management
-
-**Resource Planning:**
-• Budget for salaries, benefits, and training for {staff_summary}
-• Workspace requirements for your team
-• Tools and equipment needed for each role in {industry}
-• Consider part-time vs. full-time arrangements based on your needs
-
-This staffing structure will help you build a strong foundation for {business_name}'s operations."""
-    
-    return f"Based on your business goals, here's a draft for your staffing needs: {business_name}'s short-term operational needs should focus on identifying critical roles required for launch in the {industry} sector, including key personnel who can drive your core {business_type} business functions. Consider hiring initial staff who bring essential skills and experience in {industry}, securing appropriate workspace for your team, and establishing operational processes that support your business model. Prioritize roles that directly impact customer experience and business operations, ensuring you have the right team in place to execute your business plan effectively. Focus on identifying key positions specific to {business_type} operations, required qualifications for {industry} professionals, and your hiring timeline for building a strong foundation team."
-
-def generate_supplier_relationships_draft(business_context, history):
-    """Generate a specific supplier relationships draft based on business context"""
-    business_name = business_context.get("business_name", "your business")
-    industry = business_context.get("industry", "your industry")
-    business_type = business_context.get("business_type", "your business type")
-    
-    return f"Based on your business requirements, here's a comprehensive draft for your supplier and vendor relationships: {business_name} will need to identify key suppliers and vendors who can provide essential products, services, or resources for your {business_type} operations in the {industry} sector. Consider building relationships with reliable partners who offer competitive pricing, quality products, and consistent service. Key partners might include suppliers for raw materials or components specific to {industry}, service providers for essential business functions, and strategic partners who can help you reach your target market or enhance your offerings. Focus on reliability, quality, pricing, and long-term partnership potential. Evaluate potential partners based on their track record in the {industry} sector, financial stability, capacity to meet your needs, and alignment with your business values. Consider backup suppliers to ensure business continuity and negotiate favorable terms that support your growth objectives in the {industry} market."
 async def generate_startup_costs_table_draft(business_context, current_question):
     """Generate dynamic, AI-powered startup costs table for ANY business type"""
     industry = business_context.get("industry", "your industry")
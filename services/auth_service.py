@@ -1,6 +1,7 @@
 from db.supabase import supabase, supabase_auth
 import logging
 import os
+import re
 import httpx
 from gotrue.errors import AuthApiError
 
@@ -387,7 +388,6 @@ async def send_reset_password_email(email: str):
             # Handle rate limiting - Supabase limits password reset requests to once per 60 seconds
             if "429" in str(send_error) or "too many requests" in error_str or "after" in error_str and "seconds" in error_str:
                 # Extract wait time from error message if available
-                import re
                 wait_match = re.search(r'after (\d+) seconds?', error_str)
                 wait_time = wait_match.group(1) if wait_match else "60"
                 logger.warning(f"Password reset rate limited for {email}. Please wait {wait_time} seconds before requesting again.")
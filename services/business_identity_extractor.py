@@ -390,13 +390,16 @@ def _scan_substantive_answer_after_tagged_question(
     """
     from utils.business_context import _is_command_like_answer
 
+    # Latest tagged question: walk back from the end and stop at the first hit.
     question_index: int | None = None
-    for index, message in enumerate(history):
+    for index in range(len(history) - 1, -1, -1):
+        message = history[index]
         if message.get("role") != "assistant":
             continue
         content = message.get("content") or ""
         if any(tag in content for tag in search_tags):
             question_index = index
+            break
 
     if question_index is None:
         return ""
@@ -13,6 +13,8 @@ from services.questionnaire_grounding import (
     draft_output_has_placeholders,
     format_authoritative_context_block,
 )
+from utils.bounded_cache import BoundedCache, fingerprint
+from utils.business_context import coerce_business_context
 
 DraftMode = Literal["prose", "business_name"]
 
@@ -134,6 +136,30 @@ def validate_draft_output(text: str, *, asked_q: str) -> str | None:
     return None
 
 
+# Building the venture context rescans the whole history and runs the LLM identity
+# extractors, and Draft / Support / Scrapping clicks on one question all rebuild it.
+# The key covers every message as well as the session's stored context: going back
+# deletes history rows, so a re-answered history can match the old one in length and
+# last message while an earlier answer differs.
+_VENTURE_CONTEXT_CACHE = BoundedCache(maxsize=256, ttl_seconds=30 * 60)
+
+
+def _venture_context_cache_key(session_data: dict | None, history: list | None, asked_q: str):
+    session_id = (session_data.get("id") or session_data.get("session_id")) if session_data else None
+    if not session_id:
+        return None
+    return (
+        session_id,
+        asked_q,
+        fingerprint(
+            coerce_business_context(session_data),
+            session_data.get("business_context"),
+            session_data.get("user_name"),
+            *[(msg.get("role"), msg.get("content")) for msg in history or []],
+        ),
+    )
+
+
 async def prepare_draft_venture_context(
     session_data: dict | None,
     history: list | None,
@@ -141,9 +167,17 @@ async def prepare_draft_venture_context(
     asked_q: str,
     get_answer_for_tag: Any,
 ) -> QuestionnaireVentureContext:
-    return await build_questionnaire_venture_context(
+    cache_key = _venture_context_cache_key(session_data, history, asked_q)
+    if cache_key is not None:
+        cached = _VENTURE_CONTEXT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+    venture = await build_questionnaire_venture_context(
         session_data,
         history,
         asked_q=asked_q,
         get_answer_for_tag=get_answer_for_tag,
     )
+    if cache_key is not None:
+        _VENTURE_CONTEXT_CACHE.set(cache_key, venture)
+    return venture
@@ -5,6 +5,7 @@ authoritative questionnaire context path as Draft and Modify.
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Awaitable, Callable
 
 from services.business_plan_draft_service import prepare_draft_venture_context
@@ -16,6 +17,17 @@ from services.questionnaire_grounding import (
     QuestionnaireVentureContext,
     format_authoritative_context_block,
 )
+from services.research_cache_service import get_cached_entry, set_cached_entry
+from utils.bounded_cache import BoundedCache, fingerprint
+
+# Refinements keyed on everything that shapes the prompt except the research text
+# (which is derived from the same venture fields), so a hit skips both calls.
+_SCRAPPING_CACHE = BoundedCache(maxsize=1024, ttl_seconds=60 * 60)
+# A no-notes click drafts from venture context alone, so the same result serves every
+# repeat click on that question; keep it in the shared research cache as well so
+# other workers and restarts reuse it instead of paying for the call again.
+_NO_NOTES_CACHE_BUCKET = "scrapping_no_notes_v1"
+_NO_NOTES_CACHE_TTL_SECONDS = 4 * 60 * 60
 
 SCRAPPING_COMMAND_SYSTEM = """You refine rough founder notes into polished Business Plan answer text.
 
@@ -103,6 +115,7 @@ async def run_scrapping_refinement(
     should_conduct_web_search: Callable[[], bool],
     openai_client: Any,
     word_limit: int,
+    collect_streamed_words: Callable[[Any, int], Awaitable[str]],
 ) -> str:
     venture = await prepare_draft_venture_context(
         session_data,
@@ -111,11 +124,30 @@ async def run_scrapping_refinement(
         get_answer_for_tag=get_answer_for_tag,
     )
 
-    research_results = None
+    research_query = ""
     if should_use_web_research_for_draft(asked_q) and should_conduct_web_search():
-        query = build_scrapping_research_query(venture, asked_q)
-        if query.strip():
-            research_results = await conduct_web_search(query)
+        research_query = build_scrapping_research_query(venture, asked_q).strip()
+
+    cache_key = fingerprint(
+        asked_q,
+        user_notes.strip(),
+        format_authoritative_context_block(venture, asked_q=asked_q),
+        research_query,
+        word_limit,
+    )
+    cached = _SCRAPPING_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    has_notes = bool(user_notes.strip())
+    if not has_notes:
+        cached = await asyncio.to_thread(get_cached_entry, _NO_NOTES_CACHE_BUCKET, cache_key)
+        if isinstance(cached, str) and cached:
+            _SCRAPPING_CACHE.set(cache_key, cached)
+            return cached
+
+    research_results = None
+    if research_query:
+        research_results = await conduct_web_search(research_query)
 
     messages = build_scrapping_messages(
         venture=venture,
@@ -125,10 +157,24 @@ async def run_scrapping_refinement(
         word_limit=word_limit,
     )
 
-    response = await openai_client.chat.completions.create(
+    # The caller truncates to word_limit; stream so generation stops once past it, and
+    # cap tokens at ~2 per word (room for markdown) rather than a flat 800.
+    stream = await openai_client.chat.completions.create(
         model="gpt-4o",
         messages=messages,
         temperature=0.3,
-        max_tokens=800,
+        max_tokens=word_limit * 2,
+        stream=True,
     )
-    return (response.choices[0].message.content or "").strip()
+    refined = (await collect_streamed_words(stream, word_limit)).strip()
+    if refined:
+        _SCRAPPING_CACHE.set(cache_key, refined)
+        if not has_notes:
+            await asyncio.to_thread(
+                set_cached_entry,
+                _NO_NOTES_CACHE_BUCKET,
+                cache_key,
+                refined,
+                ttl_seconds=_NO_NOTES_CACHE_TTL_SECONDS,
+            )
+    return refined
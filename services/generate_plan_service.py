@@ -1,6 +1,7 @@
 from openai import AsyncOpenAI
 import os
 import json
+import re
 from datetime import datetime
 from services.angel_service import generate_business_plan_artifact, conduct_web_search, extract_business_context_from_history
 
@@ -679,7 +680,6 @@ async def generate_comprehensive_business_plan_summary(history, session=None):
     # Build conversation history and extract BUSINESS_PLAN Q&A pairs
     business_plan_qa = {}  # Map question numbers to answers
     conversation_history = []
-    import re
     
     # Debug: Check history structure
     if history and len(history) > 0:
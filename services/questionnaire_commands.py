@@ -4,32 +4,52 @@ from __future__ import annotations
 
 import re
 
-_EXACT_COMMANDS = frozenset(
-    {
-        "draft",
-        "support",
-        "scrapping",
-        "scraping",
-        "draft more",
-        "draft answer",
-        "accept",
-        "modify",
-    }
-)
-
 _PREFIX_COMMANDS = ("scrapping:", "scraping:", "support:", "draft:")
 
 _SCRAPPING_PREFIX = re.compile(r"^\s*scrapp?ing\s*:\s*", re.IGNORECASE)
 
 
-def is_questionnaire_command(text: str) -> bool:
-    """True when the user turn is Draft/Support/Scrapping/etc., not a questionnaire answer."""
+# Kinds returned by classify_questionnaire_input.
+COMMAND_ANSWER = "answer"
+COMMAND_ACCEPT = "accept"
+COMMAND_MODIFY = "modify"
+COMMAND_DRAFT = "draft"
+COMMAND_DRAFT_MORE = "draft_more"
+COMMAND_SUPPORT = "support"
+COMMAND_SCRAPPING = "scrapping"
+COMMAND_SCRAPPING_WITH_NOTES = "scrapping_with_notes"
+COMMAND_OTHER = "other_command"
+
+_EXACT_COMMAND_KINDS = {
+    "accept": COMMAND_ACCEPT,
+    "modify": COMMAND_MODIFY,
+    "draft": COMMAND_DRAFT,
+    "draft more": COMMAND_DRAFT_MORE,
+    "draft answer": COMMAND_DRAFT_MORE,
+    "support": COMMAND_SUPPORT,
+    "scrapping": COMMAND_SCRAPPING,
+    "scraping": COMMAND_SCRAPPING,
+}
+
+
+def classify_questionnaire_input(text: str) -> str:
+    """Classify a user turn once: one of the ``COMMAND_*`` kinds, ``COMMAND_ANSWER`` for answers."""
     lowered = (text or "").strip().lower()
     if not lowered:
-        return False
-    if lowered in _EXACT_COMMANDS:
-        return True
-    return any(lowered.startswith(prefix) for prefix in _PREFIX_COMMANDS)
+        return COMMAND_ANSWER
+    kind = _EXACT_COMMAND_KINDS.get(lowered)
+    if kind:
+        return kind
+    if lowered.startswith(("scrapping:", "scraping:")):
+        return COMMAND_SCRAPPING_WITH_NOTES
+    if lowered.startswith(_PREFIX_COMMANDS):
+        return COMMAND_OTHER
+    return COMMAND_ANSWER
+
+
+def is_questionnaire_command(text: str) -> bool:
+    """True when the user turn is Draft/Support/Scrapping/etc., not a questionnaire answer."""
+    return classify_questionnaire_input(text) != COMMAND_ANSWER
 
 
 def parse_scrapping_notes(text: str) -> str:
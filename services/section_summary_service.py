@@ -7,9 +7,11 @@ No hardcoded business names or industry examples in prompts.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 from services.business_identity_extractor import get_tagged_answer_for_question_tag
@@ -172,6 +174,57 @@ def format_section_answers_block(records: list[SectionAnswerRecord]) -> str:
     return "\n".join(lines).strip()
 
 
+# Output contract + rules for each instruction. They depend only on the section, so
+# they are formatted once per section id and reused across sessions and retries.
+_SUMMARY_RULES_TEMPLATE = """Return JSON only:
+{{
+  "summary": "One paragraph recapping every key fact from this section using exact names, numbers, and choices from the answers.",
+  "insights": [
+    "2-3 educational insights; each must cite at least one grounding anchor above"
+  ]
+}}
+
+Rules:
+- Ground every insight in the anchor facts and section answers for THIS founder only.
+- Each insight must reference {section_topic} in the context of their stated business.
+- Do not write advice that could apply unchanged to a different industry or business model.
+- Do not include Critical Considerations (generated separately)."""
+
+_CONSIDERATIONS_RULES_TEMPLATE = """Section focus lenses (choose 2-3 distinct topics):
+{focus}
+
+Return JSON only:
+{{
+  "considerations": [
+    {{"topic": "2-5 word topic label", "text": "1-2 sentences of actionable advice"}}
+  ]
+}}
+
+Rules for each consideration:
+1. "topic" is a short label (2-5 words) — never copy a sentence from the user's answers.
+2. "text" must cite at least one grounding anchor (business name, metric, industry detail, or section fact).
+3. Advice must be specific to this founder's industry and section answers — not interchangeable template text.
+4. For compliance topics, name the regulation type relevant to their industry (not "stay informed about regulations").
+5. Provide exactly 2-3 items."""
+
+
+@lru_cache(maxsize=16)
+def _summary_rules(section_id: int) -> str:
+    return _SUMMARY_RULES_TEMPLATE.format(
+        section_topic=SECTION_TOPIC_LABELS.get(section_id, "business planning")
+    )
+
+
+@lru_cache(maxsize=16)
+def _considerations_rules(section_id: int) -> str:
+    return _CONSIDERATIONS_RULES_TEMPLATE.format(
+        focus=SECTION_CONSIDERATION_FOCUS.get(
+            section_id,
+            "Risks, compliance, and actions tied to this section's answers",
+        )
+    )
+
+
 def build_summary_and_insights_instruction(
     *,
     section_name: str,
@@ -181,7 +234,6 @@ def build_summary_and_insights_instruction(
 ) -> str:
     qa_block = format_section_answers_block(records)
     anchor_block = anchors.prompt_block()
-    section_topic = SECTION_TOPIC_LABELS.get(section_id, "business planning")
 
     return f"""The founder completed the "{section_name}" section of their Business Plan.
 
@@ -190,19 +242,7 @@ def build_summary_and_insights_instruction(
 SECTION ANSWERS (authoritative source — do not invent facts not present here):
 {qa_block}
 
-Return JSON only:
-{{
-  "summary": "One paragraph recapping every key fact from this section using exact names, numbers, and choices from the answers.",
-  "insights": [
-    "2-3 educational insights; each must cite at least one grounding anchor above"
-  ]
-}}
-
-Rules:
-- Ground every insight in the anchor facts and section answers for THIS founder only.
-- Each insight must reference {section_topic} in the context of their stated business.
-- Do not write advice that could apply unchanged to a different industry or business model.
-- Do not include Critical Considerations (generated separately)."""
+{_summary_rules(section_id)}"""
 
 
 def build_critical_considerations_instruction(
@@ -214,10 +254,6 @@ def build_critical_considerations_instruction(
 ) -> str:
     qa_block = format_section_answers_block(records)
     anchor_block = anchors.prompt_block()
-    focus = SECTION_CONSIDERATION_FOCUS.get(
-        section_id,
-        "Risks, compliance, and actions tied to this section's answers",
-    )
 
     return f"""Write Critical Considerations for the "{section_name}" section.
 
@@ -226,22 +262,7 @@ def build_critical_considerations_instruction(
 SECTION ANSWERS:
 {qa_block}
 
-Section focus lenses (choose 2-3 distinct topics):
-{focus}
-
-Return JSON only:
-{{
-  "considerations": [
-    {{"topic": "2-5 word topic label", "text": "1-2 sentences of actionable advice"}}
-  ]
-}}
-
-Rules for each consideration:
-1. "topic" is a short label (2-5 words) — never copy a sentence from the user's answers.
-2. "text" must cite at least one grounding anchor (business name, metric, industry detail, or section fact).
-3. Advice must be specific to this founder's industry and section answers — not interchangeable template text.
-4. For compliance topics, name the regulation type relevant to their industry (not "stay informed about regulations").
-5. Provide exactly 2-3 items."""
+{_considerations_rules(section_id)}"""
 
 
 def _parse_json_object(raw: str) -> dict[str, Any]:
@@ -474,18 +495,7 @@ async def generate_section_summary_text(
     records = collect_section_answer_records(history, section_id=section_id)
     anchors = build_grounding_anchors(venture, records)
 
-    summary_text, insights = await _generate_summary_and_insights(
-        openai_client,
-        history=history,
-        section_id=section_id,
-        section_name=section_name,
-        user_turn=user_turn,
-        angel_system_prompt=angel_system_prompt,
-        anchors=anchors,
-        records=records,
-    )
-
-    if not summary_text or _validate_insights(insights, anchors):
+    async def _summary_and_insights() -> tuple[str, list[str]]:
         summary_text, insights = await _generate_summary_and_insights(
             openai_client,
             history=history,
@@ -495,26 +505,44 @@ async def generate_section_summary_text(
             angel_system_prompt=angel_system_prompt,
             anchors=anchors,
             records=records,
-            retry_hint=_build_retry_hint(anchors, block="summary and insights"),
         )
+        if not summary_text or _validate_insights(insights, anchors):
+            summary_text, insights = await _generate_summary_and_insights(
+                openai_client,
+                history=history,
+                section_id=section_id,
+                section_name=section_name,
+                user_turn=user_turn,
+                angel_system_prompt=angel_system_prompt,
+                anchors=anchors,
+                records=records,
+                retry_hint=_build_retry_hint(anchors, block="summary and insights"),
+            )
+        return summary_text, insights
 
-    considerations = await _generate_critical_considerations(
-        openai_client,
-        section_id=section_id,
-        section_name=section_name,
-        records=records,
-        anchors=anchors,
-    )
-
-    if _validate_considerations(considerations, anchors, records):
+    async def _considerations() -> list[dict[str, str]]:
         considerations = await _generate_critical_considerations(
             openai_client,
             section_id=section_id,
             section_name=section_name,
             records=records,
             anchors=anchors,
-            retry_hint=_build_retry_hint(anchors, block="Critical Considerations"),
         )
+        if _validate_considerations(considerations, anchors, records):
+            considerations = await _generate_critical_considerations(
+                openai_client,
+                section_id=section_id,
+                section_name=section_name,
+                records=records,
+                anchors=anchors,
+                retry_hint=_build_retry_hint(anchors, block="Critical Considerations"),
+            )
+        return considerations
+
+    # The two blocks share only the grounding anchors, so their round-trips overlap.
+    (summary_text, insights), considerations = await asyncio.gather(
+        _summary_and_insights(), _considerations()
+    )
 
     reply_content = assemble_section_summary(
         section_name=section_name,
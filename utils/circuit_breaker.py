@@ -0,0 +1,48 @@
+"""Per-worker circuit breaker for outbound model calls.
+
+After ``fail_max`` consecutive failures the breaker opens and callers should
+skip the call and use their fallback until ``reset_timeout`` seconds pass; the
+next call after that is let through as a single trial (half-open) while every
+other caller keeps getting the fallback. A success closes the breaker, a failure
+reopens it. A trial that never reports back (e.g. a cancelled request) expires
+after another ``reset_timeout`` so the breaker cannot stay half-open forever.
+"""
+
+import threading
+import time
+
+
+class CircuitBreaker:
+    def __init__(self, fail_max: int, reset_timeout: float):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._trial_started_at = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """True when a call may go out (closed, or the one trial call when half-open)."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at < self.reset_timeout:
+                return False
+            if self._trial_started_at is not None and now - self._trial_started_at < self.reset_timeout:
+                return False
+            self._trial_started_at = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_started_at is not None or self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+                self._trial_started_at = None